@@ -0,0 +1,74 @@
+"""Memory footprint of cached revocation registry entries.
+
+AnonCreds registry caches all resolved entries of revocation registry (messages with consensus timestamps).
+Builds the cache for a registry with given number of entries, like it's kept in memory after resolution
+(messages parsed from HCS, with memoized encoding), and reports allocated memory.
+
+Usage:
+    python -m benchmarks.bench_cached_messages_memory [--entries 100000]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from did_sdk_py.anoncreds.models import HcsRevRegEntryMessage
+from did_sdk_py.anoncreds.models.revocation import RevRegEntryValue
+from did_sdk_py.hcs import HcsMessageWithResponseMetadata
+from did_sdk_py.utils.timestamp import Timestamp
+
+
+def _random_accumulator() -> str:
+    return "21 " + " ".join(f"{random.getrandbits(256):064X}" for _ in range(3))
+
+
+def _build_entry_payloads(count: int) -> list[bytes]:
+    accumulators = [_random_accumulator() for _ in range(count + 1)]
+    return [
+        HcsRevRegEntryMessage(
+            value=RevRegEntryValue(prev_accum=accumulators[index], accum=accumulators[index + 1], revoked=[index])
+        ).to_json_bytes()
+        for index in range(count)
+    ]
+
+
+def _build_cache(payloads: list[bytes]) -> list[HcsMessageWithResponseMetadata]:
+    return [
+        HcsMessageWithResponseMetadata(
+            # Messages are parsed from raw HCS message contents, like in topic listener
+            message=HcsRevRegEntryMessage.from_json(payload),
+            consensus_timestamp=Timestamp(1700000000 + index, random.randint(0, 999999999)),
+            sequence_number=index + 1,
+        )
+        for index, payload in enumerate(payloads)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    payloads = _build_entry_payloads(args.entries)
+
+    gc.collect()
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+
+    cache = _build_cache(payloads)
+
+    gc.collect()
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total_bytes = end_size - start_size
+    print(
+        f"{len(cache)} cached entries: {total_bytes / 1024 / 1024:.1f} MiB "
+        f"({total_bytes / len(cache):.0f} bytes per entry, incl. parsed value and original message content)"
+    )
+
+
+if __name__ == "__main__":
+    main()
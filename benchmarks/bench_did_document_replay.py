@@ -0,0 +1,118 @@
+"""DID document replay with large numbers of verification methods and relationships.
+
+Replays DID topic messages that add given number of verification methods, each registered in all verification
+relationship types, then revokes every second method and every second relationship. Reports replay time and time to
+build JSON payload, which should grow linearly with the number of keys.
+
+Usage:
+    python -m benchmarks.bench_did_document_replay [--keys 1000 5000 10000] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+from hedera import PrivateKey
+
+from did_sdk_py.did.did_document import DidDocument
+from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
+from did_sdk_py.did.hcs.events.verification_method.hcs_did_revoke_verification_method_event import (
+    HcsDidRevokeVerificationMethodEvent,
+)
+from did_sdk_py.did.hcs.events.verification_relationship.hcs_did_revoke_verification_relationship_event import (
+    HcsDidRevokeVerificationRelationshipEvent,
+)
+from did_sdk_py.did.hcs.events.verification_relationship.hcs_did_update_verification_relationship_event import (
+    HcsDidUpdateVerificationRelationshipEvent,
+)
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage
+from did_sdk_py.did.utils import build_identifier
+from did_sdk_py.utils.encoding import multibase_encode
+from did_sdk_py.utils.keys import get_key_type
+
+TOPIC_ID = "0.0.29613327"
+
+RELATIONSHIP_TYPES = ("authentication", "assertionMethod", "keyAgreement", "capabilityInvocation")
+
+
+def _build_messages(keys_count: int) -> tuple[str, list[HcsDidMessage]]:
+    private_key = PrivateKey.generateED25519()
+    public_key = private_key.getPublicKey()
+    key_type = get_key_type(private_key)
+    identifier = build_identifier("testnet", multibase_encode(bytes(public_key.toBytes()), "base58btc"), TOPIC_ID)
+
+    messages = [
+        HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            identifier,
+            HcsDidUpdateDidOwnerEvent(f"{identifier}#did-root-key", identifier, public_key, key_type),
+        )
+    ]
+
+    # The same public key is reused for all methods, key generation is not the subject of benchmark
+    for index in range(keys_count):
+        messages.extend(
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                identifier,
+                HcsDidUpdateVerificationRelationshipEvent(
+                    f"{identifier}#key-{index}", public_key, identifier, relationship_type, key_type
+                ),
+            )
+            for relationship_type in RELATIONSHIP_TYPES
+        )
+
+    for index in range(0, keys_count, 2):
+        messages.append(
+            HcsDidMessage(
+                DidDocumentOperation.REVOKE,
+                identifier,
+                HcsDidRevokeVerificationMethodEvent(f"{identifier}#key-{index}"),
+            )
+        )
+        messages.append(
+            HcsDidMessage(
+                DidDocumentOperation.REVOKE,
+                identifier,
+                HcsDidRevokeVerificationRelationshipEvent(f"{identifier}#key-{index + 1}", "keyAgreement"),
+            )
+        )
+
+    return identifier, messages
+
+
+async def _replay(identifier: str, messages: list[HcsDidMessage]) -> tuple[float, float]:
+    document = DidDocument(identifier)
+
+    start = time.perf_counter()
+    await document.process_messages(messages)
+    replay_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    document.get_json_payload()
+    json_time = time.perf_counter() - start
+
+    return replay_time, json_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    for keys_count in args.keys:
+        identifier, messages = _build_messages(keys_count)
+        results = [asyncio.run(_replay(identifier, messages)) for _ in range(args.rounds)]
+
+        replay_time = min(replay for replay, _ in results)
+        json_time = min(json_ for _, json_ in results)
+        print(
+            f"{keys_count} keys ({len(messages)} messages): replay {replay_time * 1000:.1f} ms "
+            f"({len(messages) / replay_time:.0f} msg/s), JSON payload {json_time * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Throughput of bulk DID registration.
+
+Hedera network is replaced with a stand-in: topic creation and message submission take a fixed latency (receipt wait)
+and fail with a given probability. Messages are still built and signed, like in real registration.
+Compares sequential 'HederaDid.register' calls with 'HederaDid.register_many'.
+
+Usage:
+    python -m benchmarks.bench_did_registration [--dids 200] [--latency 0.05] [--failure-rate 0.02] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import random
+import time
+from itertools import count
+
+from hedera import PrivateKey
+
+from did_sdk_py import HederaClientProvider
+from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs import HcsDidMessageEnvelope
+from did_sdk_py.did.hcs.events import HcsDidEvent
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage
+from did_sdk_py.did.hedera_did import HederaDid
+from did_sdk_py.hcs import HcsTopicOptions
+
+
+class StandInNetwork:
+    def __init__(self, latency: float, failure_rate: float):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.topic_ids = count(1000)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def execute(self):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if random.random() < self.failure_rate:
+                raise Exception("BUSY")
+        finally:
+            self.in_flight -= 1
+
+
+class StandInTopicService:
+    def __init__(self, network: StandInNetwork):
+        self.network = network
+
+    async def create_topic(self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]) -> str:
+        await self.network.execute()
+        return f"0.0.{next(self.network.topic_ids)}"
+
+
+class StandInHederaDid(HederaDid):
+    network: StandInNetwork
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hcs_topic_service = StandInTopicService(self.network)  # pyright: ignore [reportAttributeAccessIssue]
+
+    async def _submit_transaction(self, operation: DidDocumentOperation, event: HcsDidEvent):
+        envelope = HcsDidMessageEnvelope(HcsDidMessage(operation, str(self.identifier), event))
+        envelope.sign(self._private_key)
+        await self.network.execute()
+
+
+async def _register_sequentially(client_provider: HederaClientProvider, private_keys_der: list[str]) -> int:
+    registered = 0
+    for private_key_der in private_keys_der:
+        with contextlib.suppress(Exception):
+            await StandInHederaDid(client_provider, private_key_der=private_key_der).register()
+            registered += 1
+    return registered
+
+
+async def _register_in_bulk(
+    client_provider: HederaClientProvider, private_keys_der: list[str], concurrency: int
+) -> int:
+    results = await StandInHederaDid.register_many(
+        client_provider, private_keys_der, concurrency=concurrency, retry_delay_seconds=0.01
+    )
+    return sum(result.is_registered for result in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dids", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    client_provider = HederaClientProvider("testnet")
+    private_keys_der = [PrivateKey.generateED25519().toStringDER() for _ in range(args.dids)]
+
+    for name, run in (
+        ("sequential register", lambda: _register_sequentially(client_provider, private_keys_der)),
+        (
+            f"register_many (concurrency {args.concurrency})",
+            lambda: _register_in_bulk(client_provider, private_keys_der, args.concurrency),
+        ),
+    ):
+        StandInHederaDid.network = StandInNetwork(args.latency, args.failure_rate)
+
+        start = time.perf_counter()
+        registered = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{name}: {registered}/{args.dids} registered in {elapsed:.2f} s "
+            f"({registered / elapsed:.0f} DIDs/s, peak in-flight {StandInHederaDid.network.peak_in_flight})"
+        )
+
+
+if __name__ == "__main__":
+    main()
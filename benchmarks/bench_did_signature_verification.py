@@ -0,0 +1,111 @@
+"""Signature verification throughput on DID topic replay.
+
+Compares naive per-message verification through Hedera SDK (JVM) with batched verification off the event loop, using
+Hedera SDK and native Python (if "cryptography" is installed) verifiers.
+
+Usage:
+    python -m benchmarks.bench_did_signature_verification [--messages 10000] [--rounds 3] [--key-type ed25519]
+"""
+
+import argparse
+import asyncio
+import time
+
+from hedera import PrivateKey
+
+from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
+from did_sdk_py.did.hcs.events.service.hcs_did_update_service_event import HcsDidUpdateServiceEvent
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
+from did_sdk_py.did.hcs.hcs_did_message_verifier import filter_verified_envelopes
+from did_sdk_py.did.utils import build_identifier
+from did_sdk_py.utils.encoding import b64_to_bytes, multibase_encode
+from did_sdk_py.utils.keys import get_key_type
+from did_sdk_py.utils.signatures import SignatureVerificationTask, get_signature_verifier, verify_signatures_async
+
+TOPIC_ID = "0.0.29613327"
+
+
+def _build_envelopes(private_key: PrivateKey, count: int) -> tuple[str, list[HcsDidMessageEnvelope]]:
+    public_key = private_key.getPublicKey()
+    identifier = build_identifier("testnet", multibase_encode(bytes(public_key.toBytes()), "base58btc"), TOPIC_ID)
+
+    messages = [
+        HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            identifier,
+            HcsDidUpdateDidOwnerEvent(f"{identifier}#did-root-key", identifier, public_key, get_key_type(private_key)),
+        )
+    ]
+    messages.extend(
+        HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            identifier,
+            HcsDidUpdateServiceEvent(f"{identifier}#service-{index}", "LinkedDomains", f"https://example.com/{index}"),
+        )
+        for index in range(1, count)
+    )
+
+    envelopes = []
+    for message in messages:
+        envelope = HcsDidMessageEnvelope(message)
+        envelope.sign(private_key)
+        envelopes.append(HcsDidMessageEnvelope.from_json(envelope.to_json()))
+
+    return identifier, envelopes
+
+
+def _verify_naive(private_key: PrivateKey, envelopes: list[HcsDidMessageEnvelope]):
+    # Single JVM call per message on the calling thread
+    public_key = private_key.getPublicKey()
+    for envelope in envelopes:
+        public_key.verify(envelope.message.to_json_bytes(), b64_to_bytes(envelope.signature))
+
+
+async def _verify_batched(private_key: PrivateKey, envelopes: list[HcsDidMessageEnvelope], prefer_native: bool):
+    verifier = get_signature_verifier(private_key.getPublicKey(), prefer_native=prefer_native)
+    tasks = [
+        SignatureVerificationTask(verifier, [envelope.message.to_json_bytes()], b64_to_bytes(envelope.signature))
+        for envelope in envelopes
+    ]
+    results = await verify_signatures_async(tasks)
+
+    assert all(results)
+
+
+def _best_of(rounds: int, run) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--key-type", choices=["ed25519", "ecdsa"], default="ed25519")
+    args = parser.parse_args()
+
+    private_key = PrivateKey.generateED25519() if args.key_type == "ed25519" else PrivateKey.generateECDSA()
+    identifier, envelopes = _build_envelopes(private_key, args.messages)
+
+    cases = {
+        "naive (JVM, sequential)": lambda: _verify_naive(private_key, envelopes),
+        "batched (JVM)": lambda: asyncio.run(_verify_batched(private_key, envelopes, prefer_native=False)),
+        "batched (native)": lambda: asyncio.run(_verify_batched(private_key, envelopes, prefer_native=True)),
+        "filter_verified_envelopes": lambda: asyncio.run(filter_verified_envelopes(identifier, envelopes)),
+    }
+
+    baseline: float | None = None
+    for name, run in cases.items():
+        best = _best_of(args.rounds, run)
+        baseline = baseline or best
+        print(f"{name:>26}: {best * 1000:8.1f} ms, {args.messages / best:10.0f} msg/s, x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Thread count and latency of concurrent HCS message resolutions.
+
+Mirror node subscriptions are replaced with a stand-in listener: a single producer thread delivers messages to all
+resolvers (like the gRPC thread pool does), then resolvers complete by idle timeout. Legacy mode reproduces previous
+idle timeout implementation based on 'threading.Timer'.
+
+Usage:
+    python -m benchmarks.bench_hcs_message_resolver [--resolutions 1000] [--messages 20] [--timeout 0.5] [--legacy]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from asyncio import Future
+from collections.abc import Callable
+
+from did_sdk_py.hcs import HcsFileChunkMessage, HcsMessageResolver
+
+TOPIC_ID = "0.0.2"
+
+
+class StandInTopicListener:
+    def __init__(self):
+        self.receiver: Callable | None = None
+        self.unsubscribed = False
+
+    def set_start_time(self, *_):
+        return self
+
+    def set_end_time(self, *_):
+        return self
+
+    def set_limit(self, *_):
+        return self
+
+    def set_completion_handler(self, *_):
+        return self
+
+    def set_error_handler(self, *_):
+        return self
+
+    def subscribe(self, _, receiver: Callable):
+        self.receiver = receiver
+
+    def unsubscribe(self):
+        self.unsubscribed = True
+
+    def flush(self):
+        pass
+
+
+class LegacyHcsMessageResolver(HcsMessageResolver):
+    """Idle timeout based on 'threading.Timer', rescheduled with a new thread on every check."""
+
+    def _wait_or_complete(self, future: Future):
+        if future.done():
+            return
+
+        time_diff = time.monotonic() - self._last_message_arrival_time
+
+        if time_diff <= self._message_waiting_timeout:
+            timer = threading.Timer(self._message_waiting_timeout - time_diff, self._wait_or_complete, [future])
+            timer.start()
+        else:
+            self._complete(future)
+
+
+def _produce(listeners: list[StandInTopicListener], messages: int, interval: float):
+    for index in range(messages):
+        for listener in listeners:
+            if listener.receiver and not listener.unsubscribed:
+                listener.receiver(HcsFileChunkMessage(index, f"chunk-{index}-{id(listener)}"))
+        time.sleep(interval)
+
+
+async def _run(resolutions: int, messages: int, timeout: float, legacy: bool) -> tuple[float, float, int]:
+    resolver_class = LegacyHcsMessageResolver if legacy else HcsMessageResolver
+    listeners = [StandInTopicListener() for _ in range(resolutions)]
+    resolvers = []
+
+    for listener in listeners:
+        resolver = resolver_class(TOPIC_ID, HcsFileChunkMessage, timeout_seconds=timeout)
+        resolver._topic_listener = listener  # pyright: ignore [reportAttributeAccessIssue]
+        resolvers.append(resolver)
+
+    peak_threads = threading.active_count()
+    sampling = True
+
+    async def sample_threads():
+        nonlocal peak_threads
+        while sampling:
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.005)
+
+    sampler = asyncio.create_task(sample_threads())
+    producer = threading.Thread(target=_produce, args=(listeners, messages, timeout / 4), daemon=True)
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(resolver.execute(None)) for resolver in resolvers]  # pyright: ignore [reportArgumentType]
+
+    # Let all resolutions subscribe before messages are produced
+    await asyncio.sleep(0)
+    producer.start()
+
+    latencies = []
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        assert len(result) == messages
+        latencies.append(time.perf_counter() - start)
+
+    sampling = False
+    await sampler
+
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1], peak_threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resolutions", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    p50, p100, peak_threads = asyncio.run(_run(args.resolutions, args.messages, args.timeout, args.legacy))
+    mode = "threading.Timer" if args.legacy else "event loop timers"
+    print(f"{mode}: p50 {p50 * 1000:.0f} ms, max {p100 * 1000:.0f} ms, peak threads {peak_threads}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Throughput of DID and AnonCreds identifier parsing.
+
+Parses a realistic mix of identifiers: DIDs of a limited set of publishers seen over and over (like during DID
+resolution and AnonCreds objects resolution), event IDs and a share of invalid identifiers.
+Compares full (uncached) parser with memoized regex-based parser.
+
+Usage:
+    python -m benchmarks.bench_identifier_parsing [--operations 200000] [--dids 1000] [--invalid-share 0.05]
+"""
+
+import argparse
+import contextlib
+import random
+import string
+import time
+from collections.abc import Callable
+
+from did_sdk_py.anoncreds.utils import AnonCredsObjectType, build_anoncreds_identifier, parse_anoncreds_identifier
+from did_sdk_py.did.utils import _parse_identifier, build_identifier, is_key_event_id_valid, parse_identifier
+
+INVALID_IDENTIFIERS = [
+    "did:hedera:unknownnet:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak_0.0.1",
+    "did:key:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak_0.0.1",
+    "did:hedera:testnet:tooShort_0.0.1",
+    "did:hedera:testnet:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak",
+    "invalid",
+]
+
+
+def _random_did() -> str:
+    public_key = "z" + "".join(random.choices(string.ascii_letters + string.digits, k=44))
+    return build_identifier("testnet", public_key, f"0.0.{random.randint(1000, 9999999)}")
+
+
+def _run(name: str, operations: list[Callable[[], object]]):
+    start = time.perf_counter()
+    for operation in operations:
+        with contextlib.suppress(Exception):
+            operation()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name}: {len(operations) / elapsed:,.0f} ops/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--dids", type=int, default=1000)
+    parser.add_argument("--invalid-share", type=float, default=0.05)
+    args = parser.parse_args()
+
+    random.seed(0)
+
+    dids = [_random_did() for _ in range(args.dids)]
+    identifiers = [
+        random.choice(INVALID_IDENTIFIERS) if random.random() < args.invalid_share else random.choice(dids)
+        for _ in range(args.operations)
+    ]
+    anoncreds_identifiers = [
+        build_anoncreds_identifier(identifier, "0.0.5000", AnonCredsObjectType.SCHEMA) for identifier in identifiers
+    ]
+    event_ids = [f"{identifier}#key-{random.randint(1, 10)}" for identifier in identifiers]
+
+    _run("full parser", [lambda identifier=identifier: _parse_identifier(identifier) for identifier in identifiers])
+    _run("memoized parser", [lambda identifier=identifier: parse_identifier(identifier) for identifier in identifiers])
+    _run(
+        "memoized parser (AnonCreds IDs)",
+        [lambda identifier=identifier: parse_anoncreds_identifier(identifier) for identifier in anoncreds_identifiers],
+    )
+    _run(
+        "memoized parser (event IDs)",
+        [lambda event_id=event_id: is_key_event_id_valid(event_id) for event_id in event_ids],
+    )
+
+    print(f"DID cache: {parse_identifier.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Import time of SDK entry points.
+
+Every import is measured in a fresh interpreter, so JVM startup (triggered by Hedera SDK import) is included where
+it happens. Compares lightweight entry points (package import, identifier parsing, AnonCreds models) with API that
+requires Hedera SDK.
+
+Usage:
+    python -m benchmarks.bench_import_time [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+IMPORTS = {
+    "import did_sdk_py": "import did_sdk_py",
+    "identifier parsing": "from did_sdk_py.did.utils import parse_identifier",
+    "AnonCreds models": "from did_sdk_py.anoncreds.models import AnonCredsSchema, AnonCredsRevRegEntry",
+    "HederaDidResolver (starts JVM)": "from did_sdk_py import HederaDidResolver",
+    "warm_up (starts JVM)": "import did_sdk_py; did_sdk_py.warm_up(wait=True)",
+}
+
+MEASURE_CODE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, "hedera" in sys.modules)
+"""
+
+
+def _measure(statement: str) -> tuple[float, bool]:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE.format(statement=statement)], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[-2]), output[-1] == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, statement in IMPORTS.items():
+        results = [_measure(statement) for _ in range(args.runs)]
+        median_ms = statistics.median(elapsed for elapsed, _ in results) * 1000
+        print(f"{name}: {median_ms:.1f} ms (Hedera SDK imported: {results[0][1]})")
+
+
+if __name__ == "__main__":
+    main()
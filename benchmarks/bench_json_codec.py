@@ -0,0 +1,86 @@
+"""Parsing throughput of available JSON backends on DID topic replay payloads.
+
+Usage:
+    python -m benchmarks.bench_json_codec [--messages 10000] [--rounds 5]
+"""
+
+import argparse
+import time
+
+from did_sdk_py.utils.encoding import b64_to_bytes, str_to_b64
+from did_sdk_py.utils.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    json_dumps,
+)
+
+DID = "did:hedera:testnet:z6MkgUv5CvjRP6AsvEYqSRN7djB6p4zK9bcMQ93g5yK6Td7N_0.0.29613327"
+
+
+def _build_topic_messages(count: int) -> list[bytes]:
+    messages = []
+
+    for index in range(count):
+        event = {
+            "Service": {
+                "id": f"{DID}#service-{index}",
+                "type": "LinkedDomains",
+                "serviceEndpoint": f"https://example.com/vcs/{index}",
+            }
+        }
+        message = {
+            "timestamp": 1700000000.0 + index,
+            "operation": "create",
+            "did": DID,
+            "event": str_to_b64(json_dumps(event)),
+        }
+        envelope = {"message": message, "signature": str_to_b64("s" * 64)}
+        messages.append(json_dumps(envelope).encode())
+
+    return messages
+
+
+def _replay(codec: JsonCodec, messages: list[bytes]):
+    # Mirrors the work done per mirror response: envelope parsing followed by event parsing
+    for contents in messages:
+        envelope = codec.loads(contents)
+        codec.loads(b64_to_bytes(envelope["message"]["event"]))
+
+
+def _available_codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+
+    for codec_class in (OrjsonCodec, MsgspecJsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"'{codec_class.name}' backend is not installed, skipping")
+
+    return codecs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = _build_topic_messages(args.messages)
+    baseline: float | None = None
+
+    for codec in _available_codecs():
+        best = float("inf")
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            _replay(codec, messages)
+            best = min(best, time.perf_counter() - start)
+
+        baseline = baseline or best
+        throughput = args.messages / best
+        print(f"{codec.name:>8}: {best * 1000:8.1f} ms, {throughput:10.0f} msg/s, x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Size reduction of HCS payloads compressed with trained zstd dictionaries.
+
+Dictionaries are trained on synthetic AnonCreds schemas and revocation registry entries and evaluated on a held-out
+set of payloads. Reports average HCS message size (and HCS-1 chunk count for schemas) without and with dictionary,
+and per-call cost of reused (thread-local) zstd contexts compared to creating a new context for every payload.
+
+Usage:
+    python -m benchmarks.bench_zstd_dictionaries [--samples 2000] [--dict-size 16384]
+"""
+
+import argparse
+import random
+import string
+import time
+from collections.abc import Callable
+
+from zstandard import ZstdCompressor
+
+from did_sdk_py.anoncreds.models import AnonCredsSchema
+from did_sdk_py.anoncreds.models.revocation import AnonCredsRevRegEntry, RevRegEntryValue
+from did_sdk_py.hcs.hcs_file import get_file_chunk_messages
+from did_sdk_py.utils.compression import (
+    compress,
+    register_compression_dictionary,
+    set_compression_dictionary,
+    train_compression_dictionary,
+)
+from did_sdk_py.utils.json_codec import json_dumps
+
+ATTRIBUTE_NAMES = ["first_name", "last_name", "date_of_birth", "address", "degree", "graduation_date", "gpa", "email"]
+
+
+def _random_word(length: int) -> str:
+    return "".join(random.choices(string.ascii_lowercase, k=length))
+
+
+def _random_accumulator() -> str:
+    return " ".join(f"{random.getrandbits(256):064X}" for _ in range(3))
+
+
+def _build_schema() -> bytes:
+    schema = AnonCredsSchema(
+        name=f"{_random_word(8)}-credential",
+        issuer_id=f"did:hedera:testnet:z{_random_word(44)}_0.0.{random.randint(1000, 9999999)}",
+        attr_names=random.sample(ATTRIBUTE_NAMES, k=random.randint(3, len(ATTRIBUTE_NAMES))),
+        version=f"{random.randint(1, 3)}.{random.randint(0, 9)}",
+    )
+    return json_dumps(schema.get_json_payload()).encode()
+
+
+def _build_rev_reg_entry() -> AnonCredsRevRegEntry:
+    return AnonCredsRevRegEntry(
+        value=RevRegEntryValue(
+            prev_accum=f"21 {_random_accumulator()}",
+            accum=f"21 {_random_accumulator()}",
+            revoked=sorted(random.sample(range(1000), k=random.randint(1, 5))),
+        )
+    )
+
+
+def _measure(name: str, payloads: list, get_size: Callable[[object], int]) -> float:
+    average_size = sum(get_size(payload) for payload in payloads) / len(payloads)
+    print(f"  {name}: {average_size:.1f} bytes")
+    return average_size
+
+
+def _measure_contexts(payloads: list[bytes]):
+    start = time.perf_counter()
+    for payload in payloads:
+        ZstdCompressor().compress(payload)
+    new_context_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in payloads:
+        compress(payload)
+    reused_context_elapsed = time.perf_counter() - start
+
+    print(
+        f"context per call: {new_context_elapsed / len(payloads) * 1e6:.1f} us/payload, "
+        f"reused context: {reused_context_elapsed / len(payloads) * 1e6:.1f} us/payload"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--dict-size", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    random.seed(0)
+
+    schemas = [_build_schema() for _ in range(args.samples)]
+    entries = [_build_rev_reg_entry() for _ in range(args.samples)]
+    training_size = args.samples // 2
+
+    schema_dict_id = register_compression_dictionary(
+        train_compression_dictionary(schemas[:training_size], args.dict_size, dict_id=40001)
+    )
+    entry_dict_id = register_compression_dictionary(
+        train_compression_dictionary(
+            [json_dumps(entry._get_json_payload_raw()).encode() for entry in entries[:training_size]],
+            args.dict_size,
+            dict_id=40002,
+        )
+    )
+
+    held_out_schemas = schemas[training_size:]
+    held_out_entries = entries[training_size:]
+
+    print(f"Schemas (HCS-1 files), {len(held_out_schemas)} held-out payloads:")
+    for name, dict_id in (("without dictionary", None), ("with dictionary", schema_dict_id)):
+        chunk_messages = [get_file_chunk_messages(schema, dict_id) for schema in held_out_schemas]
+        _measure(name, chunk_messages, lambda messages: sum(len(message.to_json()) for message in messages))
+        print(f"    chunks: {sum(len(messages) for messages in chunk_messages)}")
+
+    print(f"Revocation registry entries, {len(held_out_entries)} held-out payloads:")
+    for name, dict_id in (("without dictionary", None), ("with dictionary", entry_dict_id)):
+        set_compression_dictionary("rev_reg_entry", dict_id)
+        _measure(name, held_out_entries, lambda entry: len(json_dumps(entry.get_json_payload())))
+    set_compression_dictionary("rev_reg_entry", None)
+
+    _measure_contexts(held_out_schemas)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,36 @@
 import logging
 import os
-from typing import get_args
+from typing import TYPE_CHECKING, get_args
 
-from .anoncreds import (
-    AnonCredsCredDef,
-    AnonCredsRevList,
-    AnonCredsRevRegDef,
-    AnonCredsSchema,
-    CredDefValue,
-    CredDefValuePrimary,
-    CredDefValueRevocation,
-    HederaAnonCredsRegistry,
-    RevRegDefValue,
-)
-from .did import DidDocument, DidErrorCode, DidException, HederaDid, HederaDidResolver
-from .hedera_client_provider import HederaClientProvider, NetworkConfig, NetworkName, OperatorConfig
-from .utils.cache import Cache, MemoryCache
+from .utils.lazy_import import lazy_attributes
 from .utils.logger import LogLevel, configure_logger
+from .utils.warm_up import warm_up
+
+if TYPE_CHECKING:
+    from .anoncreds import (
+        AnonCredsCredDef,
+        AnonCredsRevList,
+        AnonCredsRevRegDef,
+        AnonCredsSchema,
+        CredDefValue,
+        CredDefValuePrimary,
+        CredDefValueRevocation,
+        HederaAnonCredsRegistry,
+        RevocationBatcher,
+        RevRegDefValue,
+    )
+    from .did import DidDocument, DidErrorCode, DidException, DidRegistrationResult, HederaDid, HederaDidResolver
+    from .hedera_client_provider import (
+        ClientPoolConfig,
+        HederaClientProvider,
+        NetworkConfig,
+        NetworkName,
+        OperatorConfig,
+    )
+    from .utils.cache import Cache, MemoryCache, NegativeCachePolicy, StaleWhileRevalidatePolicy
+    from .utils.executor import ExecutorConfig, ExecutorMetrics, configure_executor
+    from .utils.prefetch import PrefetchManifest, PrefetchResult, prefetch_manifest
+    from .utils.shared_memory_cache import SharedMemoryCache
 
 LOG_LEVEL = os.environ.get("HEDERA_DID_SDK_LOG_LEVEL", None)
 LOG_FORMAT = os.environ.get("HEDERA_DID_SDK_LOG_FORMAT", None)
@@ -26,13 +40,54 @@ if LOG_LEVEL not in [*get_args(LogLevel), None]:
 
 configure_logger(logging.getLogger(), LOG_LEVEL, LOG_FORMAT)
 
+# SDK API is imported on first use, so that JVM is started only when Hedera SDK is actually needed (see 'warm_up')
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HederaDidResolver": ".did",
+        "HederaDid": ".did",
+        "DidRegistrationResult": ".did",
+        "DidDocument": ".did",
+        "DidException": ".did",
+        "DidErrorCode": ".did",
+        "HederaAnonCredsRegistry": ".anoncreds",
+        "RevocationBatcher": ".anoncreds",
+        "AnonCredsSchema": ".anoncreds",
+        "AnonCredsCredDef": ".anoncreds",
+        "CredDefValue": ".anoncreds",
+        "CredDefValuePrimary": ".anoncreds",
+        "CredDefValueRevocation": ".anoncreds",
+        "AnonCredsRevRegDef": ".anoncreds",
+        "RevRegDefValue": ".anoncreds",
+        "AnonCredsRevList": ".anoncreds",
+        "HederaClientProvider": ".hedera_client_provider",
+        "OperatorConfig": ".hedera_client_provider",
+        "NetworkName": ".hedera_client_provider",
+        "NetworkConfig": ".hedera_client_provider",
+        "ClientPoolConfig": ".hedera_client_provider",
+        "ExecutorConfig": ".utils.executor",
+        "ExecutorMetrics": ".utils.executor",
+        "configure_executor": ".utils.executor",
+        "Cache": ".utils.cache",
+        "MemoryCache": ".utils.cache",
+        "SharedMemoryCache": ".utils.shared_memory_cache",
+        "StaleWhileRevalidatePolicy": ".utils.cache",
+        "NegativeCachePolicy": ".utils.cache",
+        "PrefetchManifest": ".utils.prefetch",
+        "PrefetchResult": ".utils.prefetch",
+        "prefetch_manifest": ".utils.prefetch",
+    },
+)
+
 __all__ = [
     "HederaDidResolver",
     "HederaDid",
+    "DidRegistrationResult",
     "DidDocument",
     "DidException",
     "DidErrorCode",
     "HederaAnonCredsRegistry",
+    "RevocationBatcher",
     "AnonCredsSchema",
     "AnonCredsCredDef",
     "CredDefValue",
@@ -45,6 +100,17 @@ __all__ = [
     "OperatorConfig",
     "NetworkName",
     "NetworkConfig",
+    "ClientPoolConfig",
+    "ExecutorConfig",
+    "ExecutorMetrics",
+    "configure_executor",
     "Cache",
     "MemoryCache",
+    "SharedMemoryCache",
+    "StaleWhileRevalidatePolicy",
+    "NegativeCachePolicy",
+    "PrefetchManifest",
+    "PrefetchResult",
+    "prefetch_manifest",
+    "warm_up",
 ]
@@ -1,21 +1,48 @@
-from .hedera_anoncreds_registry import HederaAnonCredsRegistry
-from .models import (
-    AnonCredsCredDef,
-    AnonCredsRevList,
-    AnonCredsRevRegDef,
-    AnonCredsRevRegEntry,
-    AnonCredsSchema,
-    CredDefValue,
-    CredDefValuePrimary,
-    CredDefValueRevocation,
-    HcsRevRegEntryMessage,
-    RevRegDefHcsMetadata,
-    RevRegDefValue,
-    RevRegDefWithHcsMetadata,
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .hedera_anoncreds_registry import HederaAnonCredsRegistry
+    from .models import (
+        AnonCredsCredDef,
+        AnonCredsRevList,
+        AnonCredsRevRegDef,
+        AnonCredsRevRegEntry,
+        AnonCredsSchema,
+        CredDefValue,
+        CredDefValuePrimary,
+        CredDefValueRevocation,
+        HcsRevRegEntryMessage,
+        RevRegDefHcsMetadata,
+        RevRegDefValue,
+        RevRegDefWithHcsMetadata,
+    )
+    from .revocation_batcher import RevocationBatcher
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HederaAnonCredsRegistry": ".hedera_anoncreds_registry",
+        "RevocationBatcher": ".revocation_batcher",
+        "AnonCredsSchema": ".models",
+        "AnonCredsCredDef": ".models",
+        "CredDefValue": ".models",
+        "CredDefValuePrimary": ".models",
+        "CredDefValueRevocation": ".models",
+        "AnonCredsRevRegDef": ".models",
+        "RevRegDefValue": ".models",
+        "AnonCredsRevRegEntry": ".models",
+        "HcsRevRegEntryMessage": ".models",
+        "RevRegDefHcsMetadata": ".models",
+        "RevRegDefWithHcsMetadata": ".models",
+        "AnonCredsRevList": ".models",
+    },
 )
 
 __all__ = [
     "HederaAnonCredsRegistry",
+    "RevocationBatcher",
     "AnonCredsSchema",
     "AnonCredsCredDef",
     "CredDefValue",
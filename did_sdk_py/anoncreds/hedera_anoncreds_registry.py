@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from collections.abc import Sequence
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
 from itertools import chain
 from typing import cast
 
@@ -10,12 +12,25 @@ from ..hcs import (
     HcsMessageResolver,
     HcsMessageTransaction,
     HcsMessageWithResponseMetadata,
+    HcsReceiptTracker,
+    HcsSubmissionSequencer,
     HcsTopicOptions,
+    HcsTopicPool,
     HcsTopicService,
 )
 from ..hcs.constants import MAX_TRANSACTION_FEE
 from ..hedera_client_provider import HederaClientProvider
-from ..utils.cache import Cache, MemoryCache
+from ..utils.background_refresh import BackgroundRefresher
+from ..utils.cache import (
+    DEFAULT_NEGATIVE_CACHE_POLICY,
+    Cache,
+    MemoryCache,
+    NegativeCachePolicy,
+    NegativeResultCache,
+    StaleWhileRevalidatePolicy,
+    TimestampedRecord,
+)
+from ..utils.prefetch import DEFAULT_PREFETCH_CONCURRENCY, PrefetchProgressCallback, PrefetchResult, run_prefetch
 from ..utils.timestamp import Timestamp
 from .models import (
     AnonCredsCredDef,
@@ -33,6 +48,8 @@ from .types import (
     GetRevListResult,
     GetRevRegDefResult,
     GetSchemaResult,
+    PresentationCredentialIdentifiers,
+    PresentationResolutionResult,
     RegisterCredDefResult,
     RegisterRevListResult,
     RegisterRevRegDefResult,
@@ -45,6 +62,47 @@ from .utils import AnonCredsObjectType, build_anoncreds_identifier, parse_anoncr
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_BATCH_RESOLUTION_CONCURRENCY = 8
+
+
+def _get_topic_id(object_id: str) -> str:
+    try:
+        return parse_anoncreds_identifier(object_id).topic_id
+    except Exception:
+        # Invalid IDs are rejected by resolution methods without network queries
+        return object_id
+
+
+def _create_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    if max_concurrency < 1:
+        raise Exception("Max number of concurrent resolutions must be positive")
+
+    return asyncio.Semaphore(max_concurrency)
+
+
+async def _resolve_in_groups[K: Hashable, R](
+    keys: Sequence[K],
+    get_group: Callable[[K], str],
+    resolve: Callable[[K], Awaitable[R]],
+    semaphore: asyncio.Semaphore,
+) -> dict[K, R]:
+    # Keys of the same group (i.e. the same topic ID) are resolved one by one, so only the first one queries network,
+    # while following ones are served from cache. Different groups are resolved concurrently.
+    keys_by_group: dict[str, list[K]] = {}
+    for key in dict.fromkeys(keys):
+        keys_by_group.setdefault(get_group(key), []).append(key)
+
+    results: dict[K, R] = {}
+
+    async def resolve_group(group_keys: list[K]):
+        async with semaphore:
+            for key in group_keys:
+                results[key] = await resolve(key)
+
+    await asyncio.gather(*(resolve_group(group_keys) for group_keys in keys_by_group.values()))
+
+    return {key: results[key] for key in dict.fromkeys(keys)}
+
 
 class HederaAnonCredsRegistry:
     """Anoncreds objects registry (resolver + registrar) implementation that leverage Hedera HCS as VDR.
@@ -52,16 +110,35 @@ class HederaAnonCredsRegistry:
     Args:
         client_provider: Hedera Client provider
         cache_instance: Custom cache instance. If not provided, in-memory cache is used
+        topic_pool: Pool of pre-created topics. If provided, topics for new objects are taken from pool when available
+        receipt_tracker: If provided, revocation list registrations and updates return once transaction is accepted by
+            network node (with "wait" state and receipt future), while receipts are confirmed in background by tracker.
+            Entries of the same revocation registry are still submitted only after previous entry is confirmed, so
+            they always reach consensus in order
+        stale_while_revalidate: Stale-while-revalidate policy for revocation list lookups at current time. If not
+            provided, lookups wait for new revocation registry entries to be fetched
+        negative_cache: Caching policy for "not found" schema, credential definition and revocation registry definition
+            resolution results. Negative results are not cached if None
     """
 
     def __init__(
         self,
         client_provider: HederaClientProvider,
         cache_instance: Cache[str, object] | None = None,
+        topic_pool: HcsTopicPool | None = None,
+        receipt_tracker: HcsReceiptTracker | None = None,
+        stale_while_revalidate: StaleWhileRevalidatePolicy | None = None,
+        negative_cache: NegativeCachePolicy | None = DEFAULT_NEGATIVE_CACHE_POLICY,
     ):
-        self._client = client_provider.get_client()
-        self._hcs_file_service = HcsFileService(client_provider)
-        self._hcs_topic_service = HcsTopicService(client_provider)
+        self._client_provider = client_provider
+        self._receipt_tracker = receipt_tracker
+        self._entry_submissions = HcsSubmissionSequencer(wait_for_receipts=True)
+        self._stale_while_revalidate = stale_while_revalidate
+        self._background_refresher = BackgroundRefresher()
+        # Topic IDs of HCS files that are not found
+        self._negative_cache = NegativeResultCache[str](negative_cache) if negative_cache else None
+        self._hcs_file_service = HcsFileService(client_provider, topic_pool)
+        self._hcs_topic_service = HcsTopicService(client_provider, topic_pool)
 
         cache_instance = cache_instance or MemoryCache[str, object]()
 
@@ -70,7 +147,10 @@ class HederaAnonCredsRegistry:
         self._rev_reg_def_cache: Cache[str, RevRegDefWithHcsMetadata] = cast(
             Cache[str, RevRegDefWithHcsMetadata], cache_instance
         )
-        self._rev_reg_entries_messages_cache = cast(Cache[str, list[HcsMessageWithResponseMetadata]], cache_instance)
+        # Record timestamp is the time up to which cached revocation registry entries are known to be complete
+        self._rev_reg_entries_messages_cache = cast(
+            Cache[str, TimestampedRecord[list[HcsMessageWithResponseMetadata]]], cache_instance
+        )
 
     async def get_schema(self, schema_id: str) -> GetSchemaResult:
         """Get a schema from the registry.
@@ -101,7 +181,7 @@ class HederaAnonCredsRegistry:
             if cached_schema:
                 schema = cached_schema
             else:
-                schema_payload = await self._hcs_file_service.resolve_file(parsed_identifier.topic_id)
+                schema_payload = await self._resolve_file(schema_topic_id)
                 schema = AnonCredsSchema.from_json(schema_payload.decode()) if schema_payload else None
 
                 if not schema:
@@ -188,7 +268,7 @@ class HederaAnonCredsRegistry:
             if cached_cred_def:
                 cred_def = cached_cred_def
             else:
-                cred_def_payload = await self._hcs_file_service.resolve_file(cred_def_topic_id)
+                cred_def_payload = await self._resolve_file(cred_def_topic_id)
                 cred_def = AnonCredsCredDef.from_json(cred_def_payload.decode()) if cred_def_payload else None
 
                 if not cred_def:
@@ -284,7 +364,7 @@ class HederaAnonCredsRegistry:
             if cached_rev_reg_def_with_metadata:
                 rev_reg_def_with_metadata = cached_rev_reg_def_with_metadata
             else:
-                rev_reg_def_payload = await self._hcs_file_service.resolve_file(rev_reg_def_topic_id)
+                rev_reg_def_payload = await self._resolve_file(rev_reg_def_topic_id)
                 rev_reg_def_with_metadata = (
                     RevRegDefWithHcsMetadata.from_json(rev_reg_def_payload.decode()) if rev_reg_def_payload else None
                 )
@@ -367,6 +447,9 @@ class HederaAnonCredsRegistry:
     async def get_rev_list(self, rev_reg_id: str, timestamp: int) -> GetRevListResult:
         """Get a revocation list from the registry.
 
+        If stale-while-revalidate policy is set, lookups at timestamps after the last entries refresh ("now") are
+        served from cache (within max staleness), while new entries are fetched in background.
+
         Args:
             rev_reg_id: Revocation registry ID
             timestamp: Timestamp to resolve revocation list for
@@ -375,6 +458,7 @@ class HederaAnonCredsRegistry:
             object: Revocation list resolution result
         """
         try:
+            requested_at = time.time()
             rev_reg_def_result = await self.get_rev_reg_def(rev_reg_id)
 
             if not rev_reg_def_result.revocation_registry_definition:
@@ -400,8 +484,9 @@ class HederaAnonCredsRegistry:
                     revocation_list_metadata={},
                 )
 
-            cached_messages = self._rev_reg_entries_messages_cache.get(entries_topic_id)
-            if cached_messages:
+            cached_record = self._rev_reg_entries_messages_cache.get(entries_topic_id)
+            cached_messages = cached_record.data if cached_record else None
+            if cached_record and cached_messages:
                 last_cached_message_timestamp = cached_messages[-1].consensus_timestamp
 
                 if last_cached_message_timestamp.seconds >= timestamp:
@@ -427,23 +512,12 @@ class HederaAnonCredsRegistry:
                         revocation_list_metadata={},
                     )
                 else:
-                    new_messages = await HcsMessageResolver(
-                        topic_id=entries_topic_id,
-                        message_type=HcsRevRegEntryMessage,
-                        timestamp_from=last_cached_message_timestamp,
-                        timestamp_to=Timestamp(seconds=timestamp, nanos=0),
-                        include_response_metadata=True,
-                    ).execute(self._client)
-
-                    # Note: 'chain' function is used instead of lists sum due to significantly better performance on large lists
-                    # See: https://docs.python.org/3/library/itertools.html, https://stackoverflow.com/a/41772165
-                    entries_messages = (
-                        list(chain(cached_messages, cast(list[HcsMessageWithResponseMetadata], new_messages)))
-                        if len(new_messages) > 0
-                        else cached_messages
-                    )
-
-                    self._rev_reg_entries_messages_cache.set(entries_topic_id, entries_messages)
+                    if self._can_return_cached_entries(entries_topic_id, cached_record, timestamp):
+                        entries_messages = cached_messages
+                    else:
+                        entries_messages = await self._fetch_new_entries_messages(
+                            entries_topic_id, cached_messages, timestamp
+                        )
 
                     entries = [cast(AnonCredsRevRegEntry, message.message) for message in entries_messages]
 
@@ -461,7 +535,7 @@ class HederaAnonCredsRegistry:
                 message_type=HcsRevRegEntryMessage,
                 timestamp_to=Timestamp(seconds=timestamp, nanos=0),
                 include_response_metadata=True,
-            ).execute(self._client)
+            ).execute(self._client_provider.get_client())
 
             if len(entries_messages) == 0:
                 # If returned entries list is empty, we need to fetch the first message and check if list is registered
@@ -473,7 +547,7 @@ class HederaAnonCredsRegistry:
                     message_type=HcsRevRegEntryMessage,
                     limit=1,
                     include_response_metadata=True,
-                ).execute(self._client)
+                ).execute(self._client_provider.get_client())
 
                 if len(entries_messages) == 0:
                     return GetRevListResult(
@@ -486,7 +560,9 @@ class HederaAnonCredsRegistry:
                     )
 
             entries_messages = cast(list[HcsMessageWithResponseMetadata], entries_messages)
-            self._rev_reg_entries_messages_cache.set(entries_topic_id, entries_messages)
+            self._rev_reg_entries_messages_cache.set(
+                entries_topic_id, TimestampedRecord(entries_messages, min(float(timestamp), requested_at))
+            )
 
             entries = [cast(AnonCredsRevRegEntry, message.message) for message in entries_messages]
 
@@ -508,6 +584,218 @@ class HederaAnonCredsRegistry:
                 revocation_list_metadata={},
             )
 
+    async def get_schemas(
+        self, schema_ids: Sequence[str], max_concurrency: int = DEFAULT_BATCH_RESOLUTION_CONCURRENCY
+    ) -> dict[str, GetSchemaResult]:
+        """Get multiple schemas from the registry.
+
+        Duplicate IDs are resolved once, cache misses are resolved concurrently.
+
+        Args:
+            schema_ids: Schema IDs to resolve
+            max_concurrency: Max number of concurrent resolutions
+
+        Returns:
+            Schema resolution results by schema ID
+        """
+        return await _resolve_in_groups(schema_ids, _get_topic_id, self.get_schema, _create_semaphore(max_concurrency))
+
+    async def get_cred_defs(
+        self, cred_def_ids: Sequence[str], max_concurrency: int = DEFAULT_BATCH_RESOLUTION_CONCURRENCY
+    ) -> dict[str, GetCredDefResult]:
+        """Get multiple credential definitions from the registry.
+
+        Duplicate IDs are resolved once, cache misses are resolved concurrently.
+
+        Args:
+            cred_def_ids: Credential definition IDs to resolve
+            max_concurrency: Max number of concurrent resolutions
+
+        Returns:
+            Credential definition resolution results by credential definition ID
+        """
+        return await _resolve_in_groups(
+            cred_def_ids, _get_topic_id, self.get_cred_def, _create_semaphore(max_concurrency)
+        )
+
+    async def get_rev_reg_defs(
+        self, rev_reg_def_ids: Sequence[str], max_concurrency: int = DEFAULT_BATCH_RESOLUTION_CONCURRENCY
+    ) -> dict[str, GetRevRegDefResult]:
+        """Get multiple revocation registry definitions from the registry.
+
+        Duplicate IDs are resolved once, cache misses are resolved concurrently.
+
+        Args:
+            rev_reg_def_ids: Revocation registry definition IDs to resolve
+            max_concurrency: Max number of concurrent resolutions
+
+        Returns:
+            Revocation registry definition resolution results by revocation registry definition ID
+        """
+        return await _resolve_in_groups(
+            rev_reg_def_ids, _get_topic_id, self.get_rev_reg_def, _create_semaphore(max_concurrency)
+        )
+
+    async def resolve_for_presentation(
+        self,
+        identifiers: Sequence[PresentationCredentialIdentifiers],
+        max_concurrency: int = DEFAULT_BATCH_RESOLUTION_CONCURRENCY,
+    ) -> PresentationResolutionResult:
+        """Resolve all AnonCreds objects required to verify a presentation.
+
+        Schemas, credential definitions and revocation registry definitions are resolved concurrently (sharing
+        concurrency limit), then revocation lists are resolved for every revocation registry ID and timestamp pair.
+
+        Args:
+            identifiers: Identifiers of credentials in presentation
+            max_concurrency: Max number of concurrent resolutions
+
+        Returns:
+            object: Resolution results by object ID
+        """
+        semaphore = _create_semaphore(max_concurrency)
+
+        schemas, cred_defs, rev_reg_defs = await asyncio.gather(
+            _resolve_in_groups(
+                [identifier.schema_id for identifier in identifiers], _get_topic_id, self.get_schema, semaphore
+            ),
+            _resolve_in_groups(
+                [identifier.cred_def_id for identifier in identifiers], _get_topic_id, self.get_cred_def, semaphore
+            ),
+            _resolve_in_groups(
+                [identifier.rev_reg_id for identifier in identifiers if identifier.rev_reg_id],
+                _get_topic_id,
+                self.get_rev_reg_def,
+                semaphore,
+            ),
+        )
+
+        # Revocation registry definitions are cached at this point, lists of the same registry share entries cache
+        rev_lists = await _resolve_in_groups(
+            [
+                (identifier.rev_reg_id, identifier.timestamp)
+                for identifier in identifiers
+                if identifier.rev_reg_id and identifier.timestamp is not None
+            ],
+            lambda rev_list_key: rev_list_key[0],
+            lambda rev_list_key: self.get_rev_list(*rev_list_key),
+            semaphore,
+        )
+
+        return PresentationResolutionResult(
+            schemas=schemas, cred_defs=cred_defs, rev_reg_defs=rev_reg_defs, rev_lists=rev_lists
+        )
+
+    async def prefetch(
+        self,
+        ids: Sequence[str],
+        max_concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+        on_progress: PrefetchProgressCallback | None = None,
+    ) -> list[PrefetchResult]:
+        """Resolve AnonCreds objects concurrently to load them into registry cache (i.e. on application start).
+
+        Schema and credential definition IDs are resolved as is. For revocation registry IDs, both revocation registry
+        definition and current revocation registry entries are loaded.
+
+        Args:
+            ids: AnonCreds schema, credential definition and revocation registry IDs to prefetch
+            max_concurrency: Max number of concurrent resolutions
+            on_progress: Callback invoked after every prefetched object
+
+        Returns:
+            Prefetch results, failed resolutions are reported with errors
+        """
+        return await run_prefetch(ids, self._prefetch_object, max_concurrency, on_progress)
+
+    async def _prefetch_object(self, object_id: str):
+        object_type = parse_anoncreds_identifier(object_id).object_type
+
+        match object_type:
+            case AnonCredsObjectType.SCHEMA:
+                resolution_metadata = (await self.get_schema(object_id)).resolution_metadata
+            case AnonCredsObjectType.PUBLIC_CRED_DEF:
+                resolution_metadata = (await self.get_cred_def(object_id)).resolution_metadata
+            case AnonCredsObjectType.REV_REG:
+                resolution_metadata = (await self.get_rev_list(object_id, int(time.time()))).resolution_metadata
+            case _:
+                raise Exception(f"AnonCreds object type '{object_type}' cannot be prefetched")
+
+        if resolution_metadata.get("error"):
+            raise Exception(f"{resolution_metadata['error']}: {resolution_metadata.get('message')}")
+
+    async def _resolve_file(self, topic_id: str) -> bytes | None:
+        if self._negative_cache and self._negative_cache.get(topic_id):
+            return None
+
+        payload = await self._hcs_file_service.resolve_file(topic_id)
+
+        if not payload and self._negative_cache:
+            self._negative_cache.set(topic_id, f"HCS file topic '{topic_id}' has no file chunks")
+
+        return payload
+
+    def _can_return_cached_entries(
+        self,
+        entries_topic_id: str,
+        cached_record: TimestampedRecord[list[HcsMessageWithResponseMetadata]],
+        timestamp: int,
+    ) -> bool:
+        if not self._stale_while_revalidate:
+            return False
+
+        # Cached entries are complete up to the last refresh time
+        refresh_time = cached_record.timestamp
+
+        if timestamp <= refresh_time:
+            return True
+
+        refresh_age = time.time() - refresh_time
+        if refresh_age > self._stale_while_revalidate.max_staleness:
+            return False
+
+        if refresh_age > self._stale_while_revalidate.min_refresh_interval:
+            self._background_refresher.refresh(entries_topic_id, lambda: self._refresh_entries(entries_topic_id))
+
+        return True
+
+    async def _refresh_entries(self, entries_topic_id: str):
+        cached_record = self._rev_reg_entries_messages_cache.get(entries_topic_id)
+        if cached_record and cached_record.data:
+            await self._fetch_new_entries_messages(entries_topic_id, cached_record.data)
+
+    async def _fetch_new_entries_messages(
+        self,
+        entries_topic_id: str,
+        cached_messages: list[HcsMessageWithResponseMetadata],
+        timestamp: int | None = None,
+    ) -> list[HcsMessageWithResponseMetadata]:
+        requested_at = time.time()
+
+        new_messages = await HcsMessageResolver(
+            topic_id=entries_topic_id,
+            message_type=HcsRevRegEntryMessage,
+            timestamp_from=cached_messages[-1].consensus_timestamp,
+            timestamp_to=Timestamp(seconds=timestamp, nanos=0) if timestamp is not None else None,
+            include_response_metadata=True,
+        ).execute(self._client_provider.get_client())
+
+        # Note: 'chain' function is used instead of lists sum due to significantly better performance on large lists
+        # See: https://docs.python.org/3/library/itertools.html, https://stackoverflow.com/a/41772165
+        entries_messages = (
+            list(chain(cached_messages, cast(list[HcsMessageWithResponseMetadata], new_messages)))
+            if len(new_messages) > 0
+            else cached_messages
+        )
+
+        self._rev_reg_entries_messages_cache.set(
+            entries_topic_id,
+            TimestampedRecord(
+                entries_messages, min(float(timestamp), requested_at) if timestamp is not None else requested_at
+            ),
+        )
+
+        return entries_messages
+
     async def register_rev_list(self, rev_list: AnonCredsRevList, issuer_key_der: str) -> RegisterRevListResult:
         """Register Revocation list.
 
@@ -606,21 +894,27 @@ class HederaAnonCredsRegistry:
             )
         )
 
+        client = self._client_provider.get_client()
+
         def build_message_submit_transaction(
             message_submit_transaction: TopicMessageSubmitTransaction,
         ) -> Transaction:
             return (
                 message_submit_transaction.setMaxTransactionFee(MAX_TRANSACTION_FEE)
-                .freezeWith(self._client)
+                .freezeWith(client)
                 .sign(PrivateKey.fromString(issuer_key_der))
             )
 
-        await HcsMessageTransaction(entries_topic_id, entry_message, build_message_submit_transaction).execute(
-            self._client
+        transaction = HcsMessageTransaction(entries_topic_id, entry_message, build_message_submit_transaction)
+        receipt = await self._entry_submissions.submit(
+            entries_topic_id, lambda: transaction.execute(client, self._receipt_tracker)
         )
 
         return RegisterRevListResult(
-            revocation_list_state=RevListState(state="finished", revocation_list=rev_list),
+            revocation_list_state=RevListState(
+                state="wait" if self._receipt_tracker else "finished", revocation_list=rev_list
+            ),
             registration_metadata={},
             revocation_list_metadata={},
+            receipt=receipt,
         )
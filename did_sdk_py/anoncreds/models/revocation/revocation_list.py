@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterable, Collection, Iterable
 from dataclasses import dataclass
 
 from ....utils.serializable import Serializable
@@ -5,11 +6,25 @@ from .revocation_registry_definition import AnonCredsRevRegDef
 from .revocation_registry_entry import AnonCredsRevRegEntry
 
 
-def _indexes_to_bit_array(indexes: list[int], size: int) -> list[int]:
+def _indexes_to_bit_array(indexes: Collection[int], size: int) -> list[int]:
     """Turn a sequence of indexes into a full state bit array."""
+    indexes = indexes if isinstance(indexes, set | frozenset) else set(indexes)
     return [1 if index in indexes else 0 for index in range(0, size)]
 
 
+class _RevListState:
+    """Revocation list state accumulated from revocation registry entries."""
+
+    def __init__(self):
+        self.revoked_indexes: set[int] = set()
+        self.accum: str | None = None
+
+    def apply(self, entry: AnonCredsRevRegEntry):
+        if entry.value.revoked:
+            self.revoked_indexes.update(entry.value.revoked)
+        self.accum = entry.value.accum
+
+
 @dataclass
 class AnonCredsRevList(Serializable):
     """Model representing AnonCreds revocation list object.
@@ -31,7 +46,7 @@ class AnonCredsRevList(Serializable):
     @classmethod
     def from_rev_reg_entries(
         cls,
-        entries: list[AnonCredsRevRegEntry],
+        entries: Iterable[AnonCredsRevRegEntry],
         rev_reg_id: str,
         rev_reg_def: AnonCredsRevRegDef,
         timestamp: int | None = None,
@@ -39,25 +54,53 @@ class AnonCredsRevList(Serializable):
         """Build revocation list object from corresponding revocation registry entries.
 
         Args:
-            entries: List of revocation registry entries to build state from
+            entries: Revocation registry entries to build state from
             rev_reg_id: Revocation registry ID
             rev_reg_def: Revocation registry definition object
             timestamp: Requested timestamp to associate revocation list with
         """
-        revoked_indexes = []
+        state = _RevListState()
 
         for entry in entries:
-            if entry.value.revoked:
-                revoked_indexes += entry.value.revoked
+            state.apply(entry)
+
+        return cls._from_state(state, rev_reg_id, rev_reg_def, timestamp)
+
+    @classmethod
+    async def from_rev_reg_entries_stream(
+        cls,
+        entries: AsyncIterable[AnonCredsRevRegEntry],
+        rev_reg_id: str,
+        rev_reg_def: AnonCredsRevRegDef,
+        timestamp: int | None = None,
+    ):
+        """Build revocation list object from revocation registry entries stream, consuming entries incrementally.
 
-        rev_list_bit_array = _indexes_to_bit_array(revoked_indexes, rev_reg_def.value.max_cred_num)
-        accum = entries[-1].value.accum
+        Args:
+            entries: Revocation registry entries stream to build state from
+            rev_reg_id: Revocation registry ID
+            rev_reg_def: Revocation registry definition object
+            timestamp: Requested timestamp to associate revocation list with
+        """
+        state = _RevListState()
+
+        async for entry in entries:
+            state.apply(entry)
+
+        return cls._from_state(state, rev_reg_id, rev_reg_def, timestamp)
+
+    @classmethod
+    def _from_state(
+        cls, state: _RevListState, rev_reg_id: str, rev_reg_def: AnonCredsRevRegDef, timestamp: int | None = None
+    ):
+        if state.accum is None:
+            raise Exception("Cannot build revocation list: revocation registry entries are empty")
 
         return cls(
             issuer_id=rev_reg_def.issuer_id,
             rev_reg_def_id=rev_reg_id,
-            revocation_list=rev_list_bit_array,
-            current_accumulator=accum,
+            revocation_list=_indexes_to_bit_array(state.revoked_indexes, rev_reg_def.value.max_cred_num),
+            current_accumulator=state.accum,
             timestamp=timestamp,
         )
 
@@ -1,16 +1,15 @@
-import json
 from dataclasses import dataclass
 
-from zstandard import ZstdCompressor, ZstdDecompressor
-
 from ....hcs import HcsMessage
+from ....utils.compression import compress, decompress, get_compression_dictionary_id
 from ....utils.encoding import b64_to_bytes, bytes_to_b64
+from ....utils.json_codec import json_dumps, json_loads
 from ....utils.serializable import Serializable
 
 DEFAULT_REV_REG_ENTRY_VERSION = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class RevRegEntryValue(Serializable):
     """Model representing revocation registry entry value.
 
@@ -54,7 +53,7 @@ class RevRegEntryValue(Serializable):
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class AnonCredsRevRegEntry(Serializable):
     """Model representing AnonCreds revocation registry entry.
 
@@ -71,14 +70,14 @@ class AnonCredsRevRegEntry(Serializable):
         match payload:
             case {"payload": compressed_str}:
                 compressed_bytes = b64_to_bytes(compressed_str)
-                entry_params = json.loads(ZstdDecompressor().decompress(compressed_bytes))
+                entry_params = json_loads(decompress(compressed_bytes))
                 return cls._from_json_payload_raw(entry_params)
             case _:
                 raise Exception(f"{cls.__name__} JSON parsing failed: Invalid JSON structure")
 
     def get_json_payload(self):
-        payload_str = json.dumps(self._get_json_payload_raw()).encode()
-        compressed_payload = ZstdCompressor().compress(payload_str)
+        payload_str = json_dumps(self._get_json_payload_raw()).encode()
+        compressed_payload = compress(payload_str, get_compression_dictionary_id("rev_reg_entry"))
         return {"payload": bytes_to_b64(compressed_payload)}
 
     @classmethod
@@ -94,7 +93,12 @@ class AnonCredsRevRegEntry(Serializable):
 
 
 class HcsRevRegEntryMessage(HcsMessage, AnonCredsRevRegEntry):
-    """HCS message class for submitting revocation registry entries."""
+    """HCS message class for submitting revocation registry entries.
+
+    Entries of revocation registries are cached in large numbers, so entry messages use slots.
+    """
+
+    __slots__ = ("_json_bytes", "_json_str", "_payload_hash")
 
     def is_valid(self, topic_id: str | None = None) -> bool:
         return bool(self.value) and bool(self.value.accum)
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from asyncio import Future, Task, TimerHandle
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from .hedera_anoncreds_registry import HederaAnonCredsRegistry
+from .models import AnonCredsRevList
+from .types import RegisterRevListResult, RevListState
+
+DEFAULT_WINDOW_SECONDS = float(1)
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _RevocationRequest:
+    prev_list: AnonCredsRevList
+    curr_list: AnonCredsRevList
+    revoked: Sequence[int]
+    future: Future[RegisterRevListResult]
+
+
+@dataclass
+class _RevocationGroup:
+    rev_reg_def_id: str
+    issuer_key_der: str
+    requests: list[_RevocationRequest] = field(default_factory=list)
+    revoked_count: int = 0
+    flush_timer: TimerHandle | None = None
+    # Batches of the same registry are published one by one to keep accumulator chain in order
+    publish_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class RevocationBatcher:
+    """Coalesces revocation list updates into batched revocation registry entries.
+
+    Updates of the same revocation registry (and issuer key) are collected over a time window and published as a single
+    entry that carries merged revoked indexes, accumulator of the first update's previous list and accumulator of
+    the last update's current list. Batch is published once window elapses or number of revoked indexes reaches
+    max batch size. Every update request gets the result of the batch it was published in.
+
+    Updates are expected to form a chain: previous list of every update is the current list of the previous one.
+    If chain is broken, pending updates are published before the new one is collected.
+
+    Args:
+        registry: AnonCreds registry to publish revocation list updates with
+        window_seconds: Max time to collect updates for a batch
+        max_batch_size: Number of revoked indexes that triggers batch publishing
+    """
+
+    def __init__(
+        self,
+        registry: HederaAnonCredsRegistry,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        if max_batch_size < 1:
+            raise Exception("Revocation batch size must be positive")
+
+        self._registry = registry
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+
+        self._groups: dict[tuple[str, str], _RevocationGroup] = {}
+        self._publish_tasks: set[Task] = set()
+
+    def submit(
+        self, prev_list: AnonCredsRevList, curr_list: AnonCredsRevList, revoked: Sequence[int], issuer_key_der: str
+    ) -> Future[RegisterRevListResult]:
+        """Add revocation list update to batch.
+
+        Args:
+            prev_list: Previous Revocation list object
+            curr_list: Current Revocation list object
+            revoked: Revoked credential indexes
+            issuer_key_der: Issuer private key encoded in DER
+
+        Returns:
+            Future resolved with revocation list update result once batch is published
+        """
+        loop = asyncio.get_running_loop()
+        future: Future[RegisterRevListResult] = loop.create_future()
+
+        if prev_list.rev_reg_def_id != curr_list.rev_reg_def_id:
+            future.set_result(
+                _build_failed_result(
+                    curr_list,
+                    f"Revocation registry ids do not match for previous and current list: "
+                    f"'{prev_list.rev_reg_def_id}' != '{curr_list.rev_reg_def_id}'",
+                )
+            )
+            return future
+
+        group_key = (curr_list.rev_reg_def_id, issuer_key_der)
+        group = self._groups.get(group_key)
+        if not group:
+            group = _RevocationGroup(curr_list.rev_reg_def_id, issuer_key_der)
+            self._groups[group_key] = group
+
+        if group.requests and group.requests[-1].curr_list.current_accumulator != prev_list.current_accumulator:
+            self._flush_group(group)
+
+        group.requests.append(_RevocationRequest(prev_list, curr_list, revoked, future))
+        group.revoked_count += len(revoked)
+
+        if group.revoked_count >= self._max_batch_size:
+            self._flush_group(group)
+        elif not group.flush_timer:
+            group.flush_timer = loop.call_later(self._window_seconds, self._flush_group, group)
+
+        return future
+
+    async def update_rev_list(
+        self, prev_list: AnonCredsRevList, curr_list: AnonCredsRevList, revoked: Sequence[int], issuer_key_der: str
+    ) -> RegisterRevListResult:
+        """Update Revocation list as a part of batch and wait for batch to be published.
+
+        Args:
+            prev_list: Previous Revocation list object
+            curr_list: Current Revocation list object
+            revoked: Revoked credential indexes
+            issuer_key_der: Issuer private key encoded in DER
+
+        Returns: Revocation list update result
+        """
+        return await self.submit(prev_list, curr_list, revoked, issuer_key_der)
+
+    async def flush(self):
+        """Publish all pending updates and wait until published."""
+        for group in self._groups.values():
+            self._flush_group(group)
+
+        while self._publish_tasks:
+            await asyncio.gather(*self._publish_tasks, return_exceptions=True)
+
+    def _flush_group(self, group: _RevocationGroup):
+        if group.flush_timer:
+            group.flush_timer.cancel()
+            group.flush_timer = None
+
+        if not group.requests:
+            return
+
+        requests = group.requests
+        group.requests = []
+        group.revoked_count = 0
+
+        task = asyncio.create_task(self._publish(group, requests))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    async def _publish(self, group: _RevocationGroup, requests: list[_RevocationRequest]):
+        # Indexes are deduplicated, keeping the order of revocations
+        revoked = list(dict.fromkeys(index for request in requests for index in request.revoked))
+
+        async with group.publish_lock:
+            try:
+                result = await self._registry.update_rev_list(
+                    requests[0].prev_list, requests[-1].curr_list, revoked, group.issuer_key_der
+                )
+            except Exception as error:
+                LOGGER.error(f"Error on publishing batch of {len(requests)} revocation list updates: {error!s}")
+                result = _build_failed_result(requests[-1].curr_list, f"unknownError: ${error!s}")
+
+        state = result.revocation_list_state
+
+        for request in requests:
+            if request.future.done():
+                continue
+
+            request.future.set_result(
+                RegisterRevListResult(
+                    revocation_list_state=RevListState(
+                        state=state.state, revocation_list=request.curr_list, reason=state.reason
+                    ),
+                    registration_metadata={**result.registration_metadata, "batch_size": len(requests)},
+                    revocation_list_metadata={**result.revocation_list_metadata},
+                )
+            )
+
+
+def _build_failed_result(rev_list: AnonCredsRevList, reason: str) -> RegisterRevListResult:
+    return RegisterRevListResult(
+        revocation_list_state=RevListState(state="failed", revocation_list=rev_list, reason=reason),
+        registration_metadata={},
+        revocation_list_metadata={},
+    )
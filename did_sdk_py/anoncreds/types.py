@@ -1,8 +1,12 @@
+from asyncio import Future
 from dataclasses import dataclass
-from typing import Literal, TypeAlias
+from typing import TYPE_CHECKING, Literal, TypeAlias
 
 from .models import AnonCredsCredDef, AnonCredsRevList, AnonCredsRevRegDef, AnonCredsSchema
 
+if TYPE_CHECKING:
+    from hedera import TransactionReceipt
+
 ObjectState: TypeAlias = Literal["finished", "failed", "action", "wait"]
 
 
@@ -176,11 +180,13 @@ class RegisterRevListResult:
         revocation_list_state: Revocation list Object state
         registration_metadata: Registration metadata
         revocation_list_metadata: Revocation list object metadata
+        receipt: Future of transaction receipt, if revocation list entry is confirmed in background ("wait" state)
     """
 
     revocation_list_state: RevListState
     registration_metadata: dict
     revocation_list_metadata: dict
+    receipt: "Future[TransactionReceipt] | None" = None
 
 
 @dataclass(frozen=True)
@@ -198,3 +204,37 @@ class GetRevListResult:
     resolution_metadata: dict
     revocation_list_metadata: dict
     revocation_list: AnonCredsRevList | None = None
+
+
+@dataclass(frozen=True)
+class PresentationCredentialIdentifiers:
+    """Identifiers of AnonCreds objects used by a credential in presentation (see presentation "identifiers").
+
+    Attributes:
+        schema_id: Schema ID
+        cred_def_id: Credential definition ID
+        rev_reg_id: Revocation registry ID (for revocable credentials)
+        timestamp: Timestamp of revocation list used for non-revocation proof
+    """
+
+    schema_id: str
+    cred_def_id: str
+    rev_reg_id: str | None = None
+    timestamp: int | None = None
+
+
+@dataclass(frozen=True)
+class PresentationResolutionResult:
+    """Resolution result of AnonCreds objects required for presentation verification.
+
+    Attributes:
+        schemas: Schema resolution results by schema ID
+        cred_defs: Credential definition resolution results by credential definition ID
+        rev_reg_defs: Revocation registry definition resolution results by revocation registry ID
+        rev_lists: Revocation list resolution results by revocation registry ID and timestamp
+    """
+
+    schemas: dict[str, GetSchemaResult]
+    cred_defs: dict[str, GetCredDefResult]
+    rev_reg_defs: dict[str, GetRevRegDefResult]
+    rev_lists: dict[tuple[str, int], GetRevListResult]
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 
-from ..did.utils import parse_identifier
+from ..did.utils import PARSED_IDENTIFIERS_CACHE_SIZE, TOPIC_ID_REGEX, parse_identifier
 from ..utils.validation_result import ValidationResult
 
 ANONCREDS_IDENTIFIER_SEPARATOR = "/"
@@ -17,13 +18,15 @@ class AnonCredsObjectType(StrEnum):
     REV_REG_ENTRY = "REV_REG_ENTRY"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedAnoncredsIdentifier:
     publisher_did: str
     topic_id: str
     object_type: AnonCredsObjectType
 
 
+# Registry parses object identifiers on every resolution, results are memoized (parsing errors are not cached)
+@lru_cache(maxsize=PARSED_IDENTIFIERS_CACHE_SIZE)
 def parse_anoncreds_identifier(identifier: str) -> ParsedAnoncredsIdentifier:
     try:
         issuer_id, object_family, object_family_version, object_family_type, topic_id = identifier.split(
@@ -40,6 +43,10 @@ def parse_anoncreds_identifier(identifier: str) -> ParsedAnoncredsIdentifier:
     if object_family_type not in AnonCredsObjectType:
         raise Exception(f"Invalid AnonCreds object type: {object_family_type}")
 
+    # Malformed topic IDs are rejected here, instead of failing on network query
+    if not TOPIC_ID_REGEX.match(topic_id):
+        raise Exception(f"Identifier contains invalid topic ID: {topic_id}")
+
     try:
         parse_identifier(issuer_id)
     except Exception as issuer_id_error:
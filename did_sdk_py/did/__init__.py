@@ -1,6 +1,23 @@
-from .did_document import DidDocument
-from .did_error import DidErrorCode, DidException
-from .hedera_did import HederaDid
-from .hedera_did_resolver import HederaDidResolver
+from typing import TYPE_CHECKING
 
-__all__ = ["DidDocument", "DidException", "DidErrorCode", "HederaDidResolver", "HederaDid"]
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .did_document import DidDocument
+    from .did_error import DidErrorCode, DidException
+    from .hedera_did import DidRegistrationResult, HederaDid
+    from .hedera_did_resolver import HederaDidResolver
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DidDocument": ".did_document",
+        "DidException": ".did_error",
+        "DidErrorCode": ".did_error",
+        "HederaDidResolver": ".hedera_did_resolver",
+        "HederaDid": ".hedera_did",
+        "DidRegistrationResult": ".hedera_did",
+    },
+)
+
+__all__ = ["DidDocument", "DidException", "DidErrorCode", "HederaDidResolver", "HederaDid", "DidRegistrationResult"]
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import AsyncIterable, Hashable, Iterable
 from typing import cast
 
 from ..utils.ipfs import download_ipfs_document_by_cid
@@ -28,10 +29,12 @@ class DidDocument(Serializable):
         updated: Last update timestamp
         version_id: DID document version ID (equals to last update timestamp)
         deactivated: DID document deactivation status
+        processed_messages: Number of processed HCS DID messages. Unlike version ID, changes on every processed message
+            (HCS DID messages are not guaranteed to have unique timestamps)
         controller: Dictionary representing DID document controller info
         services: DID document services dictionary
         verification_methods: DID document verification methods dictionary
-        verification_methods: DID document verification relationships dictionary
+        verification_relationships: DID document verification relationships dictionary
 
     """
 
@@ -43,45 +46,74 @@ class DidDocument(Serializable):
         self.updated: float | None = None
         self.version_id: str | None = None
         self.deactivated: bool = False
+        self.processed_messages: int = 0
 
         self.controller: dict | None = None
         self.services: dict = {}
         self.verification_methods: dict = {}
 
-        self.verification_relationships: dict = {
-            DidDocumentJsonProperties.AUTHENTICATION.value: [],
-            DidDocumentJsonProperties.ASSERTION_METHOD.value: [],
-            DidDocumentJsonProperties.KEY_AGREEMENT.value: [],
-            DidDocumentJsonProperties.CAPABILITY_INVOCATION.value: [],
-            DidDocumentJsonProperties.CAPABILITY_DELEGATION.value: [],
+        # Relationships of every type are kept as insertion-ordered dictionary of verification method ID to relationship
+        # entry, so events can address relationships without scanning lists
+        self._verification_relationships: dict[str, dict[Hashable, str | dict]] = {
+            DidDocumentJsonProperties.AUTHENTICATION.value: {},
+            DidDocumentJsonProperties.ASSERTION_METHOD.value: {},
+            DidDocumentJsonProperties.KEY_AGREEMENT.value: {},
+            DidDocumentJsonProperties.CAPABILITY_INVOCATION.value: {},
+            DidDocumentJsonProperties.CAPABILITY_DELEGATION.value: {},
         }
 
-    async def process_messages(self, messages: list[HcsDidMessage]):
+        # Reverse index of verification relationships: verification method ID -> relationship types
+        self._relationship_types_by_method_id: dict[str, set[str]] = {}
+
+    @property
+    def verification_relationships(self) -> dict[str, list[str | dict]]:
+        return {
+            relationship_type: list(relationships.values())
+            for relationship_type, relationships in self._verification_relationships.items()
+        }
+
+    async def process_messages(self, messages: Iterable[HcsDidMessage] | AsyncIterable[HcsDidMessage]):
         """
         Process HCS DID messages - apply DID document state changes according to events.
 
         Args:
-            messages: HCS DID messages to process
+            messages: HCS DID messages to process, can be consumed incrementally from async iterable (stream)
 
         """
-        for message in messages:
+        if isinstance(messages, AsyncIterable):
+            async for message in messages:
+                await self._process_message(message)
+        else:
+            for message in messages:
+                await self._process_message(message)
+
+    async def _process_message(self, message: HcsDidMessage):
+        self.processed_messages += 1
+
+        try:
+            # Event target is checked before parsing the event, so skipped events are never parsed
             if not self.controller and message.operation == DidDocumentOperation.CREATE:
-                event_target = message.event.event_target
+                event_target = message.event_target
                 if event_target != HcsDidEventTarget.DID_OWNER and event_target != HcsDidEventTarget.DID_DOCUMENT:
                     LOGGER.warning("DID document is not registered, skipping DID update event...")
-                    continue
-
-            match message.operation:
-                case DidDocumentOperation.CREATE:
-                    await self._process_create_message(message)
-                case DidDocumentOperation.UPDATE:
-                    self._process_update_message(message)
-                case DidDocumentOperation.DELETE:
-                    self._process_delete_message(message)
-                case DidDocumentOperation.REVOKE:
-                    self._process_revoke_message(message)
-                case _:
-                    LOGGER.warning(f"Operation {message.operation} is not supported, skipping DID event...")
+                    return
+
+            message.ensure_event_parsed()
+        except Exception as error:
+            LOGGER.warning(f"Failed to parse HCS DID event: {error!s}, skipping DID event...")
+            return
+
+        match message.operation:
+            case DidDocumentOperation.CREATE:
+                await self._process_create_message(message)
+            case DidDocumentOperation.UPDATE:
+                self._process_update_message(message)
+            case DidDocumentOperation.DELETE:
+                self._process_delete_message(message)
+            case DidDocumentOperation.REVOKE:
+                self._process_revoke_message(message)
+            case _:
+                LOGGER.warning(f"Operation {message.operation} is not supported, skipping DID event...")
 
     @classmethod
     def from_json_payload(cls, payload: dict):
@@ -98,35 +130,32 @@ class DidDocument(Serializable):
                 self.controller.get("controller") or self.controller
             )
 
-        root_object[DidDocumentJsonProperties.VERIFICATION_METHOD.value] = list(self.verification_methods.values())
+        # Controller (DID root key) is listed first in verification methods and default relationships
+        controller_entries = [self.controller] if self.controller else []
+        controller_id_entries = [self.controller.get("id")] if self.controller else []
+
+        root_object[DidDocumentJsonProperties.VERIFICATION_METHOD.value] = [
+            *controller_entries,
+            *self.verification_methods.values(),
+        ]
 
         root_object[DidDocumentJsonProperties.ASSERTION_METHOD.value] = [
-            *self.verification_relationships[DidDocumentJsonProperties.ASSERTION_METHOD.value],
+            *controller_id_entries,
+            *self._verification_relationships[DidDocumentJsonProperties.ASSERTION_METHOD.value].values(),
         ]
 
         root_object[DidDocumentJsonProperties.AUTHENTICATION.value] = [
-            *self.verification_relationships[DidDocumentJsonProperties.AUTHENTICATION.value],
+            *controller_id_entries,
+            *self._verification_relationships[DidDocumentJsonProperties.AUTHENTICATION.value].values(),
         ]
 
-        if self.controller:
-            controller_id = self.controller.get("id")
-
-            root_object[DidDocumentJsonProperties.VERIFICATION_METHOD.value].insert(0, self.controller)
-            root_object[DidDocumentJsonProperties.ASSERTION_METHOD.value].insert(0, controller_id)
-            root_object[DidDocumentJsonProperties.AUTHENTICATION.value].insert(0, controller_id)
-
-        if len(self.verification_relationships[DidDocumentJsonProperties.KEY_AGREEMENT.value]) > 0:
-            root_object[DidDocumentJsonProperties.KEY_AGREEMENT.value] = [
-                *self.verification_relationships[DidDocumentJsonProperties.KEY_AGREEMENT.value],
-            ]
-        if len(self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_INVOCATION.value]) > 0:
-            root_object[DidDocumentJsonProperties.CAPABILITY_INVOCATION.value] = [
-                *self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_INVOCATION.value],
-            ]
-        if len(self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_DELEGATION.value]) > 0:
-            root_object[DidDocumentJsonProperties.CAPABILITY_DELEGATION.value] = [
-                *self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_DELEGATION.value],
-            ]
+        for relationship_type in (
+            DidDocumentJsonProperties.KEY_AGREEMENT.value,
+            DidDocumentJsonProperties.CAPABILITY_INVOCATION.value,
+            DidDocumentJsonProperties.CAPABILITY_DELEGATION.value,
+        ):
+            if len(self._verification_relationships[relationship_type]) > 0:
+                root_object[relationship_type] = list(self._verification_relationships[relationship_type].values())
 
         if len(self.services) > 0:
             root_object[DidDocumentJsonProperties.SERVICE.value] = list(self.services.values())
@@ -154,21 +183,10 @@ class DidDocument(Serializable):
                     for verificationMethod in document.get(DidDocumentJsonProperties.VERIFICATION_METHOD, [])
                 }
 
-                self.verification_relationships[DidDocumentJsonProperties.ASSERTION_METHOD] = document.get(
-                    DidDocumentJsonProperties.ASSERTION_METHOD, []
-                )
-                self.verification_relationships[DidDocumentJsonProperties.AUTHENTICATION] = document.get(
-                    DidDocumentJsonProperties.AUTHENTICATION, []
-                )
-                self.verification_relationships[DidDocumentJsonProperties.KEY_AGREEMENT] = document.get(
-                    DidDocumentJsonProperties.KEY_AGREEMENT, []
-                )
-                self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_INVOCATION] = document.get(
-                    DidDocumentJsonProperties.CAPABILITY_INVOCATION, []
-                )
-                self.verification_relationships[DidDocumentJsonProperties.CAPABILITY_DELEGATION] = document.get(
-                    DidDocumentJsonProperties.CAPABILITY_DELEGATION, []
-                )
+                self._clear_verification_relationships()
+                for relationship_type in self._verification_relationships:
+                    for entry in document.get(relationship_type, []):
+                        self._add_verification_relationship(relationship_type, entry)
             case HcsDidEventTarget.DID_OWNER:
                 if self.controller:
                     LOGGER.warning(f"DID owner is already registered: {self.controller}, skipping event...")
@@ -201,19 +219,19 @@ class DidDocument(Serializable):
                 relationship_type = update_verification_relationship_event.relationship_type
                 event_id = update_verification_relationship_event.id_
 
-                if relationship_type not in self.verification_relationships:
+                if relationship_type not in self._verification_relationships:
                     LOGGER.warning(
                         f"Create verification Relationship event with type {relationship_type} is not supported, skipping event..."
                     )
                     return
 
-                if event_id in self.verification_relationships[relationship_type]:
+                if event_id in self._verification_relationships[relationship_type]:
                     LOGGER.warning(
                         f"Duplicate create Verification Relationship event ID: {event_id}, skipping event..."
                     )
                     return
 
-                self.verification_relationships[relationship_type].append(event_id)
+                self._add_verification_relationship(relationship_type, event_id)
 
                 if event_id not in self.verification_methods:
                     self.verification_methods[event_id] = (
@@ -257,13 +275,13 @@ class DidDocument(Serializable):
                 relationship_type = update_verification_relationship_event.relationship_type
                 event_id = update_verification_relationship_event.id_
 
-                if relationship_type not in self.verification_relationships:
+                if relationship_type not in self._verification_relationships:
                     LOGGER.warning(
                         f"Update verification Relationship event with type {relationship_type} is not supported, skipping event..."
                     )
                     return
 
-                if event_id not in self.verification_relationships[relationship_type]:
+                if event_id not in self._verification_relationships[relationship_type]:
                     LOGGER.warning(
                         f"Verification Relationship with ID: {event_id} is not found on the document, skipping event..."
                     )
@@ -302,10 +320,8 @@ class DidDocument(Serializable):
 
                 del self.verification_methods[event_id]
 
-                for type_key in self.verification_relationships:
-                    self.verification_relationships[type_key] = list(
-                        filter(lambda id_: id_ != event_id, self.verification_relationships[type_key])
-                    )
+                for relationship_type in self._relationship_types_by_method_id.pop(event_id, set()):
+                    del self._verification_relationships[relationship_type][event_id]
 
                 self._on_updated(message.timestamp)
             case HcsDidEventTarget.VERIFICATION_RELATIONSHIP:
@@ -313,25 +329,21 @@ class DidDocument(Serializable):
                 relationship_type = revoke_verification_relationship_event.relationship_type
                 event_id = revoke_verification_relationship_event.id_
 
-                if relationship_type not in self.verification_relationships:
+                if relationship_type not in self._verification_relationships:
                     LOGGER.warning(
                         f"Revoke verification Relationship event with type {relationship_type} is not supported, skipping event..."
                     )
                     return
 
-                if event_id not in self.verification_relationships[relationship_type]:
+                if event_id not in self._verification_relationships[relationship_type]:
                     LOGGER.warning(
                         f"Verification Relationship with ID: {event_id} is not found on the document, skipping event..."
                     )
                     return
 
-                self.verification_relationships[relationship_type] = list(
-                    filter(lambda id_: id_ != event_id, self.verification_relationships[relationship_type])
-                )
+                self._remove_verification_relationship(relationship_type, event_id)
 
-                can_delete_verification_method = all(
-                    event_id not in rel for rel in self.verification_relationships.values()
-                )
+                can_delete_verification_method = event_id not in self._relationship_types_by_method_id
 
                 if can_delete_verification_method:
                     del self.verification_methods[event_id]
@@ -348,12 +360,32 @@ class DidDocument(Serializable):
                 self.controller = None
                 self.services.clear()
                 self.verification_methods.clear()
-                for type_key in self.verification_relationships:
-                    self.verification_relationships[type_key] = []
+                self._clear_verification_relationships()
                 self._on_deactivated()
             case _:
                 LOGGER.warning(f"Delete {event.event_target} operation is not supported, skipping event...")
 
+    def _add_verification_relationship(self, relationship_type: str, entry: str | dict):
+        if isinstance(entry, str):
+            self._verification_relationships[relationship_type][entry] = entry
+            self._relationship_types_by_method_id.setdefault(entry, set()).add(relationship_type)
+        else:
+            # Embedded verification methods (from DID document) are kept as is and are not addressable by events
+            self._verification_relationships[relationship_type][object()] = entry
+
+    def _remove_verification_relationship(self, relationship_type: str, method_id: str):
+        del self._verification_relationships[relationship_type][method_id]
+
+        relationship_types = self._relationship_types_by_method_id[method_id]
+        relationship_types.discard(relationship_type)
+        if not relationship_types:
+            del self._relationship_types_by_method_id[method_id]
+
+    def _clear_verification_relationships(self):
+        for relationships in self._verification_relationships.values():
+            relationships.clear()
+        self._relationship_types_by_method_id.clear()
+
     def _on_activated(self, timestamp: float):
         self.created = timestamp
         self.updated = timestamp
@@ -1,8 +1,9 @@
-import json
 import time
+from typing import cast
 
 from ...hcs import HcsMessage, HcsMessageEnvelope
-from ...utils.encoding import b64_to_str, str_to_b64
+from ...utils.encoding import b64_to_bytes, str_to_b64
+from ...utils.json_codec import json_loads
 from ..did_document_operation import DidDocumentOperation
 from ..utils import parse_identifier
 from .events.document.hcs_did_create_did_document_event import HcsDidCreateDidDocumentEvent
@@ -22,57 +23,119 @@ from .events.verification_relationship.hcs_did_update_verification_relationship_
 )
 
 
-def _parse_hcs_did_event(event_base64: str, operation: DidDocumentOperation) -> HcsDidEvent:  # noqa: C901
-    event_json = b64_to_str(event_base64)
+def _decode_hcs_did_event(event_base64: str) -> dict:
+    try:
+        event_payload = json_loads(b64_to_bytes(event_base64))
+    except ValueError as error:
+        raise Exception("HcsDidEvent JSON parsing failed: Invalid JSON structure") from error
 
+    if not isinstance(event_payload, dict):
+        raise Exception("HcsDidEvent JSON parsing failed: Invalid JSON structure")
+
+    return event_payload
+
+
+def _get_hcs_did_event_target(event_payload: dict) -> str:
     # Retrieve the first key in dict - event target
-    event_target = next(iter(json.loads(event_json)))
+    event_target = next(iter(event_payload), None)
 
     if not event_target:
         raise Exception("Event target is not defined")
 
+    return event_target
+
+
+def _parse_hcs_did_event_payload(event_payload: dict, operation: DidDocumentOperation) -> HcsDidEvent:  # noqa: C901
+    event_target = _get_hcs_did_event_target(event_payload)
+
     match operation:
         case DidDocumentOperation.CREATE | DidDocumentOperation.UPDATE:
             match event_target:
                 case HcsDidEventTarget.DID_DOCUMENT:
-                    return HcsDidCreateDidDocumentEvent.from_json(event_json)
+                    return HcsDidCreateDidDocumentEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.DID_OWNER:
-                    return HcsDidUpdateDidOwnerEvent.from_json(event_json)
+                    return HcsDidUpdateDidOwnerEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.SERVICE:
-                    return HcsDidUpdateServiceEvent.from_json(event_json)
+                    return HcsDidUpdateServiceEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.VERIFICATION_METHOD:
-                    return HcsDidUpdateVerificationMethodEvent.from_json(event_json)
+                    return HcsDidUpdateVerificationMethodEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.VERIFICATION_RELATIONSHIP:
-                    return HcsDidUpdateVerificationRelationshipEvent.from_json(event_json)
+                    return HcsDidUpdateVerificationRelationshipEvent.from_json_payload(event_payload)
         case DidDocumentOperation.REVOKE:
             match event_target:
                 case HcsDidEventTarget.SERVICE:
-                    return HcsDidRevokeServiceEvent.from_json(event_json)
+                    return HcsDidRevokeServiceEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.VERIFICATION_METHOD:
-                    return HcsDidRevokeVerificationMethodEvent.from_json(event_json)
+                    return HcsDidRevokeVerificationMethodEvent.from_json_payload(event_payload)
                 case HcsDidEventTarget.VERIFICATION_RELATIONSHIP:
-                    return HcsDidRevokeVerificationRelationshipEvent.from_json(event_json)
+                    return HcsDidRevokeVerificationRelationshipEvent.from_json_payload(event_payload)
         case DidDocumentOperation.DELETE:
             match event_target:
                 case HcsDidEventTarget.DOCUMENT:
-                    return HcsDidDeleteEvent.from_json(event_json)
+                    return HcsDidDeleteEvent.from_json_payload(event_payload)
 
     raise Exception(f"Error on parsing HcsDidEvent: {operation} - {event_target} is not supported")
 
 
+def _parse_hcs_did_event(event_base64: str, operation: DidDocumentOperation) -> HcsDidEvent:
+    return _parse_hcs_did_event_payload(_decode_hcs_did_event(event_base64), operation)
+
+
 class HcsDidMessage(HcsMessage):
-    def __init__(self, operation: DidDocumentOperation, did: str, event: HcsDidEvent, timestamp: float = time.time()):
+    """HCS DID message.
+
+    Messages parsed from HCS keep event in encoded form, event is decoded and parsed on first access.
+    This way, messages discarded by resolution (duplicates, invalid signatures, etc.) never have their events parsed.
+    """
+
+    def __init__(
+        self,
+        operation: DidDocumentOperation,
+        did: str,
+        event: HcsDidEvent | None = None,
+        timestamp: float | None = None,
+        event_base64: str | None = None,
+    ):
+        if event is None and event_base64 is None:
+            raise Exception("Either HCS DID event or its base64 encoding must be provided")
+
         self.operation = operation
         self.did = did
-        self.event = event
-        self.timestamp = timestamp
+        # Default is evaluated per message, so every message gets its own creation timestamp (and DID document version ID)
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+        self._event = event
+        self._event_base64 = event_base64
+        self._event_payload: dict | None = None
 
     @property
-    def event_base64(self):
-        return str_to_b64(self.event.to_json())
+    def event(self) -> HcsDidEvent:
+        self.ensure_event_parsed()
+        return cast(HcsDidEvent, self._event)
+
+    def ensure_event_parsed(self):
+        """Decode and parse the event, if not parsed yet. Raises if event is malformed."""
+        if self._event is None:
+            self._event = _parse_hcs_did_event_payload(self._get_event_payload(), self.operation)
+            self._event_payload = None
+
+    @property
+    def event_target(self) -> str:
+        """Event target, available without full event parsing."""
+        if self._event is not None:
+            return self._event.event_target
+
+        return _get_hcs_did_event_target(self._get_event_payload())
+
+    @property
+    def event_base64(self) -> str:
+        if self._event_base64 is None:
+            self._event_base64 = str_to_b64(self.event.to_json())
+
+        return self._event_base64
 
     def is_valid(self, topic_id: str | None = None) -> bool:
-        if not self.did or not self.event or not self.operation:
+        if not self.did or not (self._event or self._event_base64) or not self.operation:
             return False
 
         try:
@@ -89,9 +152,14 @@ class HcsDidMessage(HcsMessage):
     @classmethod
     def from_json_payload(cls, payload: dict):
         match payload:
-            case {"timestamp": timestamp, "operation": operation, "did": did, "event": event_base64}:
-                parsed_event = _parse_hcs_did_event(event_base64, operation)
-                return cls(operation=operation, did=did, event=parsed_event, timestamp=timestamp)
+            case {"timestamp": timestamp, "operation": operation, "did": did, "event": str(event_base64)}:
+                try:
+                    operation = DidDocumentOperation(operation)
+                except ValueError as error:
+                    raise Exception(f"{cls.__name__} JSON parsing failed: Unknown operation '{operation}'") from error
+
+                # Original event encoding is kept, so re-emission and signature payload match received message
+                return cls(operation=operation, did=did, timestamp=timestamp, event_base64=event_base64)
             case _:
                 raise Exception(f"{cls.__name__} JSON parsing failed: Invalid JSON structure")
 
@@ -103,6 +171,12 @@ class HcsDidMessage(HcsMessage):
             "event": self.event_base64,
         }
 
+    def _get_event_payload(self) -> dict:
+        if self._event_payload is None:
+            self._event_payload = _decode_hcs_did_event(cast(str, self._event_base64))
+
+        return self._event_payload
+
 
 class HcsDidMessageEnvelope(HcsMessageEnvelope):
     _message_class = HcsDidMessage
@@ -0,0 +1,190 @@
+import json
+import logging
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import cast
+
+from hedera import PublicKey
+
+from ...utils.encoding import b58_to_bytes, b64_to_bytes, multibase_decode
+from ...utils.signatures import (
+    DEFAULT_VERIFICATION_BATCH_SIZE,
+    SignatureVerificationTask,
+    SignatureVerifier,
+    get_signature_verifier,
+    verify_signatures_async,
+)
+from ..did_document_operation import DidDocumentOperation
+from ..utils import parse_identifier
+from .events.hcs_did_event_target import HcsDidEventTarget
+from .events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
+from .hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_identifier_public_key(identifier: str) -> PublicKey | None:
+    """Get DID root public key encoded in identifier, if it can be decoded."""
+    try:
+        return PublicKey.fromBytes(multibase_decode(parse_identifier(identifier).public_key_base58))
+    except Exception:
+        return None
+
+
+def get_controller_public_key(controller: dict | None) -> PublicKey | None:
+    """Get public key of DID document controller (DID owner), if it's defined."""
+    public_key_base58 = controller.get("publicKeyBase58") if isinstance(controller, dict) else None
+
+    if not public_key_base58:
+        return None
+
+    try:
+        return PublicKey.fromBytes(b58_to_bytes(public_key_base58))
+    except Exception:
+        return None
+
+
+def _get_owner_public_key(message: HcsDidMessage) -> PublicKey | None:
+    if message.operation not in (DidDocumentOperation.CREATE, DidDocumentOperation.UPDATE):
+        return None
+
+    try:
+        if message.event_target != HcsDidEventTarget.DID_OWNER:
+            return None
+
+        event = message.event
+    except Exception:
+        # Messages with malformed events are skipped on DID document processing
+        return None
+
+    return event.public_key if isinstance(event, HcsDidUpdateDidOwnerEvent) else None
+
+
+def _get_signed_payloads(message: HcsDidMessage) -> list[bytes]:
+    canonical_payload = message.to_json_bytes()
+    # Other Hedera DID SDKs sign compact JSON representation of the message
+    compact_payload = json.dumps(message.get_json_payload(), separators=(",", ":"), ensure_ascii=False).encode()
+
+    return [canonical_payload] if compact_payload == canonical_payload else [canonical_payload, compact_payload]
+
+
+class _VerifierCache:
+    def __init__(self):
+        self._verifiers: dict[int, tuple[PublicKey, SignatureVerifier]] = {}
+
+    def get(self, public_key: PublicKey | None) -> SignatureVerifier | None:
+        if public_key is None:
+            return None
+
+        # Keys are cached by object identity, the same key object is reused for all messages signed by DID owner
+        # Key object is stored along with verifier, so identity cannot be reused by another object
+        cached = self._verifiers.get(id(public_key))
+        if cached is None:
+            cached = (public_key, get_signature_verifier(public_key))
+            self._verifiers[id(public_key)] = cached
+
+        return cached[1]
+
+
+async def filter_verified_envelopes(
+    identifier: str,
+    envelopes: list[HcsDidMessageEnvelope],
+    controller_public_key: PublicKey | None = None,
+) -> list[HcsDidMessageEnvelope]:
+    """Verify HCS DID message envelopes signatures and filter out messages with invalid ones.
+
+    DID owner events are expected to be signed by the key they define, all other events - by the current DID owner
+    (controller) key. Signatures are verified in batches off the event loop, verification is repeated only for
+    messages following a DID owner change that turned out to be invalid.
+
+    Args:
+        identifier: DID identifier
+        envelopes: HCS DID message envelopes, in consensus order
+        controller_public_key: Current controller key. If not provided, DID root key from identifier is used
+
+    Returns:
+        Envelopes with valid signatures, in original order
+    """
+    current_key = controller_public_key or get_identifier_public_key(identifier)
+    verifiers = _VerifierCache()
+
+    messages = [cast(HcsDidMessage, envelope.message) for envelope in envelopes]
+    owner_keys = [_get_owner_public_key(message) for message in messages]
+    signatures = [b64_to_bytes(envelope.signature) if envelope.signature else b"" for envelope in envelopes]
+    payloads = [_get_signed_payloads(message) for message in messages]
+
+    verified_envelopes: list[HcsDidMessageEnvelope] = []
+    start_index = 0
+
+    while start_index < len(envelopes):
+        # Signer keys are planned assuming all DID owner changes are valid
+        tasks: list[SignatureVerificationTask] = []
+        planned_key = current_key
+        for index in range(start_index, len(envelopes)):
+            signer_key = owner_keys[index] or planned_key
+            tasks.append(SignatureVerificationTask(verifiers.get(signer_key), payloads[index], signatures[index]))
+            planned_key = owner_keys[index] or planned_key
+
+        results = await verify_signatures_async(tasks)
+        next_start_index = len(envelopes)
+
+        for offset, is_valid in enumerate(results):
+            index = start_index + offset
+            owner_key = owner_keys[index]
+
+            if is_valid:
+                verified_envelopes.append(envelopes[index])
+                current_key = owner_key or current_key
+                continue
+
+            LOGGER.warning(f"HCS DID message signature is invalid, skipping message: {messages[index].to_json()}")
+
+            if owner_key:
+                # Following messages were verified against the key from invalid DID owner event
+                next_start_index = index + 1
+                break
+
+        start_index = next_start_index
+
+    return verified_envelopes
+
+
+async def stream_verified_envelopes(
+    identifier: str,
+    envelopes: AsyncIterable[HcsDidMessageEnvelope],
+    controller_public_key: PublicKey | None = None,
+    chunk_size: int = DEFAULT_VERIFICATION_BATCH_SIZE,
+) -> AsyncIterator[HcsDidMessageEnvelope]:
+    """Verify streamed HCS DID message envelopes in chunks, see 'filter_verified_envelopes'.
+
+    Args:
+        identifier: DID identifier
+        envelopes: HCS DID message envelopes stream, in consensus order
+        controller_public_key: Current controller key. If not provided, DID root key from identifier is used
+        chunk_size: Number of envelopes verified at once
+
+    Returns:
+        Async iterator over envelopes with valid signatures
+    """
+    current_key = controller_public_key or get_identifier_public_key(identifier)
+    chunk: list[HcsDidMessageEnvelope] = []
+
+    async def verify_chunk():
+        nonlocal current_key
+
+        verified_envelopes = await filter_verified_envelopes(identifier, chunk, current_key)
+        for envelope in verified_envelopes:
+            current_key = _get_owner_public_key(cast(HcsDidMessage, envelope.message)) or current_key
+
+        chunk.clear()
+        return verified_envelopes
+
+    async for envelope in envelopes:
+        chunk.append(envelope)
+
+        if len(chunk) >= chunk_size:
+            for verified_envelope in await verify_chunk():
+                yield verified_envelope
+
+    if chunk:
+        for verified_envelope in await verify_chunk():
+            yield verified_envelope
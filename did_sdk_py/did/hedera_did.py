@@ -1,4 +1,9 @@
+import asyncio
 import logging
+from asyncio import Future
+from collections.abc import AsyncIterable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass
 from typing import Literal, cast
 
 from hedera import (
@@ -6,9 +11,17 @@ from hedera import (
     PublicKey,
     TopicMessageSubmitTransaction,
     Transaction,
+    TransactionReceipt,
 )
 
-from ..hcs import HcsMessageResolver, HcsMessageTransaction, HcsTopicOptions, HcsTopicService
+from ..hcs import (
+    HcsMessageResolver,
+    HcsMessageTransaction,
+    HcsReceiptTracker,
+    HcsSubmissionSequencer,
+    HcsTopicOptions,
+    HcsTopicService,
+)
 from ..hcs.constants import MAX_TRANSACTION_FEE
 from ..hedera_client_provider import HederaClientProvider
 from ..utils.encoding import multibase_encode
@@ -27,6 +40,7 @@ from .hcs.events.verification_relationship import (
     HcsDidUpdateVerificationRelationshipEvent,
 )
 from .hcs.hcs_did_message import HcsDidMessage
+from .hcs.hcs_did_message_verifier import stream_verified_envelopes
 from .types import (
     DidServiceType,
     SupportedKeyType,
@@ -34,9 +48,34 @@ from .types import (
 )
 from .utils import build_identifier, parse_identifier
 
+DEFAULT_REGISTRATION_CONCURRENCY = 16
+DEFAULT_REGISTRATION_MAX_ATTEMPTS = 3
+DEFAULT_REGISTRATION_RETRY_DELAY_SECONDS = 0.5
+
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class DidRegistrationResult:
+    """Result of DID registration in bulk.
+
+    Attributes:
+        private_key_der: DID Owner private key the registration was requested for
+        did: Registered DID instance, if registration succeeded
+        error: Last registration error, if registration failed
+        attempts: Number of registration attempts made
+    """
+
+    private_key_der: str
+    did: "HederaDid | None" = None
+    error: Exception | None = None
+    attempts: int = 0
+
+    @property
+    def is_registered(self) -> bool:
+        return self.did is not None and self.error is None
+
+
 class HederaDid:
     """
     Class representing Hedera DID instance, provides access to DID management API.
@@ -45,16 +84,30 @@ class HederaDid:
         client_provider: Hedera Client provider
         identifier: DID identifier (for existing DIDs)
         private_key_der: DID Owner (controller) private key encoded in DER format. Can be empty for read-only access
+        receipt_tracker: If provided, DID document edits (services, verification methods and relationships) return
+            once transaction is accepted by network node, while receipts are confirmed in background by tracker.
+            Edit methods return future of transaction receipt then. DID messages are submitted in the order of method
+            calls, next message is submitted once network node accepts the previous one (receipts are not awaited), so
+            edits of DID instance are pipelined. Edits that are in flight at the same time can reach consensus in a
+            different order, so await receipt of an edit that the next one depends on (i.e. adding and then updating
+            the same service). DID registration, owner change and deletion always wait for receipt
     """
 
     def __init__(
-        self, client_provider: HederaClientProvider, identifier: str | None = None, private_key_der: str | None = None
+        self,
+        client_provider: HederaClientProvider,
+        identifier: str | None = None,
+        private_key_der: str | None = None,
+        receipt_tracker: HcsReceiptTracker | None = None,
     ):
         if not identifier and not private_key_der:
             raise DidException("'identifier' and 'private_key_der' cannot both be empty")
 
+        self._client_provider = client_provider
         self._client = client_provider.get_client()
         self._hcs_topic_service = HcsTopicService(client_provider)
+        self._receipt_tracker = receipt_tracker
+        self._submissions = HcsSubmissionSequencer()
 
         self._private_key = PrivateKey.fromString(private_key_der) if private_key_der else None
         self._key_type: SupportedKeyType | None = (
@@ -69,7 +122,6 @@ class HederaDid:
         else:
             self.topic_id = None
 
-        self._messages: list[HcsDidMessage] = []
         self.document: DidDocument | None = None
 
     async def register(self):
@@ -82,27 +134,72 @@ class HederaDid:
             if document.controller:
                 raise DidException("DID is already registered")
         else:
-            topic_options = HcsTopicOptions(
-                admin_key=self._private_key.getPublicKey(), submit_key=self._private_key.getPublicKey()
-            )
+            await self._create_did_topic()
+
+        await self._submit_did_owner_create_event()
+
+    @classmethod
+    async def register_many(
+        cls,
+        client_provider: HederaClientProvider,
+        private_keys_der: Iterable[str],
+        concurrency: int = DEFAULT_REGISTRATION_CONCURRENCY,
+        max_attempts: int = DEFAULT_REGISTRATION_MAX_ATTEMPTS,
+        retry_delay_seconds: float = DEFAULT_REGISTRATION_RETRY_DELAY_SECONDS,
+    ) -> list[DidRegistrationResult]:
+        """
+        Register (create) multiple new DIDs in Hedera network.
 
-            self.topic_id = await self._hcs_topic_service.create_topic(topic_options, [self._private_key])
+        Up to 'concurrency' registrations are processed at once, so topic creation for some DIDs overlaps with
+        DIDOwner CREATE message submission for others. Failed registration step is retried with exponential backoff,
+        DID topic is not re-created if it was already created by previous attempt.
+        Failure of a single registration does not affect others.
 
-            self.network = self._client.ledgerId.toString()
-            self.identifier = build_identifier(
-                self.network,
-                multibase_encode(bytes(self._private_key.getPublicKey().toBytesRaw()), "base58btc"),
-                self.topic_id,
-            )
+        Use client pool (see 'ClientPoolConfig') to spread registrations over multiple clients.
 
-        hcs_event = HcsDidUpdateDidOwnerEvent(
-            id_=f"{self.identifier}#did-root-key",
-            controller=self.identifier,
-            public_key=self._private_key.getPublicKey(),
-            type_=self._key_type,
-        )
+        Args:
+            client_provider: Hedera Client provider
+            private_keys_der: DID Owner (controller) private keys encoded in DER format, one per DID
+            concurrency: Max number of registrations in progress
+            max_attempts: Max number of attempts per registration
+            retry_delay_seconds: Delay before the first retry, doubled for every next retry
 
-        await self._submit_transaction(DidDocumentOperation.CREATE, hcs_event)
+        Returns:
+            Registration results, in the order of provided private keys
+        """
+        if concurrency < 1:
+            raise DidException("Registration concurrency must be positive")
+
+        if max_attempts < 1:
+            raise DidException("Registration max attempts must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def register_did(private_key_der: str) -> DidRegistrationResult:
+            async with semaphore:
+                try:
+                    did = cls(client_provider, private_key_der=private_key_der)
+                except Exception as error:
+                    return DidRegistrationResult(private_key_der, error=error)
+
+                attempt = 1
+                while True:
+                    try:
+                        if not did.identifier:
+                            await did._create_did_topic()
+
+                        await did._submit_did_owner_create_event()
+                        return DidRegistrationResult(private_key_der, did=did, attempts=attempt)
+                    except Exception as error:
+                        if attempt >= max_attempts:
+                            LOGGER.error(f"DID registration failed after {attempt} attempts: {error!s}")
+                            return DidRegistrationResult(private_key_der, did=did, error=error, attempts=attempt)
+
+                        LOGGER.warning(f"DID registration attempt {attempt} failed, retrying: {error!s}")
+                        await asyncio.sleep(retry_delay_seconds * 2 ** (attempt - 1))
+                        attempt += 1
+
+        return list(await asyncio.gather(*(register_did(private_key_der) for private_key_der in private_keys_der)))
 
     async def change_owner(self, controller: str, new_private_key_der: str):
         """
@@ -114,6 +211,9 @@ class HederaDid:
         """
         self._assert_can_submit_transaction()
 
+        # Pending DID messages are signed with current owner key, they have to reach consensus before topic update
+        await self._submissions.wait_for_pending(cast(str, self.topic_id))
+
         document = await self.resolve()
         if not document.controller:
             raise DidException("DID is not registered or was recently deleted. DID has to be registered first")
@@ -150,8 +250,10 @@ class HederaDid:
         if not self.topic_id or not self.identifier:
             raise DidException("DID is not registered")
 
-        result = await HcsMessageResolver(self.topic_id, HcsDidMessageEnvelope).execute(self._client)
-        await self._handle_resolution_result(cast(list[HcsDidMessageEnvelope], result))
+        resolver = HcsMessageResolver(self.topic_id, HcsDidMessageEnvelope)
+
+        async with aclosing(resolver.stream(self._client_provider.get_client())) as envelopes:
+            await self._handle_resolution_result(cast(AsyncIterable[HcsDidMessageEnvelope], envelopes))
 
         return cast(DidDocument, self.document)
 
@@ -161,40 +263,53 @@ class HederaDid:
 
         await self._submit_transaction(DidDocumentOperation.DELETE, HcsDidDeleteEvent())
 
-    async def add_service(self, id_: str, service_type: DidServiceType, service_endpoint: str):
+    async def add_service(
+        self, id_: str, service_type: DidServiceType, service_endpoint: str
+    ) -> Future[TransactionReceipt] | None:
         """Add Service to DID document
 
         Args:
             id_: Service ID to create
             service_type: DID service type
             service_endpoint: Service endpoint
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_service(
+        return await self._add_or_update_service(
             DidDocumentOperation.CREATE, id_=id_, type_=service_type, service_endpoint=service_endpoint
         )
 
-    async def update_service(self, id_: str, service_type: DidServiceType, service_endpoint: str):
+    async def update_service(
+        self, id_: str, service_type: DidServiceType, service_endpoint: str
+    ) -> Future[TransactionReceipt] | None:
         """Update existing DID document service
 
         Args:
             id_: Service ID to update
             service_type: DID service type
             service_endpoint: Service endpoint
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_service(
+        return await self._add_or_update_service(
             DidDocumentOperation.UPDATE, id_=id_, type_=service_type, service_endpoint=service_endpoint
         )
 
-    async def revoke_service(self, id_: str):
+    async def revoke_service(self, id_: str) -> Future[TransactionReceipt] | None:
         """Revoke existing DID document service
 
         Args:
             id_: Service ID to revoke
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
         self._assert_can_submit_transaction()
 
         hcs_event = HcsDidRevokeServiceEvent(id_)
-        await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event)
+        return await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event, track_receipt=True)
 
     async def add_verification_method(
         self,
@@ -202,7 +317,7 @@ class HederaDid:
         controller: str,
         public_key_der: str,
         type_: SupportedKeyType,
-    ):
+    ) -> Future[TransactionReceipt] | None:
         """Add verification method to DID document
 
         Args:
@@ -210,8 +325,11 @@ class HederaDid:
             controller: Verification method controller ID
             public_key_der: Verification method public key encoded in DER format
             type_: Verification method key type
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_verification_method(
+        return await self._add_or_update_verification_method(
             DidDocumentOperation.CREATE,
             id_=id_,
             controller=controller,
@@ -225,7 +343,7 @@ class HederaDid:
         controller: str,
         public_key_der: str,
         type_: SupportedKeyType,
-    ):
+    ) -> Future[TransactionReceipt] | None:
         """Update existing DID document verification method
 
         Args:
@@ -233,8 +351,11 @@ class HederaDid:
             controller: Verification method controller ID
             public_key_der: Verification method public key encoded in DER format
             type_: Verification method key type
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_verification_method(
+        return await self._add_or_update_verification_method(
             DidDocumentOperation.UPDATE,
             id_=id_,
             controller=controller,
@@ -242,16 +363,19 @@ class HederaDid:
             type_=type_,
         )
 
-    async def revoke_verification_method(self, id_: str):
+    async def revoke_verification_method(self, id_: str) -> Future[TransactionReceipt] | None:
         """Revoke existing DID document verification method
 
         Args:
             id_: Verification method ID to revoke
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
         self._assert_can_submit_transaction()
 
         hcs_event = HcsDidRevokeVerificationMethodEvent(id_)
-        await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event)
+        return await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event, track_receipt=True)
 
     async def add_verification_relationship(
         self,
@@ -260,7 +384,7 @@ class HederaDid:
         public_key_der: str,
         relationship_type: VerificationRelationshipType,
         type_: SupportedKeyType,
-    ):
+    ) -> Future[TransactionReceipt] | None:
         """Add verification relationship to DID document
 
         Args:
@@ -269,8 +393,11 @@ class HederaDid:
             public_key_der: Verification relationship public key encoded in DER format
             relationship_type: Verification relationship type
             type_: Verification relationship key type
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_verification_relationship(
+        return await self._add_or_update_verification_relationship(
             DidDocumentOperation.CREATE,
             id_=id_,
             controller=controller,
@@ -286,7 +413,7 @@ class HederaDid:
         public_key_der: str,
         relationship_type: VerificationRelationshipType,
         type_: SupportedKeyType,
-    ):
+    ) -> Future[TransactionReceipt] | None:
         """Update existing DID document verification relationship
 
         Args:
@@ -295,8 +422,11 @@ class HederaDid:
             public_key_der: Verification relationship public key encoded in DER format
             relationship_type: Verification relationship type
             type_: Verification relationship key type
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
-        await self._add_or_update_verification_relationship(
+        return await self._add_or_update_verification_relationship(
             DidDocumentOperation.UPDATE,
             id_=id_,
             public_key=PublicKey.fromString(public_key_der),
@@ -305,19 +435,52 @@ class HederaDid:
             type_=type_,
         )
 
-    async def revoke_verification_relationship(self, id_: str, relationship_type: VerificationRelationshipType):
+    async def revoke_verification_relationship(
+        self, id_: str, relationship_type: VerificationRelationshipType
+    ) -> Future[TransactionReceipt] | None:
         """Revoke existing DID document verification relationship
 
         Args:
             id_: Verification relationship ID to revoke
             relationship_type: Verification relationship type
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is used
         """
         self._assert_can_submit_transaction()
 
         hcs_event = HcsDidRevokeVerificationRelationshipEvent(id_, relationship_type)
-        await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event)
+        return await self._submit_transaction(DidDocumentOperation.REVOKE, hcs_event, track_receipt=True)
+
+    async def _create_did_topic(self):
+        private_key = cast(PrivateKey, self._private_key)
+
+        topic_options = HcsTopicOptions(admin_key=private_key.getPublicKey(), submit_key=private_key.getPublicKey())
 
-    async def _submit_transaction(self, operation: DidDocumentOperation, event: HcsDidEvent):
+        self.topic_id = await self._hcs_topic_service.create_topic(topic_options, [private_key])
+
+        self.network = self._client.ledgerId.toString()
+        self.identifier = build_identifier(
+            self.network,
+            multibase_encode(bytes(private_key.getPublicKey().toBytesRaw()), "base58btc"),
+            self.topic_id,
+        )
+
+    async def _submit_did_owner_create_event(self):
+        private_key = cast(PrivateKey, self._private_key)
+
+        hcs_event = HcsDidUpdateDidOwnerEvent(
+            id_=f"{self.identifier}#did-root-key",
+            controller=cast(str, self.identifier),
+            public_key=private_key.getPublicKey(),
+            type_=cast(SupportedKeyType, self._key_type),
+        )
+
+        await self._submit_transaction(DidDocumentOperation.CREATE, hcs_event)
+
+    async def _submit_transaction(
+        self, operation: DidDocumentOperation, event: HcsDidEvent, track_receipt: bool = False
+    ) -> Future[TransactionReceipt] | None:
         if not self.topic_id or not self.identifier or not self._private_key:
             raise Exception("Cannot submit transaction: topic_id, identifier and private_key must be set")
 
@@ -325,43 +488,54 @@ class HederaDid:
         envelope = HcsDidMessageEnvelope(message)
         envelope.sign(self._private_key)
 
+        client = self._client_provider.get_client()
+
         def build_did_transaction(message_submit_transaction: TopicMessageSubmitTransaction) -> Transaction:
             return (
                 message_submit_transaction.setMaxTransactionFee(MAX_TRANSACTION_FEE)
-                .freezeWith(self._client)
+                .freezeWith(client)
                 .sign(self._private_key)
             )
 
-        await HcsMessageTransaction(self.topic_id, envelope, build_did_transaction).execute(self._client)
+        transaction = HcsMessageTransaction(self.topic_id, envelope, build_did_transaction)
+        receipt_tracker = self._receipt_tracker if track_receipt else None
+
+        return await self._submissions.submit(self.topic_id, lambda: transaction.execute(client, receipt_tracker))
 
     async def _add_or_update_service(
         self, operation: Literal[DidDocumentOperation.CREATE, DidDocumentOperation.UPDATE], **kwargs
-    ):
+    ) -> Future[TransactionReceipt] | None:
         self._assert_can_submit_transaction()
 
-        await self._submit_transaction(operation, HcsDidUpdateServiceEvent(**kwargs))
+        return await self._submit_transaction(operation, HcsDidUpdateServiceEvent(**kwargs), track_receipt=True)
 
     async def _add_or_update_verification_method(
         self, operation: Literal[DidDocumentOperation.CREATE, DidDocumentOperation.UPDATE], **kwargs
-    ):
+    ) -> Future[TransactionReceipt] | None:
         self._assert_can_submit_transaction()
 
-        await self._submit_transaction(operation, HcsDidUpdateVerificationMethodEvent(**kwargs))
+        return await self._submit_transaction(
+            operation, HcsDidUpdateVerificationMethodEvent(**kwargs), track_receipt=True
+        )
 
     async def _add_or_update_verification_relationship(
         self, operation: Literal[DidDocumentOperation.CREATE, DidDocumentOperation.UPDATE], **kwargs
-    ):
+    ) -> Future[TransactionReceipt] | None:
         self._assert_can_submit_transaction()
 
-        await self._submit_transaction(operation, HcsDidUpdateVerificationRelationshipEvent(**kwargs))
+        return await self._submit_transaction(
+            operation, HcsDidUpdateVerificationRelationshipEvent(**kwargs), track_receipt=True
+        )
 
-    async def _handle_resolution_result(self, result: list[HcsDidMessageEnvelope]):
+    async def _handle_resolution_result(self, result: AsyncIterable[HcsDidMessageEnvelope]):
         if not self.identifier:
             raise Exception("Cannot handle DID resolution result: DID identifier is not defined")
 
-        self._messages = [cast(HcsDidMessage, envelope.message) for envelope in result]
+        verified_envelopes = stream_verified_envelopes(self.identifier, result)
+        messages = (cast(HcsDidMessage, envelope.message) async for envelope in verified_envelopes)
+
         self.document = DidDocument(self.identifier)
-        await self.document.process_messages(self._messages)
+        await self.document.process_messages(messages)
 
     def _assert_can_submit_transaction(self):
         if not self.identifier:
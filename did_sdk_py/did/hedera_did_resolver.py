@@ -1,21 +1,51 @@
+import asyncio
+import copy
 import datetime
+import math
 import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass
 from enum import StrEnum
+from threading import Lock
 from typing import cast
 
 from ..did.utils import parse_identifier
+from ..hcs.hcs_message import HcsMessageWithResponseMetadata
 from ..hcs.hcs_message_resolver import HcsMessageResolver
 from ..hedera_client_provider import HederaClientProvider
-from ..utils.cache import Cache, MemoryCache, TimestampedRecord
+from ..utils.background_refresh import BackgroundRefresher
+from ..utils.cache import (
+    DEFAULT_NEGATIVE_CACHE_POLICY,
+    Cache,
+    MemoryCache,
+    NegativeCachePolicy,
+    NegativeResultCache,
+    StaleWhileRevalidatePolicy,
+    TimestampedRecord,
+)
+from ..utils.json_codec import json_dumps
+from ..utils.prefetch import DEFAULT_PREFETCH_CONCURRENCY, PrefetchProgressCallback, PrefetchResult, run_prefetch
 from ..utils.timestamp import Timestamp
 from .did_document import DidDocument
 from .did_error import DidErrorCode, DidException
 from .hcs.hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
-from .hedera_did import HederaDid
+from .hcs.hcs_did_message_verifier import get_controller_public_key, stream_verified_envelopes
 from .types import DIDDocument, DIDDocumentMetadata, DIDResolutionResult
 
 INSERTION_THRESHOLD_SECONDS = float(10)
 
+# Max number of DIDs with memoized resolution results (least recently used are evicted first)
+RENDERED_RESULTS_CACHE_SIZE = 1024
+
+# Number of processed topic messages between DID document state checkpoints used for historical resolution
+CHECKPOINT_INTERVAL = 500
+
+# Max number of DID document state checkpoints kept per DID (oldest are evicted first)
+MAX_CHECKPOINTS_PER_DID = 32
+
 
 class DidResolutionError(StrEnum):
     """Enum for DID resolution errors"""
@@ -58,93 +88,432 @@ def _get_error_description(error: Exception):
             return DidResolutionError.UNKNOWN.value
 
 
+def _render_resolution_result(did_document: DidDocument) -> DIDResolutionResult:
+    document_meta = {
+        "versionId": did_document.version_id,
+    }
+
+    if not did_document.deactivated:
+        document_meta.update({
+            "created": datetime.date.fromtimestamp(cast(float, did_document.created)).isoformat(),
+            "updated": datetime.date.fromtimestamp(cast(float, did_document.updated)).isoformat(),
+        })
+
+    status = {"deactivated": True} if did_document.deactivated else {}
+
+    return {
+        "didDocumentMetadata": cast(DIDDocumentMetadata, {**status, **document_meta}),
+        "didResolutionMetadata": {"contentType": "application/did+ld+json"},
+        "didDocument": cast(DIDDocument, did_document.get_json_payload()),
+    }
+
+
+def _build_error_result(error: Exception) -> DIDResolutionResult:
+    return {
+        "didResolutionMetadata": {
+            "error": _get_error_description(error),
+            "message": str(error),  # pyright: ignore - this is not in spec, but may be helpful
+        },
+        "didDocumentMetadata": {},
+        "didDocument": None,
+    }
+
+
+def _datetime_to_timestamp(value: datetime.datetime) -> Timestamp:
+    return Timestamp(math.floor(value.timestamp()), value.microsecond * 1000)
+
+
+@dataclass(slots=True)
+class DidDocumentCheckpoint:
+    """DID document state checkpoint used for historical DID resolution.
+
+    Attributes:
+        consensus_timestamp: Consensus timestamp of the last message applied to checkpoint state
+        document: DID document state snapshot
+    """
+
+    consensus_timestamp: Timestamp
+    document: DidDocument
+
+
+def _get_checkpoints_cache_key(topic_id: str) -> str:
+    return f"{topic_id}:checkpoints"
+
+
+class _DidDocumentCheckpointCache:
+    """DID document state checkpoints, stored in resolver cache instance.
+
+    Checkpoints of every topic are kept in a single cache record under '<topic ID>:checkpoints' key (which is never
+    read as DID document), so they're retained and shared between processes the same way as cached DID documents.
+    Checkpoints are ordered by consensus timestamp. Checkpoint lists are not modified in place, so found checkpoints
+    can be used without holding the lock. Checkpoint documents must not be modified by callers.
+
+    Args:
+        cache: Resolver cache instance
+        max_checkpoints: Max number of checkpoints per topic (oldest are evicted first)
+    """
+
+    def __init__(
+        self, cache: Cache[str, TimestampedRecord[DidDocument]], max_checkpoints: int = MAX_CHECKPOINTS_PER_DID
+    ):
+        self._cache = cast(Cache[str, TimestampedRecord[list[DidDocumentCheckpoint]]], cache)
+        self._max_checkpoints = max_checkpoints
+        self._lock = Lock()
+
+    def get(self, topic_id: str) -> list[DidDocumentCheckpoint]:
+        record = self._cache.get(_get_checkpoints_cache_key(topic_id))
+        return record.data if record else []
+
+    def add(self, topic_id: str, checkpoint: DidDocumentCheckpoint):
+        epoch_nanos = checkpoint.consensus_timestamp.epoch_nanos
+
+        with self._lock:
+            checkpoints = self.get(topic_id)
+
+            index = bisect_left(checkpoints, epoch_nanos, key=lambda item: item.consensus_timestamp.epoch_nanos)
+            if index < len(checkpoints) and checkpoints[index].consensus_timestamp.epoch_nanos == epoch_nanos:
+                return
+
+            checkpoints = [*checkpoints[:index], checkpoint, *checkpoints[index:]]
+            self._cache.set(
+                _get_checkpoints_cache_key(topic_id), TimestampedRecord(checkpoints[-self._max_checkpoints :])
+            )
+
+
+@dataclass(slots=True)
+class _RenderedResolutionResult:
+    version_id: str | None
+    deactivated: bool
+    result: DIDResolutionResult
+    json_bytes: bytes | None = None
+
+
 class HederaDidResolver:
     """Hedera DID Resolver implementation.
 
     Args:
         client_provider: Hedera Client provider
-        cache_instance: Custom cache instance. If not provided, in-memory cache is used
+        cache_instance: Custom cache instance. If not provided, in-memory cache is used. Besides DID documents (by DID
+            topic ID), cache keeps DID document state checkpoints under '<topic ID>:checkpoints' keys
+        stale_while_revalidate: Stale-while-revalidate policy. If provided, outdated cached DID documents are returned
+            immediately and refreshed in background. Otherwise, resolution waits for refresh
+        negative_cache: Caching policy for "not found" resolution results. Negative results are not cached if None
     """
 
     def __init__(
         self,
         client_provider: HederaClientProvider,
         cache_instance: Cache[str, TimestampedRecord[DidDocument]] | None = None,
+        stale_while_revalidate: StaleWhileRevalidatePolicy | None = None,
+        negative_cache: NegativeCachePolicy | None = DEFAULT_NEGATIVE_CACHE_POLICY,
     ):
         self._client_provider = client_provider
         self._cache = cache_instance or MemoryCache[str, TimestampedRecord[DidDocument]]()
+        self._rendered_results: OrderedDict[str, _RenderedResolutionResult] = OrderedDict()
+
+        self._stale_while_revalidate = stale_while_revalidate
+        self._background_refresher = BackgroundRefresher()
 
-    async def resolve(self, did: str) -> DIDResolutionResult:
+        # "Not found" errors by topic ID
+        self._negative_cache = NegativeResultCache[str](negative_cache) if negative_cache else None
+
+        self._checkpoints = _DidDocumentCheckpointCache(self._cache)
+
+    async def resolve(
+        self, did: str, version_time: datetime.datetime | None = None, version_id: str | None = None
+    ) -> DIDResolutionResult:
         """
         Resolve DID document by identifier.
 
+        Latest DID document resolution results are memoized per DID document version and shared between calls, so
+        returned result must not be modified by caller (copy it first if needed). Use 'resolve_json_bytes' to serve
+        serialized results.
+
+        Historical DID document states ('versionTime' and 'versionId' DID resolution parameters) are resolved by
+        replaying DID topic messages from the nearest DID document state checkpoint. Checkpoints are created whenever
+        topic messages are processed (resolution, refresh and replay) and stored in resolver cache instance.
+
         Args:
             did: DID identifier to resolve
+            version_time: Resolve DID document state at given (consensus) time. Timezone-aware datetime is expected
+            version_id: Resolve DID document state with given version ID
 
         Returns:
             object: DID resolution result
         """
         try:
-            parsed_identifier = parse_identifier(did)
-            topic_id = parsed_identifier.topic_id
+            rendered_result = await self._resolve_rendered(did, version_time, version_id)
+        except Exception as error:
+            return _build_error_result(error)
+
+        return rendered_result.result
 
-            timestamped_record: TimestampedRecord | None = self._cache.get(topic_id)
+    async def resolve_json_bytes(
+        self, did: str, version_time: datetime.datetime | None = None, version_id: str | None = None
+    ) -> bytes:
+        """
+        Resolve DID document by identifier and serialize DID resolution result to JSON.
 
-            if timestamped_record:
-                now = time.time()
-                last_updated_timestamp: float = timestamped_record.timestamp
-                did_document: DidDocument = timestamped_record.data
+        Serialized result is memoized along with resolution result, so hot DIDs are served without re-serialization.
 
-                if (now - last_updated_timestamp) > INSERTION_THRESHOLD_SECONDS:
-                    result = await HcsMessageResolver(
-                        topic_id,
-                        HcsDidMessageEnvelope,
-                        timestamp_from=Timestamp(last_updated_timestamp, 0),
-                    ).execute(self._client_provider.get_client())
+        Args:
+            did: DID identifier to resolve
+            version_time: Resolve DID document state at given (consensus) time. Timezone-aware datetime is expected
+            version_id: Resolve DID document state with given version ID
+
+        Returns:
+            object: DID resolution result as UTF-8 encoded JSON
+        """
+        try:
+            rendered_result = await self._resolve_rendered(did, version_time, version_id)
+        except Exception as error:
+            return json_dumps(_build_error_result(error)).encode()
 
-                    messages = [
-                        cast(HcsDidMessage, envelope.message) for envelope in cast(list[HcsDidMessageEnvelope], result)
-                    ]
+        if rendered_result.json_bytes is None:
+            rendered_result.json_bytes = json_dumps(rendered_result.result).encode()
 
-                    await did_document.process_messages(messages)
+        return rendered_result.json_bytes
 
-                    self._cache.set(
+    async def prefetch(
+        self,
+        dids: Sequence[str],
+        max_concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+        on_progress: PrefetchProgressCallback | None = None,
+    ) -> list[PrefetchResult]:
+        """
+        Resolve DIDs concurrently to load them into resolver cache (i.e. trusted issuer DIDs on application start).
+
+        Args:
+            dids: DID identifiers to prefetch
+            max_concurrency: Max number of concurrent resolutions
+            on_progress: Callback invoked after every prefetched DID
+
+        Returns:
+            Prefetch results, failed resolutions are reported with errors
+        """
+        return await run_prefetch(dids, self._resolve_rendered, max_concurrency, on_progress)
+
+    async def _resolve_rendered(
+        self, did: str, version_time: datetime.datetime | None = None, version_id: str | None = None
+    ) -> _RenderedResolutionResult:
+        topic_id = parse_identifier(did).topic_id
+
+        not_found_message = self._negative_cache.get(topic_id) if self._negative_cache else None
+        if not_found_message:
+            raise DidException(not_found_message, DidErrorCode.DID_NOT_FOUND)
+
+        if version_time is not None or version_id is not None:
+            did_document = await self._resolve_historical_did_document(did, topic_id, version_time, version_id)
+            return _RenderedResolutionResult(
+                did_document.version_id, did_document.deactivated, _render_resolution_result(did_document)
+            )
+
+        did_document = await self._resolve_did_document(did, topic_id)
+
+        # Memoized result is keyed on DID document version ID, which is set to timestamp of every applied message.
+        # Unlike processed messages count, it's not changed when refresh re-processes messages of the last update
+        rendered_result = self._rendered_results.get(topic_id)
+        if (
+            rendered_result
+            and rendered_result.version_id == did_document.version_id
+            and rendered_result.deactivated == did_document.deactivated
+        ):
+            self._rendered_results.move_to_end(topic_id)
+            return rendered_result
+
+        rendered_result = _RenderedResolutionResult(
+            did_document.version_id, did_document.deactivated, _render_resolution_result(did_document)
+        )
+
+        self._rendered_results[topic_id] = rendered_result
+        if len(self._rendered_results) > RENDERED_RESULTS_CACHE_SIZE:
+            self._rendered_results.popitem(last=False)
+
+        return rendered_result
+
+    async def _resolve_did_document(self, did: str, topic_id: str) -> DidDocument:
+        timestamped_record: TimestampedRecord | None = self._cache.get(topic_id)
+
+        if timestamped_record:
+            now = time.time()
+            last_updated_timestamp: float = timestamped_record.timestamp
+            did_document: DidDocument = timestamped_record.data
+
+            if (now - last_updated_timestamp) > INSERTION_THRESHOLD_SECONDS:
+                if not self._stale_while_revalidate:
+                    return await self._refresh_did_document(did, topic_id, did_document, last_updated_timestamp)
+
+                # Records cached without refresh time are refreshed as if they've never been
+                refresh_time = timestamped_record.refresh_time
+                refresh_age = now - refresh_time if refresh_time is not None else math.inf
+
+                # Hot DIDs don't query the topic on every resolution
+                if refresh_age > self._stale_while_revalidate.min_refresh_interval:
+                    refresh_task = self._background_refresher.refresh(
                         topic_id,
-                        TimestampedRecord(did_document, did_document.updated or did_document.created or time.time()),
+                        lambda: self._refresh_did_document(did, topic_id, did_document, last_updated_timestamp),
                     )
-            else:
-                registered_did = HederaDid(identifier=did, client_provider=self._client_provider)
 
-                did_document = await registered_did.resolve()
+                    if refresh_age > self._stale_while_revalidate.max_staleness:
+                        # Cached document is too stale to be returned, caller waits for (shared) refresh
+                        did_document = await asyncio.shield(refresh_task)
+        else:
+            did_document = await self._process_topic_messages(did, topic_id, DidDocument(did))
 
-                self._cache.set(
-                    topic_id,
-                    TimestampedRecord(did_document, did_document.updated or did_document.created or time.time()),
-                )
+            # DID topic without valid DID document messages
+            if did_document.created is None and not did_document.deactivated:
+                not_found_message = f"DID document for topic '{topic_id}' is not found"
+                if self._negative_cache:
+                    self._negative_cache.set(topic_id, not_found_message)
 
-            document_meta = {
-                "versionId": did_document.version_id,
-            }
+                raise DidException(not_found_message, DidErrorCode.DID_NOT_FOUND)
 
-            if not did_document.deactivated:
-                document_meta.update({
-                    "created": datetime.date.fromtimestamp(cast(float, did_document.created)).isoformat(),
-                    "updated": datetime.date.fromtimestamp(cast(float, did_document.updated)).isoformat(),
-                })
+            self._cache_did_document(topic_id, did_document)
 
-            status = {"deactivated": True} if did_document.deactivated else {}
+        return did_document
 
-            return {
-                "didDocumentMetadata": cast(DIDDocumentMetadata, {**status, **document_meta}),
-                "didResolutionMetadata": {"contentType": "application/did+ld+json"},
-                "didDocument": cast(DIDDocument, did_document.get_json_payload()),
-            }
-        except Exception as error:
-            return {
-                "didResolutionMetadata": {
-                    "error": _get_error_description(error),
-                    "message": str(error),  # pyright: ignore - this is not in spec, but may be helpful
-                },
-                "didDocumentMetadata": {},
-                "didDocument": None,
-            }
+    async def _refresh_did_document(
+        self, did: str, topic_id: str, did_document: DidDocument, last_updated_timestamp: float
+    ) -> DidDocument:
+        # Cached document can be used by concurrent resolutions, so refreshed copy replaces it once it's complete
+        refreshed_document = await self._process_topic_messages(
+            did, topic_id, copy.deepcopy(did_document), timestamp_from=Timestamp(last_updated_timestamp, 0)
+        )
+
+        self._cache_did_document(topic_id, refreshed_document)
+
+        return refreshed_document
+
+    def _cache_did_document(self, topic_id: str, did_document: DidDocument):
+        self._cache.set(
+            topic_id,
+            TimestampedRecord(
+                did_document, did_document.updated or did_document.created or time.time(), refresh_time=time.time()
+            ),
+        )
+
+    async def _resolve_historical_did_document(
+        self, did: str, topic_id: str, version_time: datetime.datetime | None, version_id: str | None
+    ) -> DidDocument:
+        if version_time is not None and version_id is not None:
+            raise DidException("Only one of 'versionTime' and 'versionId' parameters can be specified")
+
+        timestamp_to = _datetime_to_timestamp(version_time) if version_time is not None else None
+        checkpoint = self._find_checkpoint(topic_id, timestamp_to, version_id)
+
+        did_document = await self._replay_did_document(did, topic_id, checkpoint, timestamp_to, version_id)
+
+        if version_id is not None and did_document.version_id != version_id and checkpoint:
+            # Message timestamps (version IDs) are set by submitters and are not guaranteed to follow consensus order
+            # If version is not found after the checkpoint, whole topic is replayed
+            did_document = await self._replay_did_document(did, topic_id, None, None, version_id)
+
+        if version_id is not None and did_document.version_id != version_id:
+            raise DidException(f"DID document version '{version_id}' is not found", DidErrorCode.DID_NOT_FOUND)
+
+        if not did_document.controller and not did_document.deactivated:
+            raise DidException(f"DID document is not found at {version_time}", DidErrorCode.DID_NOT_FOUND)
+
+        return did_document
+
+    def _find_checkpoint(
+        self, topic_id: str, timestamp_to: Timestamp | None, version_id: str | None
+    ) -> DidDocumentCheckpoint | None:
+        checkpoints = self._checkpoints.get(topic_id)
+        if not checkpoints:
+            return None
+
+        if timestamp_to is not None:
+            index = bisect_right(
+                checkpoints, timestamp_to.epoch_nanos, key=lambda checkpoint: checkpoint.consensus_timestamp.epoch_nanos
+            )
+            return checkpoints[index - 1] if index > 0 else None
+
+        try:
+            version_timestamp = float(cast(str, version_id))
+        except ValueError:
+            return None
+
+        # Version ID equals to timestamp of the last applied message, the latest checkpoint preceding it is used
+        for checkpoint in reversed(checkpoints):
+            checkpoint_version_id = checkpoint.document.version_id
+            if checkpoint_version_id is not None and float(checkpoint_version_id) <= version_timestamp:
+                return checkpoint
+
+        return None
+
+    async def _replay_did_document(
+        self,
+        did: str,
+        topic_id: str,
+        checkpoint: DidDocumentCheckpoint | None,
+        timestamp_to: Timestamp | None,
+        version_id: str | None,
+    ) -> DidDocument:
+        # Checkpoint state is copied, so it's not affected by replay
+        return await self._process_topic_messages(
+            did,
+            topic_id,
+            copy.deepcopy(checkpoint.document) if checkpoint else DidDocument(did),
+            timestamp_from=Timestamp(0, checkpoint.consensus_timestamp.epoch_nanos + 1) if checkpoint else None,
+            timestamp_to=timestamp_to,
+            version_id=version_id,
+        )
+
+    async def _process_topic_messages(
+        self,
+        did: str,
+        topic_id: str,
+        did_document: DidDocument,
+        timestamp_from: Timestamp | None = None,
+        timestamp_to: Timestamp | None = None,
+        version_id: str | None = None,
+    ) -> DidDocument:
+        resolver = HcsMessageResolver(
+            topic_id,
+            HcsDidMessageEnvelope,
+            timestamp_from=timestamp_from,
+            timestamp_to=timestamp_to,
+            include_response_metadata=True,
+        )
+
+        # Consensus timestamps of received envelopes, verification yields (a subset of) the same envelopes in order
+        consensus_timestamps: deque[tuple[HcsDidMessageEnvelope, Timestamp]] = deque()
+
+        async def unwrap_envelopes(messages: AsyncIterable) -> AsyncIterator[HcsDidMessageEnvelope]:
+            async for message in cast(AsyncIterable[HcsMessageWithResponseMetadata], messages):
+                envelope = cast(HcsDidMessageEnvelope, message.message)
+                consensus_timestamps.append((envelope, message.consensus_timestamp))
+                yield envelope
+
+        async with (
+            aclosing(resolver.stream(self._client_provider.get_client())) as messages,
+            aclosing(unwrap_envelopes(messages)) as envelopes,
+            aclosing(
+                stream_verified_envelopes(did, envelopes, get_controller_public_key(did_document.controller))
+            ) as verified_envelopes,
+        ):
+            async for envelope in verified_envelopes:
+                while consensus_timestamps[0][0] is not envelope:
+                    consensus_timestamps.popleft()
+                _, consensus_timestamp = consensus_timestamps.popleft()
+
+                message = cast(HcsDidMessage, envelope.message)
+
+                # Requested version is reached, following message would change it
+                if (
+                    version_id is not None
+                    and did_document.version_id == version_id
+                    and str(message.timestamp) != version_id
+                ):
+                    break
+
+                await did_document.process_messages([message])
+
+                # Processed messages count is kept in checkpoint state, so checkpoints of all replays are aligned
+                if did_document.processed_messages % CHECKPOINT_INTERVAL == 0:
+                    self._checkpoints.add(
+                        topic_id, DidDocumentCheckpoint(consensus_timestamp, copy.deepcopy(did_document))
+                    )
+
+        return did_document
@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .did_error import DidErrorCode, DidException
 from .did_syntax import (
@@ -17,6 +18,15 @@ SERVICE_ID_POSTFIX_REGEX = re.compile(r"^(service)\-[0-9]{1,}$")
 KEY_ID_POSTFIX_REGEX = re.compile(r"^(key)\-[0-9]{1,}$")
 TOPIC_ID_REGEX = re.compile(r"^[0-9]{1,}\.[0-9]{1,}\.[0-9]{1,}$")
 
+# Matches well-formed Hedera DIDs only, anything else is handled (and reported) by full parser
+HEDERA_DID_REGEX = re.compile(
+    rf"{DID_PREFIX}{DID_METHOD_SEPARATOR}{HEDERA_DID_METHOD}{DID_METHOD_SEPARATOR}"
+    rf"({HEDERA_NETWORK_MAINNET}|{HEDERA_NETWORK_TESTNET}|{HEDERA_NETWORK_PREVIEWNET}){DID_METHOD_SEPARATOR}"
+    rf"([^{DID_METHOD_SEPARATOR}{DID_TOPIC_SEPARATOR}]{{44,}}){DID_TOPIC_SEPARATOR}([0-9]+\.[0-9]+\.[0-9]+)"
+)
+
+PARSED_IDENTIFIERS_CACHE_SIZE = 4096
+
 
 def is_valid_did(did: str) -> bool:
     identifier, _ = did.split("#") if "#" in did else [did, ""]
@@ -61,14 +71,38 @@ def is_key_event_id_valid(event_id: str) -> bool:
     return bool(KEY_ID_POSTFIX_REGEX.match(id_))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedIdentifier:
     network: str
     topic_id: str
     public_key_base58: str
 
 
+@lru_cache(maxsize=PARSED_IDENTIFIERS_CACHE_SIZE)
 def parse_identifier(identifier: str) -> ParsedIdentifier:
+    """Parse Hedera DID identifier.
+
+    Results are memoized, since the same identifiers are parsed for every message and event of a DID.
+    Parsing errors are not cached.
+
+    Args:
+        identifier: DID identifier
+
+    Returns:
+        Parsed identifier (shared between calls, so it's immutable)
+
+    Raises:
+        DidException: If identifier is invalid
+    """
+    match = HEDERA_DID_REGEX.fullmatch(identifier)
+    if match:
+        network, public_key_base58, topic_id = match.groups()
+        return ParsedIdentifier(network, topic_id, public_key_base58)
+
+    return _parse_identifier(identifier)
+
+
+def _parse_identifier(identifier: str) -> ParsedIdentifier:
     did_part, topic_id = (
         identifier.split(DID_TOPIC_SEPARATOR) if DID_TOPIC_SEPARATOR in identifier else [identifier, ""]
     )
@@ -1,11 +1,49 @@
-from .hcs_file import HcsFileChunkMessage, HcsFileService
-from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
-from .hcs_message_envelope import HcsMessageEnvelope
-from .hcs_message_resolver import HcsMessageResolver
-from .hcs_message_transaction import HcsMessageTransaction
-from .hcs_topic_listener import HcsTopicListener
-from .hcs_topic_service import HcsTopicOptions, HcsTopicService
-from .utils import execute_hcs_query_async, execute_hcs_transaction_async, sign_hcs_transaction_async
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .hcs_file import HcsFileChunkMessage, HcsFileService
+    from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
+    from .hcs_message_batch import HcsMessageBatch, HcsMessageBatchResult
+    from .hcs_message_envelope import HcsMessageEnvelope
+    from .hcs_message_resolver import HcsMessageResolver
+    from .hcs_message_transaction import HcsMessageTransaction
+    from .hcs_receipt_tracker import HcsReceiptTracker, HcsSubmissionSequencer
+    from .hcs_topic_listener import HcsTopicListener
+    from .hcs_topic_pool import HcsTopicPool
+    from .hcs_topic_service import HcsTopicOptions, HcsTopicService
+    from .utils import (
+        execute_hcs_query_async,
+        execute_hcs_transaction_async,
+        sign_hcs_transaction_async,
+        submit_hcs_transaction_async,
+    )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HcsMessage": ".hcs_message",
+        "HcsMessageWithResponseMetadata": ".hcs_message",
+        "HcsMessageEnvelope": ".hcs_message_envelope",
+        "HcsMessageResolver": ".hcs_message_resolver",
+        "HcsMessageTransaction": ".hcs_message_transaction",
+        "HcsMessageBatch": ".hcs_message_batch",
+        "HcsMessageBatchResult": ".hcs_message_batch",
+        "HcsReceiptTracker": ".hcs_receipt_tracker",
+        "HcsSubmissionSequencer": ".hcs_receipt_tracker",
+        "HcsTopicListener": ".hcs_topic_listener",
+        "HcsFileService": ".hcs_file",
+        "HcsFileChunkMessage": ".hcs_file",
+        "HcsTopicService": ".hcs_topic_service",
+        "HcsTopicOptions": ".hcs_topic_service",
+        "HcsTopicPool": ".hcs_topic_pool",
+        "execute_hcs_transaction_async": ".utils",
+        "submit_hcs_transaction_async": ".utils",
+        "execute_hcs_query_async": ".utils",
+        "sign_hcs_transaction_async": ".utils",
+    },
+)
 
 __all__ = [
     "HcsMessage",
@@ -13,12 +51,18 @@ __all__ = [
     "HcsMessageEnvelope",
     "HcsMessageResolver",
     "HcsMessageTransaction",
+    "HcsMessageBatch",
+    "HcsMessageBatchResult",
+    "HcsReceiptTracker",
+    "HcsSubmissionSequencer",
     "HcsTopicListener",
     "HcsFileService",
     "HcsFileChunkMessage",
     "HcsTopicService",
     "HcsTopicOptions",
+    "HcsTopicPool",
     "execute_hcs_transaction_async",
+    "submit_hcs_transaction_async",
     "execute_hcs_query_async",
     "sign_hcs_transaction_async",
 ]
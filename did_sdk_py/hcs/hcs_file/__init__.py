@@ -1,5 +1,20 @@
-from .hcs_file_chunk_message import HcsFileChunkMessage
-from .hcs_file_service import HcsFileService
-from .utils import build_file_from_chunk_messages, get_file_chunk_messages
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .hcs_file_chunk_message import HcsFileChunkMessage
+    from .hcs_file_service import HcsFileService
+    from .utils import build_file_from_chunk_messages, get_file_chunk_messages
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HcsFileService": ".hcs_file_service",
+        "HcsFileChunkMessage": ".hcs_file_chunk_message",
+        "get_file_chunk_messages": ".utils",
+        "build_file_from_chunk_messages": ".utils",
+    },
+)
 
 __all__ = ["HcsFileService", "HcsFileChunkMessage", "get_file_chunk_messages", "build_file_from_chunk_messages"]
@@ -10,9 +10,11 @@ from hedera import (
 )
 
 from ...hedera_client_provider import HederaClientProvider
+from ...utils.compression import get_compression_dictionary_id
 from ..constants import MAX_TRANSACTION_FEE
+from ..hcs_message_batch import HcsMessageBatch
 from ..hcs_message_resolver import HcsMessageResolver
-from ..hcs_message_transaction import HcsMessageTransaction
+from ..hcs_topic_pool import HcsTopicPool
 from ..hcs_topic_service import HcsTopicOptions, HcsTopicService
 from .hcs_file_chunk_message import HcsFileChunkMessage
 from .utils import build_file_from_chunk_messages, get_file_chunk_messages
@@ -25,11 +27,16 @@ LOGGER = logging.getLogger(__name__)
 
 
 class HcsFileService:
-    """Provides API for managing files on Hedera HCS according to HCS-1 standard"""
+    """Provides API for managing files on Hedera HCS according to HCS-1 standard
 
-    def __init__(self, client_provider: HederaClientProvider):
-        self._client = client_provider.get_client()
-        self._hcs_topic_service = HcsTopicService(client_provider)
+    Args:
+        client_provider: Hedera Client provider
+        topic_pool: Pool of pre-created topics to take file topics from
+    """
+
+    def __init__(self, client_provider: HederaClientProvider, topic_pool: HcsTopicPool | None = None):
+        self._client_provider = client_provider
+        self._hcs_topic_service = HcsTopicService(client_provider, topic_pool)
 
     async def submit_file(self, payload: bytes, submit_key_der: str) -> str:
         """Submit new file to HCS"""
@@ -37,25 +44,33 @@ class HcsFileService:
             submit_key = PrivateKey.fromString(submit_key_der)
             payload_hash = sha256(payload).hexdigest()
 
+            # Topic memo always follows HCS-1 standard, dictionary ID (if any) is stored in zstd frame header
             topic_memo = f"{payload_hash}:zstd:base64"
             topic_options = HcsTopicOptions(submit_key=submit_key.getPublicKey(), topic_memo=topic_memo)
 
             topic_id = await self._hcs_topic_service.create_topic(topic_options, [submit_key])
 
-            chunk_messages = get_file_chunk_messages(payload)
+            chunk_messages = get_file_chunk_messages(payload, get_compression_dictionary_id("hcs_file"))
 
-            for message in chunk_messages:
+            client = self._client_provider.get_client()
 
-                def build_message_submit_transaction(
-                    message_submit_transaction: TopicMessageSubmitTransaction,
-                ) -> Transaction:
-                    return (
-                        message_submit_transaction.setMaxTransactionFee(MAX_TRANSACTION_FEE)
-                        .freezeWith(self._client)
-                        .sign(submit_key)
-                    )
+            def build_message_submit_transaction(
+                message_submit_transaction: TopicMessageSubmitTransaction,
+            ) -> Transaction:
+                return (
+                    message_submit_transaction.setMaxTransactionFee(MAX_TRANSACTION_FEE)
+                    .freezeWith(client)
+                    .sign(submit_key)
+                )
+
+            # Chunks are ordered by index on file resolution, so they can be submitted concurrently
+            batch = HcsMessageBatch(build_message_submit_transaction, preserve_order=False)
+            for message in chunk_messages:
+                batch.add(topic_id, message)
 
-                await HcsMessageTransaction(topic_id, message, build_message_submit_transaction).execute(self._client)
+            for result in await batch.execute(client):
+                if result.error:
+                    raise result.error
 
             return topic_id
         except Exception as error:
@@ -75,7 +90,7 @@ class HcsFileService:
 
             resolved_messages = await HcsMessageResolver(
                 topic_id, HcsFileChunkMessage, READ_TOPIC_MESSAGES_TIMEOUT_SECONDS
-            ).execute(self._client)
+            ).execute(self._client_provider.get_client())
 
             chunk_messages = [cast(HcsFileChunkMessage, message) for message in resolved_messages]
             if len(chunk_messages) == 0:
@@ -1,13 +1,12 @@
-from zstandard import ZstdCompressor, ZstdDecompressor
-
+from ...utils.compression import compress, decompress
 from ...utils.encoding import b64_to_bytes, bytes_to_b64
 from ..constants import BASE64_JSON_CONTENT_PREFIX
 from .hcs_file_chunk_message import HcsFileChunkMessage
 
 
-def get_file_chunk_messages(payload: bytes) -> list[HcsFileChunkMessage]:
+def get_file_chunk_messages(payload: bytes, compression_dict_id: int | None = None) -> list[HcsFileChunkMessage]:
     try:
-        compressed_payload = ZstdCompressor().compress(payload)
+        compressed_payload = compress(payload, compression_dict_id)
         message_content = f"{BASE64_JSON_CONTENT_PREFIX}{bytes_to_b64(compressed_payload)}".encode()
 
         result: list[HcsFileChunkMessage] = []
@@ -33,6 +32,6 @@ def build_file_from_chunk_messages(chunk_messages: list[HcsFileChunkMessage]) ->
             message_content += chunk_message.content
 
         compressed_payload = b64_to_bytes(message_content.removeprefix(BASE64_JSON_CONTENT_PREFIX))
-        return ZstdDecompressor().decompress(compressed_payload)
+        return decompress(compressed_payload)
     except Exception as error:
         raise Exception(f"Error on building HCS-1 file payload from chunk messages: {error!s}") from error
@@ -1,27 +1,80 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from hashlib import sha256
+from typing import Self
 
 from ..utils.serializable import Serializable
 from ..utils.timestamp import Timestamp
 
 
 class HcsMessage(ABC, Serializable):
-    """Base class for HCS messages"""
+    """Base class for HCS messages
+
+    Messages are treated as immutable once serialized: canonical JSON encoding and payload hash are computed once and
+    reused for hashing, signing and submission. Messages parsed from HCS keep their received content as encoding, so
+    they're hashed without re-encoding. Methods that change message content after serialization need to call
+    '_reset_json_encoding'.
+
+    Messages that are kept in memory in large numbers can use slots, in that case memoized encoding attributes
+    ('_json_bytes', '_json_str', '_payload_hash') need to be declared in subclass slots.
+    """
+
+    __slots__ = ()
+
+    _json_bytes: bytes | None
+    _json_str: str | None
+    _payload_hash: str | None
 
     @abstractmethod
     def is_valid(self, topic_id: str | None = None) -> bool:
         """Validate the message against specific HCS topic"""
 
+    @classmethod
+    def from_json(cls, json_str: str | bytes) -> Self:
+        message = super().from_json(json_str)
+
+        if isinstance(json_str, str):
+            message._json_str = json_str
+            message._json_bytes = json_str.encode()
+        else:
+            message._json_bytes = bytes(json_str)
+
+        return message
+
+    def to_json(self) -> str:
+        json_str = getattr(self, "_json_str", None)
+        if json_str is None:
+            json_str = self._json_str = self.to_json_bytes().decode()
+
+        return json_str
+
+    def to_json_bytes(self) -> bytes:
+        """Get canonical JSON encoding of the message as UTF-8 bytes."""
+        json_bytes = getattr(self, "_json_bytes", None)
+        if json_bytes is None:
+            json_bytes = self._json_bytes = super().to_json().encode()
+
+        return json_bytes
+
     def get_payload_hash(self) -> str:
-        return sha256(self.to_json().encode()).hexdigest()
+        payload_hash = getattr(self, "_payload_hash", None)
+        if payload_hash is None:
+            payload_hash = self._payload_hash = sha256(self.to_json_bytes()).hexdigest()
+
+        return payload_hash
+
+    def _reset_json_encoding(self):
+        """Drop memoized encoding. Needs to be called if message content is changed after serialization."""
+        self._json_bytes = None
+        self._json_str = None
+        self._payload_hash = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HcsMessageWithResponseMetadata:
     message: HcsMessage
     consensus_timestamp: Timestamp
-    sequence_number: float
+    sequence_number: int
 
     def get_payload_hash(self) -> str:
         return self.message.get_payload_hash()
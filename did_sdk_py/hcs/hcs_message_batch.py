@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Self, cast
+
+from hedera import Client, TopicId, TopicMessageSubmitTransaction, Transaction, TransactionReceipt
+
+from ..utils.executor import HederaExecutor, get_executor
+from .hcs_message import HcsMessage
+from .utils import execute_hcs_transaction_async
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+
+@dataclass(frozen=True)
+class HcsMessageBatchResult:
+    """Result of a single message submission in batch.
+
+    Attributes:
+        topic_id: Topic ID the message was submitted to
+        message: Submitted message
+        receipt: Transaction receipt, if message was submitted successfully
+        error: Submission error, if message was not submitted
+    """
+
+    topic_id: str
+    message: HcsMessage
+    receipt: TransactionReceipt | None = None
+    error: Exception | None = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _BatchItem:
+    index: int
+    topic_id: str
+    message: HcsMessage
+    content: str
+
+
+class HcsMessageBatch:
+    """Submits multiple HCS messages (for one or more topics) concurrently.
+
+    Messages are validated and serialized upfront, transactions are built (frozen and signed by transaction builder)
+    and executed in SDK executor. Number of transactions in flight is limited by 'max_in_flight'.
+
+    If 'preserve_order' is set, messages for the same topic are submitted one by one in the order they were added (and
+    remaining messages for topic are skipped after a failure), so only messages for different topics are submitted
+    concurrently. Otherwise, all messages are submitted concurrently and may reach consensus in any order.
+
+    Args:
+        transaction_builder: Function that finalizes message submit transaction (sets fee, freezes and signs)
+        max_in_flight: Max number of transactions submitted concurrently
+        preserve_order: Submit messages for the same topic in order
+        executor: SDK executor to build and execute transactions with. If not provided, shared SDK executor is used
+    """
+
+    def __init__(
+        self,
+        transaction_builder: Callable[[TopicMessageSubmitTransaction], Transaction] | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        preserve_order: bool = True,
+        executor: HederaExecutor | None = None,
+    ):
+        if max_in_flight < 1:
+            raise Exception("Max number of transactions in flight must be positive")
+
+        self._transaction_builder = transaction_builder
+        self._max_in_flight = max_in_flight
+        self._preserve_order = preserve_order
+        self._executor = executor
+
+        self._messages: list[tuple[str, HcsMessage]] = []
+
+        self.executed = False
+
+    def add(self, topic_id: str, message: HcsMessage) -> Self:
+        """Add message to batch.
+
+        Args:
+            topic_id: Topic ID to submit message to
+            message: HCS message
+
+        Returns:
+            Batch instance
+        """
+        if self.executed:
+            raise Exception("This batch has already been executed")
+
+        self._messages.append((topic_id, message))
+        return self
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    async def execute(self, client: Client) -> list[HcsMessageBatchResult]:
+        """Submit batch messages.
+
+        Args:
+            client: Hedera Client
+
+        Returns:
+            Submission results, in the order messages were added
+        """
+        if self.executed:
+            raise Exception("This batch has already been executed")
+
+        self.executed = True
+
+        results: list[HcsMessageBatchResult | None] = [None] * len(self._messages)
+        items_by_topic: dict[str, list[_BatchItem]] = {}
+
+        for index, (topic_id, message) in enumerate(self._messages):
+            if not message.is_valid(topic_id):
+                results[index] = HcsMessageBatchResult(topic_id, message, error=Exception("HCS message is not valid"))
+                continue
+
+            items_by_topic.setdefault(topic_id, []).append(_BatchItem(index, topic_id, message, message.to_json()))
+
+        submit = self._get_submit_function(client, results)
+
+        if self._preserve_order:
+            await asyncio.gather(*(self._submit_in_order(items, submit, results) for items in items_by_topic.values()))
+        else:
+            await asyncio.gather(*(submit(item) for items in items_by_topic.values() for item in items))
+
+        return cast(list[HcsMessageBatchResult], results)
+
+    def _get_submit_function(
+        self, client: Client, results: list[HcsMessageBatchResult | None]
+    ) -> Callable[[_BatchItem], Awaitable[bool]]:
+        executor = self._executor or get_executor()
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        async def submit(item: _BatchItem) -> bool:
+            async with semaphore:
+                try:
+                    transaction = await executor.run(lambda: self._build_transaction(item))
+                    receipt = await execute_hcs_transaction_async(transaction, client, executor)
+                    results[item.index] = HcsMessageBatchResult(item.topic_id, item.message, receipt=receipt)
+                    return True
+                except Exception as error:
+                    results[item.index] = HcsMessageBatchResult(item.topic_id, item.message, error=error)
+                    return False
+
+        return submit
+
+    @staticmethod
+    async def _submit_in_order(
+        items: list[_BatchItem],
+        submit: Callable[[_BatchItem], Awaitable[bool]],
+        results: list[HcsMessageBatchResult | None],
+    ):
+        for position, item in enumerate(items):
+            if not await submit(item):
+                skip_error = Exception(f"Skipped after failed submission of previous message to '{item.topic_id}'")
+                for skipped_item in items[position + 1 :]:
+                    results[skipped_item.index] = HcsMessageBatchResult(
+                        skipped_item.topic_id, skipped_item.message, error=skip_error
+                    )
+                return
+
+    def _build_transaction(self, item: _BatchItem) -> Transaction:
+        transaction = TopicMessageSubmitTransaction().setTopicId(TopicId.fromString(item.topic_id))
+        transaction.setMessage(item.content)
+        return self._transaction_builder(transaction) if self._transaction_builder else transaction
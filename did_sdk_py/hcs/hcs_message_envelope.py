@@ -21,10 +21,11 @@ class HcsMessageEnvelope(HcsMessage):
         if self.signature:
             raise Exception("Message is already signed")
 
-        message_bytes = self.message.to_json().encode()
+        message_bytes = self.message.to_json_bytes()
         signature_bytes = bytes(signing_key.sign(message_bytes))
 
         self.signature = bytes_to_b64(signature_bytes)
+        self._reset_json_encoding()
 
     def is_valid(self, topic_id: str | None = None) -> bool:
         if not self.message or not self.signature:
@@ -1,23 +1,32 @@
 import asyncio
 import logging
+import threading
 import time
-from asyncio import Future
-from threading import Timer
+from asyncio import AbstractEventLoop, Future, TimerHandle
+from collections.abc import AsyncIterator
+from threading import Semaphore
+from typing import cast
 
 from hedera import Client
 
+from ..utils.executor import get_executor
 from ..utils.pyjnius import ErrorHandlerBiConsumer, Runnable
 from ..utils.timestamp import Timestamp
 from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
 from .hcs_message_envelope import HcsMessageEnvelope
-from .hcs_topic_listener import HcsTopicListener
+from .hcs_topic_listener import DEFAULT_FLUSH_INTERVAL_SECONDS, HcsTopicListener
 
 DEFAULT_TIMEOUT_SECONDS = float(5)
 
+DEFAULT_STREAM_QUEUE_SIZE = 1000
+QUEUE_SLOT_WAIT_INTERVAL_SECONDS = 0.1
+
 TOPIC_UNSUBSCRIBED_ERROR = "CANCELLED: unsubscribe"
 
 LOGGER = logging.getLogger(__name__)
 
+_STREAM_END = object()
+
 
 class HcsMessageResolver:
     def __init__(
@@ -29,24 +38,34 @@ class HcsMessageResolver:
         timestamp_to: Timestamp | None = None,
         limit: int | None = None,
         include_response_metadata: bool = False,
+        batch_size: int | None = None,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
     ):
         self.topic_id = topic_id
         self._topic_listener = HcsTopicListener(
             topic_id, message_type, include_response_metadata=include_response_metadata
         )
+        if batch_size:
+            self._topic_listener.set_batching(batch_size, flush_interval_seconds)
         self._message_type = message_type
 
         self._message_waiting_timeout = timeout_seconds
-        self._last_message_arrival_time: float = time.time()
+        self._last_message_arrival_time: float = time.monotonic()
 
         self._timestamp_from = timestamp_from
         self._timestamp_to = timestamp_to
         self._limit = limit
 
-        self._messages: list[HcsMessage | HcsMessageWithResponseMetadata] = []
-        self._received_message_hashes: list[str] = []
+        self._received_message_hashes: set[str] = set()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queue_slots = Semaphore(DEFAULT_STREAM_QUEUE_SIZE)
+        self._loop: AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._is_waiting_for_queue_slot = False
+        self._is_completed = False
+        self._is_closed = False
 
-        self._waiting_timer: Timer | None = None
+        self._waiting_timer: TimerHandle | None = None
 
         # IMPORTANT
         # We need to store 'PythonJavaClass' reference as long as it can be used by Java to prevent it being cleaned up by Python GC
@@ -55,9 +74,37 @@ class HcsMessageResolver:
         self._java_query_completion_handler: Runnable | None = None
 
     async def execute(self, client: Client) -> list[HcsMessage | HcsMessageWithResponseMetadata]:
-        self._received_message_hashes = []
-
-        completion_future = asyncio.get_running_loop().create_future()
+        return [message async for message in self.stream(client)]
+
+    async def stream(
+        self, client: Client, max_queue_size: int = DEFAULT_STREAM_QUEUE_SIZE
+    ) -> AsyncIterator[HcsMessage | HcsMessageWithResponseMetadata]:
+        """Stream topic messages as they arrive.
+
+        Messages are passed from listener thread through a bounded queue. If consumer falls behind, listener thread is
+        blocked until queue has free slots, which pauses mirror node subscription delivery.
+        Subscription is cancelled if consumer stops iteration early and closes the iterator (see 'contextlib.aclosing').
+
+        Args:
+            client: Hedera Client
+            max_queue_size: Maximum number of messages waiting for consumer
+
+        Returns:
+            Async iterator over topic messages
+        """
+        loop = asyncio.get_running_loop()
+
+        self._received_message_hashes = set()
+        self._queue = asyncio.Queue()
+        self._queue_slots = Semaphore(max_queue_size)
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._is_waiting_for_queue_slot = False
+        self._is_completed = False
+        self._is_closed = False
+
+        completion_future = loop.create_future()
+        completion_future.add_done_callback(lambda _: self._queue.put_nowait(_STREAM_END))
 
         def handle_completion():
             self._complete(completion_future)
@@ -65,8 +112,8 @@ class HcsMessageResolver:
         self._java_query_completion_handler = Runnable(handle_completion)
 
         def handle_error(error: Exception):
-            if not completion_future.done() and str(error) != TOPIC_UNSUBSCRIBED_ERROR:
-                completion_future.set_exception(error)
+            if str(error) != TOPIC_UNSUBSCRIBED_ERROR:
+                loop.call_soon_threadsafe(self._set_exception, completion_future, error)
 
         self._java_error_handler = ErrorHandlerBiConsumer(handle_error)
 
@@ -83,15 +130,39 @@ class HcsMessageResolver:
             .subscribe(client, self._handle_message)
         )
 
-        self._last_message_arrival_time = time.time()
+        self._last_message_arrival_time = time.monotonic()
         self._wait_or_complete(completion_future)
 
-        await completion_future
+        try:
+            while True:
+                item = await self._queue.get()
+                if item is _STREAM_END:
+                    break
+
+                self._queue_slots.release()
+
+                yield item
+
+            # Raises subscription error, if any
+            completion_future.result()
+        finally:
+            self._is_closed = True
+            self._cancel_waiting_timer()
+
+            if not self._is_completed:
+                # Stream is closed by consumer before completion or subscription has failed
+                # Unsubscribe is a blocking Java call, so it's not run on event loop
+                get_executor().submit(self._topic_listener.unsubscribe)
 
-        return completion_future.result()
+            if not completion_future.done():
+                completion_future.cancel()
 
     def _handle_message(self, message: HcsMessage | HcsMessageWithResponseMetadata):
-        self._last_message_arrival_time = time.time()
+        # Called from listener thread, idle timer running on event loop picks up arrival time on its next check
+        self._last_message_arrival_time = time.monotonic()
+
+        if self._is_closed:
+            return
 
         if isinstance(message, HcsMessageEnvelope) and not message.signature:
             LOGGER.warning("Received message envelope with missing signature, skipping...")
@@ -103,26 +174,72 @@ class HcsMessageResolver:
             LOGGER.warning("Received message duplicate, skipping...")
             return
 
-        self._received_message_hashes.append(message_hash)
-        self._messages.append(message)
+        self._received_message_hashes.add(message_hash)
+        self._enqueue(message)
+
+    def _enqueue(self, message: HcsMessage | HcsMessageWithResponseMetadata):
+        self._is_waiting_for_queue_slot = True
+        try:
+            while not self._queue_slots.acquire(timeout=QUEUE_SLOT_WAIT_INTERVAL_SECONDS):
+                if self._is_closed:
+                    return
+        finally:
+            self._is_waiting_for_queue_slot = False
+            self._last_message_arrival_time = time.monotonic()
+
+        cast(AbstractEventLoop, self._loop).call_soon_threadsafe(self._queue.put_nowait, message)
 
     def _complete(self, future: Future):
-        future.get_loop().call_soon_threadsafe(future.set_result, self._messages)
+        """Complete subscription, called by mirror subscription (from Java thread) or idle timer (on event loop)."""
+        self._is_completed = True
 
-        if self._waiting_timer:
-            self._waiting_timer.cancel()
+        # Listener flush can wait for consumer (backpressure) and unsubscribe is a blocking Java call,
+        # so both are moved off event loop thread
+        if threading.get_ident() == self._loop_thread_id:
+            get_executor().submit(lambda: self._finish_subscription(future))
+        else:
+            self._finish_subscription(future)
+
+    def _finish_subscription(self, future: Future):
+        # Deliver messages that are still buffered by listener (if batching is enabled)
+        self._topic_listener.flush()
+
+        future.get_loop().call_soon_threadsafe(self._set_result, future)
 
         self._topic_listener.unsubscribe()
 
+    def _set_result(self, future: Future):
+        self._cancel_waiting_timer()
+
+        # Completion can be reported by both mirror subscription and idle timer
+        if not future.done():
+            future.set_result(None)
+
+    def _set_exception(self, future: Future, error: Exception):
+        self._cancel_waiting_timer()
+
+        if not future.done():
+            future.set_exception(error)
+
+    def _cancel_waiting_timer(self):
+        if self._waiting_timer:
+            self._waiting_timer.cancel()
+            self._waiting_timer = None
+
     def _wait_or_complete(self, future: Future):
-        time_diff = time.time() - self._last_message_arrival_time
+        """Check idle timeout, runs on the event loop."""
+        if future.done():
+            return
+
+        # Listener waiting for consumer (backpressure) is not considered idle
+        if self._is_waiting_for_queue_slot:
+            self._last_message_arrival_time = time.monotonic()
+
+        time_diff = time.monotonic() - self._last_message_arrival_time
 
         if time_diff <= self._message_waiting_timeout:
-            if self._waiting_timer:
-                self._waiting_timer.cancel()
             timer_interval = self._message_waiting_timeout - time_diff
-            self._waiting_timer = Timer(timer_interval, self._wait_or_complete, [future])
-            self._waiting_timer.start()
-            return
+            self._waiting_timer = future.get_loop().call_later(timer_interval, self._wait_or_complete, future)
         else:
+            self._waiting_timer = None
             self._complete(future)
@@ -1,9 +1,11 @@
+from asyncio import Future
 from collections.abc import Callable
 
-from hedera import Client, TopicId, TopicMessageSubmitTransaction, Transaction
+from hedera import Client, TopicId, TopicMessageSubmitTransaction, Transaction, TransactionReceipt
 
 from .hcs_message import HcsMessage
-from .utils import execute_hcs_transaction_async
+from .hcs_receipt_tracker import HcsReceiptTracker
+from .utils import execute_hcs_transaction_async, submit_hcs_transaction_async
 
 
 class HcsMessageTransaction:
@@ -19,7 +21,19 @@ class HcsMessageTransaction:
 
         self.executed = False
 
-    async def execute(self, client: Client):
+    async def execute(
+        self, client: Client, receipt_tracker: HcsReceiptTracker | None = None
+    ) -> Future[TransactionReceipt] | None:
+        """Execute message submit transaction.
+
+        Args:
+            client: Hedera Client
+            receipt_tracker: If provided, transaction is considered executed once it's accepted by network node,
+                receipt is fetched in background by tracker
+
+        Returns:
+            Future of transaction receipt, if receipt tracker is provided
+        """
         if self.executed:
             raise Exception("This transaction has already been executed")
 
@@ -35,6 +49,12 @@ class HcsMessageTransaction:
         if self._transaction_builder:
             transaction = self._transaction_builder(transaction)
 
+        if receipt_tracker:
+            transaction_response = await submit_hcs_transaction_async(transaction, client)
+            self.executed = True
+            return receipt_tracker.track(transaction_response, client)
+
         await execute_hcs_transaction_async(transaction, client)
 
         self.executed = True
+        return None
@@ -0,0 +1,232 @@
+import asyncio
+import logging
+from asyncio import Future, Task
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import cast
+
+from hedera import Client, TransactionReceipt, TransactionResponse
+
+from ..utils.executor import HederaExecutor, get_executor
+
+DEFAULT_RECEIPT_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _get_receipts(
+    batch: list[tuple[TransactionResponse, Client, Future]],
+) -> list[TransactionReceipt | Exception]:
+    # Receipts in a batch are fetched one after another - only the first call is likely to wait for consensus,
+    # transactions submitted around the same time are usually already settled by then
+    results = []
+    for transaction_response, client, _ in batch:
+        try:
+            results.append(transaction_response.getReceipt(client))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+class HcsReceiptTracker:
+    """Confirms submitted HCS transactions in background.
+
+    Transactions submitted with tracker are considered done as soon as network node accepts them, so submission
+    throughput is not limited by receipt latency. Receipts are then fetched in batches, result of every transaction is
+    available via future returned by 'track'. Failures are also reported to error handler (or logged, if not provided).
+
+    IMPORTANT: Transactions that are not confirmed yet can reach consensus in a different order than they were
+    submitted. Use tracker only for messages that do not depend on each other, or submit dependent messages through
+    'HcsSubmissionSequencer' (which keeps their submission order).
+
+    Args:
+        batch_size: Max number of receipts fetched in a single batch
+        max_concurrent_batches: Max number of batches fetched concurrently
+        error_handler: Handler called with transaction ID and error for every failed transaction
+        executor: SDK executor to fetch receipts with. If not provided, shared SDK executor is used
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_RECEIPT_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+        error_handler: Callable[[str, Exception], None] | None = None,
+        executor: HederaExecutor | None = None,
+    ):
+        if batch_size < 1 or max_concurrent_batches < 1:
+            raise Exception("Receipt batch size and max concurrent batches must be positive")
+
+        self._batch_size = batch_size
+        self._max_concurrent_batches = max_concurrent_batches
+        self._error_handler = error_handler
+        self._executor = executor
+
+        self._queue: deque[tuple[TransactionResponse, Client, Future]] = deque()
+        self._unconfirmed: set[Future] = set()
+        self._batch_tasks: set[Task] = set()
+
+    def track(self, transaction_response: TransactionResponse, client: Client) -> Future[TransactionReceipt]:
+        """Track confirmation of submitted transaction.
+
+        Args:
+            transaction_response: Response of submitted transaction
+            client: Hedera Client used to submit transaction
+
+        Returns:
+            Future resolved with transaction receipt or failed with receipt error
+        """
+        future: Future[TransactionReceipt] = asyncio.get_running_loop().create_future()
+        transaction_id = str(transaction_response.transactionId.toString())
+
+        self._unconfirmed.add(future)
+        future.add_done_callback(lambda _: self._handle_confirmation(future, transaction_id))
+
+        self._queue.append((transaction_response, client, future))
+        self._schedule_batches()
+
+        return future
+
+    def get_pending_count(self) -> int:
+        """Get number of submitted transactions that are not confirmed yet."""
+        return len(self._unconfirmed)
+
+    async def wait_for_pending(self):
+        """Wait until all tracked transactions are confirmed or failed. Errors are not raised here."""
+        while self._unconfirmed:
+            await asyncio.gather(*self._unconfirmed, return_exceptions=True)
+
+    def _schedule_batches(self):
+        while self._queue and len(self._batch_tasks) < self._max_concurrent_batches:
+            task = asyncio.create_task(self._confirm_batches())
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _confirm_batches(self):
+        executor = self._executor or get_executor()
+
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+
+            try:
+                results = await executor.run(lambda batch=batch: _get_receipts(batch))
+            except Exception as error:
+                results = [error] * len(batch)
+
+            for (_, _, future), result in zip(batch, results, strict=True):
+                if future.done():
+                    continue
+
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _handle_confirmation(self, future: Future, transaction_id: str):
+        self._unconfirmed.discard(future)
+
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if not error:
+            return
+
+        if self._error_handler:
+            self._error_handler(transaction_id, cast(Exception, error))
+        else:
+            LOGGER.error(f"Transaction '{transaction_id}' has failed: {error!s}")
+
+
+class HcsSubmissionSequencer:
+    """Keeps submission order of dependent HCS messages that are confirmed in background (see 'HcsReceiptTracker').
+
+    Messages to the same topic are submitted one by one, in the order of 'submit' calls. Next message is submitted as
+    soon as network node accepts the previous one, without waiting for its receipt, so dependent messages are
+    pipelined and receipts are confirmed asynchronously. Messages to different topics are not delayed.
+
+    IMPORTANT: Messages reach the network in submission order, but consensus order of messages that are in flight at
+    the same time is not guaranteed by the network. Use 'wait_for_pending' before submitting a message that requires
+    previous messages to reach consensus first (i.e. topic key change), or set 'wait_for_receipts' if every message
+    depends on the previous one.
+
+    Args:
+        wait_for_receipts: Submit next message only after previous one is confirmed (or failed), so messages always
+            reach consensus in order. Submission throughput of a topic is limited by receipt latency then
+    """
+
+    def __init__(self, wait_for_receipts: bool = False):
+        self._wait_for_receipts = wait_for_receipts
+
+        # Completion of the latest submission (accepted by network node or failed), by topic ID
+        self._submissions: dict[str, Future[None]] = {}
+
+        # Receipts of submitted messages that are not confirmed yet, by topic ID
+        self._unconfirmed: dict[str, set[Future[TransactionReceipt]]] = {}
+
+    async def submit(
+        self, topic_id: str, submit: Callable[[], Awaitable[Future[TransactionReceipt] | None]]
+    ) -> Future[TransactionReceipt] | None:
+        """Submit message once previous submission to the same topic is accepted by network node (or confirmed).
+
+        Args:
+            topic_id: HCS topic ID
+            submit: Coroutine function that submits message, returns future of transaction receipt if receipt is
+                confirmed in background
+
+        Returns:
+            Future of transaction receipt, as returned by 'submit'
+        """
+        previous = self._submissions.get(topic_id)
+        submission: Future[None] = asyncio.get_running_loop().create_future()
+        self._submissions[topic_id] = submission
+
+        def complete(_=None):
+            if not submission.done():
+                submission.set_result(None)
+            if self._submissions.get(topic_id) is submission:
+                del self._submissions[topic_id]
+
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            receipt = await submit()
+        except BaseException:
+            # Next submission still has to wait for previous one, if this one was cancelled while waiting for it
+            if previous is not None and not previous.done():
+                previous.add_done_callback(complete)
+            else:
+                complete()
+            raise
+
+        if receipt is not None:
+            self._track_receipt(topic_id, receipt)
+
+        if receipt is not None and self._wait_for_receipts:
+            receipt.add_done_callback(complete)
+        else:
+            complete()
+
+        return receipt
+
+    async def wait_for_pending(self, topic_id: str):
+        """Wait until all submissions to the topic are confirmed or failed. Errors are not raised here."""
+        while True:
+            submission = self._submissions.get(topic_id)
+            pending = [*self._unconfirmed.get(topic_id, ()), *([submission] if submission else [])]
+            if not pending:
+                return
+
+            await asyncio.wait(pending)
+
+    def _track_receipt(self, topic_id: str, receipt: Future[TransactionReceipt]):
+        unconfirmed = self._unconfirmed.setdefault(topic_id, set())
+        unconfirmed.add(receipt)
+
+        def confirm(_):
+            unconfirmed.discard(receipt)
+            if not unconfirmed and self._unconfirmed.get(topic_id) is unconfirmed:
+                del self._unconfirmed[topic_id]
+
+        receipt.add_done_callback(confirm)
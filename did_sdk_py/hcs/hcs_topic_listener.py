@@ -1,12 +1,19 @@
+import asyncio
 import logging
+from asyncio import AbstractEventLoop
 from collections.abc import Callable
+from threading import Lock
+from typing import cast
 
 from hedera import Client, JDuration, MirrorResponse, PyConsumer, TopicId, TopicMessageQuery
 
+from ..utils.executor import get_executor
 from ..utils.pyjnius import ErrorHandlerBiConsumer, Runnable
 from ..utils.timestamp import Timestamp
 from .hcs_message import HcsMessage, HcsMessageWithResponseMetadata
 
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.1
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -24,6 +31,15 @@ class HcsTopicListener:
         self._subscription_handle = None
         self._invalid_message_handler = None
 
+        self._batch_size: int | None = None
+        self._flush_interval_seconds: float = 0
+        self._buffer: list[MirrorResponse] = []
+        self._buffer_lock = Lock()
+        self._flush_lock = Lock()
+        self._is_flush_scheduled = False
+        self._loop: AbstractEventLoop | None = None
+        self._receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None] | None = None
+
         # IMPORTANT
         # We need to store 'PythonJavaClass' reference as long as it can be used by Java to prevent it being cleaned up by Python GC
         # Otherwise, intermittent segmentation faults and other hard-to-debug issues are possible
@@ -65,9 +81,41 @@ class HcsTopicListener:
         self._invalid_message_handler = invalid_message_handler
         return self
 
+    def set_batching(self, batch_size: int, flush_interval_seconds: float):
+        """Enable buffered message delivery.
+
+        Responses are processed in batches, once batch size is reached or flush interval has passed since the first
+        buffered response. Batching doesn't reduce the number of mirror node callbacks (responses are still received
+        one by one), it only groups message processing. Flush timer runs on the event loop the listener is subscribed
+        from, while flush itself runs on SDK executor.
+
+        Args:
+            batch_size: Maximum number of buffered responses
+            flush_interval_seconds: Maximum time a response can stay in the buffer
+        """
+        if batch_size < 1:
+            raise Exception("Batch size must be positive")
+
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        return self
+
     def subscribe(self, client: Client, receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None]):
-        def handle_message(response):
-            self._handle_response(response, receiver)
+        self._receiver = receiver
+
+        if self._batch_size:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError as error:
+                raise Exception("Batched message delivery requires running event loop") from error
+
+            def handle_message(response: MirrorResponse):
+                self._buffer_response(response)
+
+        else:
+
+            def handle_message(response: MirrorResponse):
+                self._handle_response(response, receiver)
 
         self._java_consumer_reference = PyConsumer(handle_message)
 
@@ -78,8 +126,52 @@ class HcsTopicListener:
             self._subscription_handle.unsubscribe()
         self._java_consumer_reference = None
 
+        with self._buffer_lock:
+            self._buffer = []
+
+    def flush(self):
+        """Process buffered responses. No-op if batching is not enabled."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+                self._is_flush_scheduled = False
+
+            # Batches are drained and processed under the same lock to keep delivery order
+            if self._receiver:
+                for response in batch:
+                    self._handle_response(response, self._receiver)
+
+    def _buffer_response(self, response: MirrorResponse):
+        with self._buffer_lock:
+            self._buffer.append(response)
+            is_full = len(self._buffer) >= (self._batch_size or 1)
+
+            schedule_flush = not is_full and not self._is_flush_scheduled
+            if schedule_flush:
+                self._is_flush_scheduled = True
+
+        if is_full:
+            self.flush()
+        elif schedule_flush:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        # Scheduled flush is not cancelled when batch is flushed earlier, it just flushes the following batch earlier
+        try:
+            loop = cast(AbstractEventLoop, self._loop)
+            loop.call_soon_threadsafe(loop.call_later, self._flush_interval_seconds, self._submit_flush)
+        except RuntimeError:
+            # Event loop is closed, buffered responses are not awaited anymore
+            self.flush()
+
+    def _submit_flush(self):
+        # Flush can wait for consumer (backpressure), so it's not run on event loop
+        get_executor().submit(self.flush)
+
     def _handle_response(
-        self, response: MirrorResponse, receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None]
+        self,
+        response: MirrorResponse,
+        receiver: Callable[[HcsMessage | HcsMessageWithResponseMetadata], None],
     ):
         if len(self._filters) > 0:
             for response_filter in self._filters:
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+
+from hedera import PrivateKey
+
+from ..hedera_client_provider import HederaClientProvider
+from .hcs_topic_service import HcsTopicOptions, HcsTopicService
+
+DEFAULT_TARGET_SIZE = 8
+DEFAULT_LOW_WATER_MARK = 4
+DEFAULT_REFILL_CONCURRENCY = 4
+
+# Max number of unregistered profiles (topic keys) remembered after first pool miss (oldest are evicted first)
+MAX_TRACKED_PROFILE_MISSES = 1024
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _TopicProfile:
+    # Options topics are pre-created with (topic memo is set on hand-out)
+    topic_options: HcsTopicOptions
+    signing_keys: list[PrivateKey]
+    # Admin key is used only to set topic memo on hand-out and is cleared afterwards
+    has_temporary_admin_key: bool
+    topic_ids: deque[str] = field(default_factory=deque)
+    refill_task: asyncio.Task | None = None
+    refill_error: BaseException | None = None
+
+
+def _get_profile_key(topic_options: HcsTopicOptions) -> tuple:
+    return (
+        topic_options.submit_key.toStringDER(),
+        topic_options.admin_key.toStringDER() if topic_options.admin_key else None,
+        topic_options.max_transaction_fee_hbar,
+        bool(topic_options.topic_memo),
+    )
+
+
+class HcsTopicPool:
+    """Pool of pre-created HCS topics.
+
+    Topics are created in background ahead of demand, separately for every combination of topic keys (profile).
+    When number of available topics for a profile drops below low-water mark, pool is refilled up to target size.
+    Profile is registered explicitly via 'prefill' or on the second request of a topic with corresponding keys, so keys
+    that are used only once (i.e. fresh keys of every registration) never trigger topics creation.
+
+    Topic memo cannot be known in advance, so it's set on hand-out. If requested topic has memo but no admin key,
+    pooled topic is created with first signing key as admin key, which is cleared on hand-out (topic becomes immutable).
+
+    Pool keeps signing keys of registered profiles in memory. Topics left in pool on 'close' are not deleted.
+
+    Args:
+        client_provider: Hedera Client provider
+        target_size: Number of available topics per profile to refill pool up to
+        low_water_mark: Number of available topics per profile that triggers refill
+        refill_concurrency: Max number of topics created concurrently per profile
+    """
+
+    def __init__(
+        self,
+        client_provider: HederaClientProvider,
+        target_size: int = DEFAULT_TARGET_SIZE,
+        low_water_mark: int = DEFAULT_LOW_WATER_MARK,
+        refill_concurrency: int = DEFAULT_REFILL_CONCURRENCY,
+    ):
+        if target_size < 1:
+            raise Exception("Topic pool target size must be positive")
+
+        if not 0 <= low_water_mark <= target_size:
+            raise Exception("Topic pool low-water mark must be between zero and target size")
+
+        self._hcs_topic_service = HcsTopicService(client_provider)
+        self._target_size = target_size
+        self._low_water_mark = low_water_mark
+        self._refill_concurrency = max(1, refill_concurrency)
+
+        self._profiles: dict[tuple, _TopicProfile] = {}
+        self._missed_profile_keys: OrderedDict[tuple, None] = OrderedDict()
+        self._is_closed = False
+
+    async def prefill(self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]):
+        """Register topic profile and wait until pool is filled up to target size.
+
+        Args:
+            topic_options: Options of topics to pre-create (topic memo is ignored)
+            signing_keys: Keys required to sign topic creation (and memo update) transactions
+
+        Raises:
+            Exception: If pool refill has failed
+        """
+        profile = self._get_or_register_profile(topic_options, signing_keys)
+
+        self._schedule_refill(profile, force=True)
+        if profile.refill_task:
+            await asyncio.shield(profile.refill_task)
+
+        if profile.refill_error:
+            raise Exception(f"Failed to prefill topic pool: {profile.refill_error!s}")
+
+    async def take_topic(self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]) -> str | None:
+        """Take pre-created topic matching provided options.
+
+        Topic memo is updated, if required. Pool refill is scheduled in background, if needed.
+
+        Args:
+            topic_options: Requested topic options
+            signing_keys: Keys required to sign topic creation (and memo update) transactions
+
+        Returns:
+            Topic ID or None, if there are no available topics in pool
+        """
+        if self._is_closed:
+            return None
+
+        profile = self._get_profile_on_repeated_request(topic_options, signing_keys)
+        if not profile:
+            return None
+
+        topic_id = profile.topic_ids.popleft() if profile.topic_ids else None
+
+        self._schedule_refill(profile)
+
+        if topic_id and topic_options.topic_memo:
+            await self._hcs_topic_service.update_topic(
+                topic_id, topic_options, profile.signing_keys, clear_admin_key=profile.has_temporary_admin_key
+            )
+
+        return topic_id
+
+    def get_available_topics_count(self, topic_options: HcsTopicOptions) -> int:
+        """Get number of available pre-created topics matching provided options."""
+        profile = self._profiles.get(_get_profile_key(topic_options))
+        return len(profile.topic_ids) if profile else 0
+
+    async def close(self):
+        """Stop pool refills. Already created topics are not handed out anymore."""
+        self._is_closed = True
+
+        refill_tasks = [profile.refill_task for profile in self._profiles.values() if profile.refill_task]
+        for task in refill_tasks:
+            task.cancel()
+
+        await asyncio.gather(*refill_tasks, return_exceptions=True)
+
+    def _get_profile_on_repeated_request(
+        self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]
+    ) -> _TopicProfile | None:
+        profile_key = _get_profile_key(topic_options)
+        if profile_key in self._profiles:
+            return self._profiles[profile_key]
+
+        if profile_key in self._missed_profile_keys:
+            del self._missed_profile_keys[profile_key]
+            return self._get_or_register_profile(topic_options, signing_keys)
+
+        self._missed_profile_keys[profile_key] = None
+        if len(self._missed_profile_keys) > MAX_TRACKED_PROFILE_MISSES:
+            self._missed_profile_keys.popitem(last=False)
+
+        return None
+
+    def _get_or_register_profile(self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]) -> _TopicProfile:
+        profile_key = _get_profile_key(topic_options)
+        profile = self._profiles.get(profile_key)
+
+        if not profile:
+            if not signing_keys:
+                raise Exception("Signing keys are required to pre-create topics")
+
+            has_temporary_admin_key = bool(topic_options.topic_memo) and not topic_options.admin_key
+            pooled_topic_options = replace(
+                topic_options,
+                topic_memo=None,
+                admin_key=signing_keys[0].getPublicKey() if has_temporary_admin_key else topic_options.admin_key,
+            )
+
+            profile = _TopicProfile(pooled_topic_options, list(signing_keys), has_temporary_admin_key)
+            self._profiles[profile_key] = profile
+
+        return profile
+
+    def _schedule_refill(self, profile: _TopicProfile, force: bool = False):
+        if self._is_closed or (profile.refill_task and not profile.refill_task.done()):
+            return
+
+        if force or len(profile.topic_ids) < self._low_water_mark:
+            profile.refill_task = asyncio.create_task(self._refill(profile))
+
+    async def _refill(self, profile: _TopicProfile):
+        profile.refill_error = None
+
+        while not self._is_closed and len(profile.topic_ids) < self._target_size:
+            batch_size = min(self._refill_concurrency, self._target_size - len(profile.topic_ids))
+            results = await asyncio.gather(
+                *(
+                    self._hcs_topic_service.create_topic(profile.topic_options, profile.signing_keys)
+                    for _ in range(batch_size)
+                ),
+                return_exceptions=True,
+            )
+
+            errors = [result for result in results if isinstance(result, BaseException)]
+            profile.topic_ids.extend(result for result in results if isinstance(result, str))
+
+            if errors:
+                profile.refill_error = errors[0]
+                # Refill is re-scheduled on next topic request
+                LOGGER.warning(f"Failed to pre-create {len(errors)} pool topics, stopping refill: {errors[0]!s}")
+                return
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TypeAlias
+from typing import TYPE_CHECKING, TypeAlias
 
 from hedera import (
     Hbar,
@@ -16,6 +16,9 @@ from ..hedera_client_provider import HederaClientProvider
 from .constants import MAX_TRANSACTION_FEE
 from .utils import execute_hcs_query_async, execute_hcs_transaction_async, sign_hcs_transaction_async
 
+if TYPE_CHECKING:
+    from .hcs_topic_pool import HcsTopicPool
+
 TopicTransaction: TypeAlias = TopicCreateTransaction | TopicUpdateTransaction
 
 
@@ -43,23 +46,51 @@ def _set_topic_transaction_options(transaction: TopicTransaction, topic_options:
 
 
 class HcsTopicService:
-    def __init__(self, client_provider: HederaClientProvider):
-        self._client = client_provider.get_client()
+    """Provides API for managing HCS topics.
+
+    Args:
+        client_provider: Hedera Client provider
+        topic_pool: Pool of pre-created topics. If provided, new topics are taken from pool when available
+    """
+
+    def __init__(self, client_provider: HederaClientProvider, topic_pool: "HcsTopicPool | None" = None):
+        self._client_provider = client_provider
+        self._topic_pool = topic_pool
 
     async def create_topic(self, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]) -> str:
-        transaction = _set_topic_transaction_options(TopicCreateTransaction(), topic_options).freezeWith(self._client)
+        if self._topic_pool:
+            topic_id = await self._topic_pool.take_topic(topic_options, signing_keys)
+            if topic_id:
+                return topic_id
+
+        client = self._client_provider.get_client()
+        transaction = _set_topic_transaction_options(TopicCreateTransaction(), topic_options).freezeWith(client)
 
         signed_transaction = await sign_hcs_transaction_async(transaction, signing_keys)
-        transaction_receipt = await execute_hcs_transaction_async(signed_transaction, self._client)
+        transaction_receipt = await execute_hcs_transaction_async(signed_transaction, client)
 
         return transaction_receipt.topicId.toString()
 
-    async def update_topic(self, topic_id: str, topic_options: HcsTopicOptions, signing_keys: list[PrivateKey]):
+    async def update_topic(
+        self,
+        topic_id: str,
+        topic_options: HcsTopicOptions,
+        signing_keys: list[PrivateKey],
+        clear_admin_key: bool = False,
+    ):
+        client = self._client_provider.get_client()
         transaction = _set_topic_transaction_options(
             TopicUpdateTransaction().setTopicId(TopicId.fromString(topic_id)), topic_options
-        ).freezeWith(self._client)
+        )
+
+        if clear_admin_key:
+            transaction.clearAdminKey()
+
+        transaction = transaction.freezeWith(client)
         signed_transaction = await sign_hcs_transaction_async(transaction, signing_keys)
-        await execute_hcs_transaction_async(signed_transaction, self._client)
+        await execute_hcs_transaction_async(signed_transaction, client)
 
     async def get_topic_info(self, topic_id: str) -> TopicInfo:
-        return await execute_hcs_query_async(TopicInfoQuery().setTopicId(TopicId.fromString(topic_id)), self._client)
+        return await execute_hcs_query_async(
+            TopicInfoQuery().setTopicId(TopicId.fromString(topic_id)), self._client_provider.get_client()
+        )
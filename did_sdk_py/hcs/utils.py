@@ -1,34 +1,42 @@
-import asyncio
 from typing import Any
 
-from hedera import Client, PrivateKey, Query, Transaction, TransactionReceipt
+from hedera import Client, PrivateKey, Query, Transaction, TransactionReceipt, TransactionResponse
 
+from ..hedera_client_provider import track_client_load
+from ..utils.executor import HederaExecutor, get_executor
 
-async def sign_hcs_transaction_async(transaction: Transaction, signing_keys: list[PrivateKey]) -> Transaction:
+
+async def sign_hcs_transaction_async(
+    transaction: Transaction, signing_keys: list[PrivateKey], executor: HederaExecutor | None = None
+) -> Transaction:
     def sign_transaction():
         signed_transaction = transaction
         for signing_key in signing_keys:
             signed_transaction = signed_transaction.sign(signing_key)
         return signed_transaction
 
-    signing_task = asyncio.create_task(asyncio.to_thread(sign_transaction))
-    await signing_task
-
-    return signing_task.result()
+    return await (executor or get_executor()).run(sign_transaction)
 
 
-async def execute_hcs_transaction_async(transaction: Transaction, client: Client) -> TransactionReceipt:
+async def execute_hcs_transaction_async(
+    transaction: Transaction, client: Client, executor: HederaExecutor | None = None
+) -> TransactionReceipt:
     def execute_transaction():
         transaction_response = transaction.execute(client)
         return transaction_response.getReceipt(client)
 
-    execution_task = asyncio.create_task(asyncio.to_thread(execute_transaction))
-    await execution_task
+    with track_client_load(client):
+        return await (executor or get_executor()).run(execute_transaction)
+
 
-    return execution_task.result()
+async def submit_hcs_transaction_async(
+    transaction: Transaction, client: Client, executor: HederaExecutor | None = None
+) -> TransactionResponse:
+    """Submit transaction without waiting for its receipt (see 'HcsReceiptTracker' for confirmations)."""
+    with track_client_load(client):
+        return await (executor or get_executor()).run(lambda: transaction.execute(client))
 
 
-async def execute_hcs_query_async(query: Query, client: Client) -> Any:
-    query_task = asyncio.create_task(asyncio.to_thread(lambda: query.execute(client)))
-    await query_task
-    return query_task.result()
+async def execute_hcs_query_async(query: Query, client: Client, executor: HederaExecutor | None = None) -> Any:
+    with track_client_load(client):
+        return await (executor or get_executor()).run(lambda: query.execute(client))
@@ -1,12 +1,63 @@
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Literal, TypeAlias
+from itertools import count
+from threading import Lock
+from typing import Literal, TypeAlias, cast
+from weakref import WeakValueDictionary
 
 from hedera import AccountId, Client, PrivateKey
+from jnius import autoclass
 
+from .utils.executor import HederaExecutor, get_executor
 from .utils.serializable import Serializable
 
 NetworkName: TypeAlias = Literal["mainnet", "testnet", "previewnet"]
 
+ClientSelectionStrategy: TypeAlias = Literal["round_robin", "least_loaded"]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _ClientLoad:
+    """Number of operations currently performed with pooled Hedera client."""
+
+    __slots__ = ("__weakref__", "value")
+
+    def __init__(self):
+        self.value = 0
+
+
+# Load counters are owned by client providers, registry only maps pooled clients to them and doesn't keep them alive.
+# Provider keeps its clients alive as long as their counters exist, so client IDs cannot be reused in the meantime.
+_client_loads: WeakValueDictionary[int, _ClientLoad] = WeakValueDictionary()
+_client_load_lock = Lock()
+
+
+@contextmanager
+def track_client_load(client: Client) -> Iterator[Client]:
+    """Mark Hedera client as busy with an operation, used for least-loaded client selection.
+
+    Only clients managed by client provider are tracked.
+    """
+    with _client_load_lock:
+        client_load = _client_loads.get(id(client))
+        if client_load is not None:
+            client_load.value += 1
+    try:
+        yield client
+    finally:
+        if client_load is not None:
+            with _client_load_lock:
+                client_load.value -= 1
+
+
+def get_client_load(client: Client) -> int:
+    """Get number of operations currently performed with Hedera client."""
+    client_load = _client_loads.get(id(client))
+    return client_load.value if client_load is not None else 0
+
 
 @dataclass(frozen=True)
 class OperatorConfig:
@@ -21,6 +72,27 @@ class OperatorConfig:
     private_key_der: str
 
 
+@dataclass(frozen=True)
+class ClientPoolConfig:
+    """Hedera clients pool config.
+
+    Pooled clients have separate connections, which allows to scale transactions throughput beyond a single client.
+
+    Attributes:
+        size: Number of clients in pool
+        operator_configs: Operator configs assigned to pooled clients in round-robin manner. Using different operator
+            accounts avoids contention on a single payer account. If not set, provider operator config is used
+        partition_nodes: Split consensus nodes between pooled clients, so each client submits transactions to its own
+            subset of nodes. Ignored if there are fewer nodes than clients
+        selection_strategy: Client selection strategy, "round_robin" or "least_loaded" (fewest in-flight operations)
+    """
+
+    size: int = 1
+    operator_configs: tuple[OperatorConfig, ...] | None = None
+    partition_nodes: bool = False
+    selection_strategy: ClientSelectionStrategy = "round_robin"
+
+
 @dataclass(frozen=True)
 class NetworkConfig(Serializable):
     """Hedera network config.
@@ -42,14 +114,16 @@ class NetworkConfig(Serializable):
 
 class HederaClientProvider:
     """
-    Provider class for managing Hedera network client instance.
+    Provider class for managing Hedera network client instances.
 
     Used to create client instances with either default Hedera network configurations or custom ones.
+    Optionally, provider can manage a pool of clients, every 'get_client' call selects a client from the pool then.
 
     Args:
         network_name: Hedera network name ("mainnet", "testnet", "previewnet", "custom")
         operator_config: Hedera account/operator config
         network_config: Custom network config, requires "network_name" to be set to "custom"
+        client_pool_config: Hedera clients pool config. If not provided, single client is used
     """
 
     def __init__(
@@ -57,45 +131,81 @@ class HederaClientProvider:
         network_name: Literal[NetworkName, "custom"],
         operator_config: OperatorConfig | None = None,
         network_config: NetworkConfig | None = None,
+        client_pool_config: ClientPoolConfig | None = None,
     ):
         if network_name == "custom":
             if not network_config:
                 raise Exception("Network config is required for custom network configuration")
-            self._client = Client.fromConfig(network_config.to_json())
         elif network_config:
             raise Exception("Network config is supported only for custom network configuration")
-        else:
-            match network_name:
-                case "mainnet":
-                    self._client = Client.forMainnet()
-                case "testnet":
-                    self._client = Client.forTestnet()
-                case "previewnet":
-                    self._client = Client.forPreviewnet()
-                case _:
-                    raise Exception(f"Network is not supported: '{network_name}'")
+        elif network_name not in ("mainnet", "testnet", "previewnet"):
+            raise Exception(f"Network is not supported: '{network_name}'")
+
+        self._pool_config = client_pool_config or ClientPoolConfig()
+
+        if self._pool_config.size < 1:
+            raise Exception("Client pool size must be positive")
+
+        self._clients = [_create_client(network_name, network_config) for _ in range(self._pool_config.size)]
+        self._client = self._clients[0]
+        self._client_loads = {id(client): _ClientLoad() for client in self._clients}
+        with _client_load_lock:
+            _client_loads.update(self._client_loads)
+        self._round_robin_counter = count()
+        self._selection_lock = Lock()
 
         if operator_config:
             self.set_operator_config(operator_config)
 
+        if self._pool_config.operator_configs:
+            operator_configs = self._pool_config.operator_configs
+            for index, client in enumerate(self._clients):
+                _set_client_operator(client, operator_configs[index % len(operator_configs)])
+
+        if self._pool_config.partition_nodes and len(self._clients) > 1:
+            _partition_nodes(self._clients)
+
         self._disposed = False
 
     def set_operator_config(self, operator_config: OperatorConfig):
         """
-        Set operator config for Hedera client instance.
+        Set operator config for Hedera client instances.
 
         Args:
             operator_config: Operator config to set
         """
-        self._client.setOperator(
-            AccountId.fromString(operator_config.account_id), PrivateKey.fromString(operator_config.private_key_der)
-        )
+        for client in self._clients:
+            _set_client_operator(client, operator_config)
+
+    def get_executor(self) -> HederaExecutor:
+        """Get SDK executor used for blocking Hedera SDK calls. Executor is shared by SDK (see 'configure_executor')."""
+        return get_executor()
 
     def get_client(self):
-        """Get Hedera client instance."""
+        """Get Hedera client instance, selected from pool according to selection strategy."""
+        if self._disposed:
+            raise Exception("Client provider has been disposed")
+
+        if len(self._clients) == 1:
+            return self._client
+
+        with self._selection_lock:
+            offset = next(self._round_robin_counter) % len(self._clients)
+
+        # Rotation is also used to break ties between least loaded clients
+        rotated_clients = self._clients[offset:] + self._clients[:offset]
+
+        match self._pool_config.selection_strategy:
+            case "least_loaded":
+                return min(rotated_clients, key=lambda client: self._client_loads[id(client)].value)
+            case _:
+                return rotated_clients[0]
+
+    def get_clients(self) -> list[Client]:
+        """Get all pooled Hedera client instances."""
         if self._disposed:
             raise Exception("Client provider has been disposed")
-        return self._client
+        return list(self._clients)
 
     def __enter__(self):
         return self
@@ -104,6 +214,48 @@ class HederaClientProvider:
         self.dispose()
 
     def dispose(self):
-        """Dispose (close) Hedera client instance."""
-        self._client.close()
+        """Dispose (close) Hedera client instances."""
+        for client in self._clients:
+            client.close()
         self._disposed = True
+
+
+def _create_client(network_name: Literal[NetworkName, "custom"], network_config: NetworkConfig | None) -> Client:
+    match network_name:
+        case "custom":
+            return Client.fromConfig(cast(NetworkConfig, network_config).to_json())
+        case "mainnet":
+            return Client.forMainnet()
+        case "testnet":
+            return Client.forTestnet()
+        case "previewnet":
+            return Client.forPreviewnet()
+
+
+def _set_client_operator(client: Client, operator_config: OperatorConfig):
+    client.setOperator(
+        AccountId.fromString(operator_config.account_id), PrivateKey.fromString(operator_config.private_key_der)
+    )
+
+
+def _partition_nodes(clients: list[Client]):
+    # Network map contains node addresses as keys, the same node (account) can have multiple addresses
+    node_addresses: dict[str, list[tuple[str, AccountId]]] = {}
+    for entry in clients[0].getNetwork().entrySet().toArray():
+        account_id = entry.getValue()
+        node_addresses.setdefault(account_id.toString(), []).append((str(entry.getKey()), account_id))
+
+    node_account_ids = sorted(node_addresses)
+
+    if len(node_account_ids) < len(clients):
+        LOGGER.warning(f"Cannot partition {len(node_account_ids)} nodes between {len(clients)} clients, skipping...")
+        return
+
+    JHashMap = autoclass("java.util.HashMap")
+
+    for index, client in enumerate(clients):
+        client_network = JHashMap()
+        for node_account_id in node_account_ids[index :: len(clients)]:
+            for address, account_id in node_addresses[node_account_id]:
+                client_network.put(address, account_id)
+        client.setNetwork(client_network)
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from asyncio import Task
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Runs cached data refreshes as background tasks, deduplicated by key.
+
+    While refresh for a key is running, requests for the same key share it instead of starting another one.
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, Task[Any]] = {}
+
+    def refresh[T](self, key: str, refresh: Callable[[], Awaitable[T]]) -> Task[T]:
+        """Start refresh for key, unless it's already running.
+
+        Errors of background refresh are logged. Awaiting returned task propagates them instead.
+
+        Args:
+            key: Refreshed data key
+            refresh: Refresh coroutine function
+
+        Returns:
+            Refresh task (already running one, if any), its result is the result of refresh coroutine
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            return task
+
+        task = asyncio.create_task(self._run(refresh))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._handle_completion(key, task))
+
+        return task
+
+    async def wait_for_pending(self):
+        """Wait until all running refreshes are finished. Errors are not raised here."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    @staticmethod
+    async def _run[T](refresh: Callable[[], Awaitable[T]]) -> T:
+        return await refresh()
+
+    def _handle_completion(self, key: str, task: Task[Any]):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error:
+            LOGGER.warning(f"Background refresh of '{key}' has failed: {error!s}")
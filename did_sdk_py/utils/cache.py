@@ -1,5 +1,6 @@
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import final, override
@@ -8,6 +9,12 @@ seconds = float
 
 DEFAULT_TTL: seconds = float(3600)
 
+DEFAULT_MAX_STALENESS: seconds = float(300)
+DEFAULT_MIN_REFRESH_INTERVAL: seconds = float(10)
+
+DEFAULT_NEGATIVE_TTL: seconds = float(30)
+DEFAULT_NEGATIVE_CACHE_SIZE = 10000
+
 
 @dataclass
 class TimestampedRecord[T]:
@@ -16,10 +23,118 @@ class TimestampedRecord[T]:
     Attributes:
         data: Record data (generic)
         timestamp: Timestamp of record creation
+        refresh_time: Time of the last record data refresh from the network, if it's tracked
     """
 
     data: T
     timestamp: float = field(default_factory=time.time)
+    refresh_time: float | None = None
+
+
+@dataclass(frozen=True)
+class StaleWhileRevalidatePolicy:
+    """Stale-while-revalidate policy for cached data that is refreshed from the network (i.e. DID documents).
+
+    Outdated cached data is returned immediately, while refresh is done in background (one refresh per cached item
+    at a time). Data that was not refreshed for longer than max staleness is not returned until refresh is done.
+
+    Attributes:
+        max_staleness: Max time since last refresh (in seconds) that cached data can be returned without waiting
+            for refresh
+        min_refresh_interval: Min time between background refreshes of the same cached item (in seconds)
+    """
+
+    max_staleness: seconds = DEFAULT_MAX_STALENESS
+    min_refresh_interval: seconds = DEFAULT_MIN_REFRESH_INTERVAL
+
+
+@dataclass(frozen=True)
+class NegativeCachePolicy:
+    """Caching policy for negative resolution results (i.e. non-existent DIDs and AnonCreds objects).
+
+    Negative results are kept in memory separately from resolved data, so repeated lookups of missing identifiers
+    don't query the network until negative result expires.
+
+    Attributes:
+        ttl: Negative result retention duration in seconds. Should be short, since missing objects can be created later
+        max_size: Max number of cached negative results (oldest are evicted first)
+    """
+
+    ttl: seconds = DEFAULT_NEGATIVE_TTL
+    max_size: int = DEFAULT_NEGATIVE_CACHE_SIZE
+
+
+DEFAULT_NEGATIVE_CACHE_POLICY = NegativeCachePolicy()
+
+
+class NegativeResultCache[K]:
+    """Bounded in-memory cache of negative resolution results, configured with negative cache policy.
+
+    Cached value is a message describing the result. Since all records have the same TTL, insertion order is also
+    expiration order, so expired records are removed from the oldest end without scanning the whole cache.
+
+    Args:
+        policy: Negative cache policy
+    """
+
+    def __init__(self, policy: NegativeCachePolicy):
+        self._policy = policy
+        self._lock = Lock()
+        self._records: OrderedDict[K, TimestampedRecord[str]] = OrderedDict()
+
+    def get(self, key: K) -> str | None:
+        """Get cached negative result by key.
+
+        Args:
+            key: Cached result key
+
+        Returns:
+            Negative result message, if result is cached and not expired
+        """
+        with self._lock:
+            self._remove_expired_records()
+
+            record = self._records.get(key)
+            return record.data if record else None
+
+    def set(self, key: K, message: str):
+        """Cache negative result.
+
+        Args:
+            key: Result key
+            message: Negative result message
+        """
+        with self._lock:
+            self._remove_expired_records()
+
+            self._records.pop(key, None)
+            self._records[key] = TimestampedRecord(message, time.time() + self._policy.ttl)
+
+            while len(self._records) > self._policy.max_size:
+                self._records.popitem(last=False)
+
+    def remove(self, key: K):
+        """Remove cached negative result by key.
+
+        Args:
+            key: Cached result key
+        """
+        with self._lock:
+            self._records.pop(key, None)
+
+    def size(self) -> int:
+        """Get cached negative results count (including expired ones that are not removed yet)."""
+        return len(self._records)
+
+    def _remove_expired_records(self):
+        now = time.time()
+
+        while self._records:
+            oldest_record = next(iter(self._records.values()))
+            if oldest_record.timestamp > now:
+                break
+
+            self._records.popitem(last=False)
 
 
 class Cache[K, V](ABC):
@@ -0,0 +1,159 @@
+import logging
+import threading
+from typing import Literal, TypeAlias
+
+from zstandard import (
+    DICT_TYPE_AUTO,
+    ZstdCompressionDict,
+    ZstdCompressor,
+    ZstdDecompressor,
+    ZstdError,
+    get_frame_parameters,
+    train_dictionary,
+)
+
+CompressionTarget: TypeAlias = Literal["hcs_file", "rev_reg_entry"]
+
+DEFAULT_DICTIONARY_SIZE = 16 * 1024
+
+# Dictionary ID written to zstd frames compressed without dictionary
+_NO_DICTIONARY_ID = 0
+
+LOGGER = logging.getLogger(__name__)
+
+_dictionaries: dict[int, ZstdCompressionDict] = {}
+_dictionaries_lock = threading.Lock()
+
+_target_dictionary_ids: dict[CompressionTarget, int | None] = {"hcs_file": None, "rev_reg_entry": None}
+
+# zstd contexts are expensive to create and cannot be shared between threads, so they are reused per thread
+_contexts = threading.local()
+
+
+def train_compression_dictionary(
+    samples: list[bytes], dict_size: int = DEFAULT_DICTIONARY_SIZE, dict_id: int = _NO_DICTIONARY_ID
+) -> bytes:
+    """Train zstd dictionary on sample payloads.
+
+    Dictionary ID is written to every frame compressed with dictionary, so it works as dictionary version:
+    dictionaries trained on new samples should get a new ID.
+
+    Args:
+        samples: Sample payloads (for instance, serialized schemas or revocation registry entries)
+        dict_size: Max dictionary size in bytes
+        dict_id: Dictionary ID. If not provided, zstd derives ID from dictionary content
+
+    Returns:
+        Dictionary data
+    """
+    return train_dictionary(dict_size, samples, dict_id=dict_id).as_bytes()
+
+
+def register_compression_dictionary(data: bytes) -> int:
+    """Register zstd dictionary, so payloads compressed with it can be decompressed.
+
+    Args:
+        data: Dictionary data (see 'train_compression_dictionary')
+
+    Returns:
+        Dictionary ID
+    """
+    dictionary = ZstdCompressionDict(data, dict_type=DICT_TYPE_AUTO)
+    dict_id = dictionary.dict_id()
+
+    if dict_id == _NO_DICTIONARY_ID:
+        raise Exception("Compression dictionary must have non-zero ID")
+
+    with _dictionaries_lock:
+        registered_dictionary = _dictionaries.get(dict_id)
+        if registered_dictionary is not None:
+            if registered_dictionary.as_bytes() != dictionary.as_bytes():
+                raise Exception(f"Another compression dictionary with ID {dict_id} is already registered")
+            return dict_id
+
+        _dictionaries[dict_id] = dictionary
+
+    LOGGER.debug(f"Registered compression dictionary {dict_id}")
+
+    return dict_id
+
+
+def set_compression_dictionary(target: CompressionTarget, dict_id: int | None):
+    """Set dictionary used to compress new payloads of given type.
+
+    Payloads are decompressed with dictionary they were compressed with, regardless of this setting.
+
+    IMPORTANT: Payloads compressed with dictionary can be resolved only by readers that have the same dictionary
+    registered. Other HCS-1 and AnonCreds implementations cannot read them, so dictionaries should be used only when all
+    readers are known to use this SDK with the same dictionaries.
+
+    Args:
+        target: Payload type - HCS-1 files ("hcs_file") or revocation registry entries ("rev_reg_entry")
+        dict_id: ID of registered dictionary or None to compress without dictionary
+    """
+    if dict_id is not None and dict_id not in _dictionaries:
+        raise Exception(f"Compression dictionary {dict_id} is not registered")
+
+    _target_dictionary_ids[target] = dict_id
+
+
+def get_compression_dictionary_id(target: CompressionTarget) -> int | None:
+    """Get ID of dictionary used to compress new payloads of given type."""
+    return _target_dictionary_ids[target]
+
+
+def compress(data: bytes, dict_id: int | None = None) -> bytes:
+    """Compress payload with zstd.
+
+    Args:
+        data: Payload
+        dict_id: ID of registered dictionary to compress with
+
+    Returns:
+        zstd frame
+    """
+    compressors: dict[int, ZstdCompressor] | None = getattr(_contexts, "compressors", None)
+    if compressors is None:
+        compressors = _contexts.compressors = {}
+
+    key = dict_id or _NO_DICTIONARY_ID
+    compressor = compressors.get(key)
+    if compressor is None:
+        compressor = compressors[key] = ZstdCompressor(dict_data=_get_dictionary(dict_id) if dict_id else None)
+
+    return compressor.compress(data)
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress zstd frame. Dictionary is selected by ID stored in frame header.
+
+    Args:
+        data: zstd frame
+
+    Returns:
+        Payload
+    """
+    decompressors: dict[int, ZstdDecompressor] | None = getattr(_contexts, "decompressors", None)
+    if decompressors is None:
+        decompressors = _contexts.decompressors = {}
+
+    try:
+        dict_id = get_frame_parameters(data).dict_id
+    except ZstdError:
+        # Not a valid frame, decompressor reports the error
+        dict_id = _NO_DICTIONARY_ID
+
+    decompressor = decompressors.get(dict_id)
+    if decompressor is None:
+        decompressor = decompressors[dict_id] = ZstdDecompressor(
+            dict_data=_get_dictionary(dict_id) if dict_id != _NO_DICTIONARY_ID else None
+        )
+
+    return decompressor.decompress(data)
+
+
+def _get_dictionary(dict_id: int) -> ZstdCompressionDict:
+    dictionary = _dictionaries.get(dict_id)
+    if dictionary is None:
+        raise Exception(f"Compression dictionary {dict_id} is not registered")
+    return dictionary
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+
+from jnius import autoclass
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """Config of SDK executor used for blocking Hedera SDK calls.
+
+    Attributes:
+        max_workers: Max number of worker threads
+        thread_name_prefix: Name prefix of worker threads
+    """
+
+    max_workers: int = DEFAULT_MAX_WORKERS
+    thread_name_prefix: str = "hedera-did-sdk"
+
+
+@dataclass(frozen=True)
+class ExecutorMetrics:
+    """Snapshot of SDK executor metrics.
+
+    Attributes:
+        max_workers: Max number of worker threads
+        queued_tasks: Number of submitted tasks waiting for a free worker
+        running_tasks: Number of tasks currently running
+        completed_tasks: Number of completed tasks
+    """
+
+    max_workers: int
+    queued_tasks: int
+    running_tasks: int
+    completed_tasks: int
+
+
+def _attach_worker_to_jvm():
+    # Worker threads are long-lived, so thread is attached to JVM once and attachment is reused by all its tasks
+    try:
+        autoclass("java.lang.Thread").currentThread()
+    except Exception as error:
+        LOGGER.warning(f"Failed to attach executor worker thread to JVM: {error!s}")
+
+
+class HederaExecutor:
+    """Thread pool used by SDK for blocking Hedera SDK calls (transactions execution, receipts, queries, signing).
+
+    Separate pool prevents bursts of long-running Hedera calls (like receipt waits) from starving default asyncio
+    executor used by the rest of application.
+
+    Args:
+        config: Executor config
+    """
+
+    def __init__(self, config: ExecutorConfig | None = None):
+        self.config = config or ExecutorConfig()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix=self.config.thread_name_prefix,
+            initializer=_attach_worker_to_jvm,
+        )
+
+        self._metrics_lock = Lock()
+        self._submitted_tasks = 0
+        self._started_tasks = 0
+        self._completed_tasks = 0
+
+    async def run[T](self, func: Callable[[], T]) -> T:
+        """Run blocking function in executor and wait for result.
+
+        Args:
+            func: Blocking function to run
+
+        Returns:
+            Function result
+        """
+        return await asyncio.wrap_future(self.submit(func))
+
+    def submit[T](self, func: Callable[[], T]) -> Future[T]:
+        """Submit blocking function to executor without waiting for result. Can be called from any thread.
+
+        Args:
+            func: Blocking function to run
+
+        Returns:
+            Future of function result
+        """
+
+        def run_task() -> T:
+            with self._metrics_lock:
+                self._started_tasks += 1
+            try:
+                return func()
+            finally:
+                with self._metrics_lock:
+                    self._completed_tasks += 1
+
+        def handle_done(future: Future):
+            # Tasks cancelled before start are neither started nor completed
+            if future.cancelled():
+                with self._metrics_lock:
+                    self._submitted_tasks -= 1
+
+        with self._metrics_lock:
+            self._submitted_tasks += 1
+
+        future = self._executor.submit(run_task)
+        future.add_done_callback(handle_done)
+
+        return future
+
+    def get_metrics(self) -> ExecutorMetrics:
+        """Get current executor metrics."""
+        with self._metrics_lock:
+            return ExecutorMetrics(
+                max_workers=self.config.max_workers,
+                queued_tasks=self._submitted_tasks - self._started_tasks,
+                running_tasks=self._started_tasks - self._completed_tasks,
+                completed_tasks=self._completed_tasks,
+            )
+
+    def shutdown(self, wait: bool = True):
+        """Shutdown executor. Already submitted tasks are completed."""
+        self._executor.shutdown(wait=wait)
+
+
+_executor: HederaExecutor | None = None
+_executor_lock = Lock()
+
+
+def get_executor() -> HederaExecutor:
+    """Get SDK executor. Executor with default config is created on first use, if it's not configured."""
+    global _executor
+
+    with _executor_lock:
+        if not _executor:
+            _executor = HederaExecutor()
+
+        return _executor
+
+
+def configure_executor(config: ExecutorConfig) -> HederaExecutor:
+    """Configure SDK executor.
+
+    Executor is shared by the whole SDK, so it can be configured only once, on application startup, before any SDK
+    calls are made. Executor that is already in use is never replaced.
+
+    Args:
+        config: Executor config
+
+    Returns:
+        SDK executor
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor:
+            raise Exception("SDK executor is already configured or in use")
+
+        _executor = HederaExecutor(config)
+        return _executor
@@ -3,6 +3,8 @@ from typing import Any
 from aiohttp import BaseConnector, ClientError, ClientResponse, ClientSession
 from aiohttp_retry import ExponentialRetry, RetryClient
 
+from .json_codec import json_loads
+
 
 async def fetch(
     url: str,
@@ -39,4 +41,4 @@ async def fetch(
             response: ClientResponse = await retry_client.get(url, headers=headers)
             if response.status < 200 or response.status >= 300:
                 raise ClientError(f"Bad response from server: {response.status} - " f"{response.reason}")
-            return await (response.json() if json else response.text())
+            return await (response.json(loads=json_loads) if json else response.text())
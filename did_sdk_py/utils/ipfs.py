@@ -1,6 +1,5 @@
-import json
-
 from .http import fetch
+from .json_codec import json_loads
 
 DEFAULT_IPFS_HTTP_PROXY = "https://ipfs.io/ipfs/"
 
@@ -13,6 +12,6 @@ async def download_ipfs_document_by_cid(cid: str, ipfs_http_proxy: str = DEFAULT
 async def download_ipfs_document_by_url(url: str) -> dict:
     try:
         document_json = await fetch(url)
-        return json.loads(document_json)
+        return json_loads(document_json)
     except Exception as error:
         raise Exception(f"DID document could not be fetched from URL: {url}") from error
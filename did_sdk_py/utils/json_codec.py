@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Literal, TypeAlias
+
+JsonBackendName: TypeAlias = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+JSON_BACKEND = os.environ.get("HEDERA_DID_SDK_JSON_BACKEND", "auto")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class JsonCodec(ABC):
+    """Interface for JSON codecs used across SDK.
+
+    Parsing is delegated to the codec backend, while serialization always produces stdlib-compatible output
+    (default separators, ASCII escaping, insertion key order). Serialized payloads are hashed, signed and submitted
+    to HCS, so their bytes must not depend on the installed backend.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        """Parse JSON document.
+
+        Args:
+            data: JSON document as string or UTF-8 encoded bytes
+
+        Returns:
+            Parsed JSON value
+
+        Raises:
+            ValueError: If document is not a valid JSON
+        """
+
+    def dumps(self, payload: Any) -> str:
+        """Serialize JSON payload to string in canonical (stdlib-compatible) format.
+
+        Args:
+            payload: JSON-serializable value
+
+        Returns:
+            JSON string
+        """
+        return json.dumps(payload)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec based on built-in `json` module."""
+
+    name = "stdlib"
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec that uses `orjson` for parsing."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError:
+            # orjson is stricter than stdlib (i.e. it rejects integers above 64 bits and NaN values)
+            # Fallback keeps parsing behaviour consistent, including error messages for invalid documents
+            return json.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """JSON codec that uses `msgspec` for parsing."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error:
+            return json.loads(data)
+
+
+_CODEC_CLASSES: dict[str, type[JsonCodec]] = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecJsonCodec.name: MsgspecJsonCodec,
+}
+
+
+def _create_codec(backend: JsonBackendName | str) -> JsonCodec:
+    if backend == "auto":
+        for name in (OrjsonCodec.name, MsgspecJsonCodec.name):
+            try:
+                return _CODEC_CLASSES[name]()
+            except ImportError:
+                continue
+        return StdlibJsonCodec()
+
+    codec_class = _CODEC_CLASSES.get(backend)
+    if not codec_class:
+        raise Exception(f"Unsupported JSON backend: '{backend}'")
+
+    return codec_class()
+
+
+_codec: JsonCodec = _create_codec(JSON_BACKEND)
+
+
+def get_json_codec() -> JsonCodec:
+    """Get JSON codec instance currently used by SDK."""
+    return _codec
+
+
+def set_json_codec(codec: JsonCodec | JsonBackendName) -> JsonCodec:
+    """Set JSON codec used by SDK.
+
+    Args:
+        codec: Codec instance or backend name ("auto", "stdlib", "orjson", "msgspec")
+
+    Returns:
+        Codec instance that is used from now on
+    """
+    global _codec
+
+    _codec = codec if isinstance(codec, JsonCodec) else _create_codec(codec)
+    LOGGER.debug(f"Using '{_codec.name}' JSON backend")
+
+    return _codec
+
+
+def json_loads(data: str | bytes | bytearray) -> Any:
+    """Parse JSON document with currently configured codec."""
+    return _codec.loads(data)
+
+
+def json_dumps(payload: Any) -> str:
+    """Serialize JSON payload with currently configured codec."""
+    return _codec.dumps(payload)
@@ -0,0 +1,37 @@
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attributes(
+    package_name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level '__getattr__' and '__dir__' (PEP 562) that import package attributes on first access.
+
+    Most SDK modules depend on Hedera SDK, importing it starts JVM. Packages export their API lazily,
+    so that only modules that are actually used get imported.
+
+    Args:
+        package_name: Name of the package ('__name__')
+        attributes: Map of exported attribute names to relative names of modules that define them
+
+    Returns:
+        '__getattr__' and '__dir__' functions for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(module_name, package_name), name)
+
+        # Cache attribute in package namespace, so '__getattr__' is not called for it anymore
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package_name]), *attributes})
+
+    return __getattr__, __dir__
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import TYPE_CHECKING
+
+from .serializable import Serializable
+
+if TYPE_CHECKING:
+    from ..anoncreds.hedera_anoncreds_registry import HederaAnonCredsRegistry
+    from ..did.hedera_did_resolver import HederaDidResolver
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class PrefetchResult:
+    """Result of a single identifier prefetch.
+
+    Attributes:
+        identifier: Prefetched identifier (DID or AnonCreds object ID)
+        error: Error message, if identifier was not loaded
+    """
+
+    identifier: str
+    error: str | None = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+PrefetchProgressCallback = Callable[[PrefetchResult, int, int], None]
+"""Called after every prefetched identifier with its result, number of completed prefetches and total number."""
+
+
+async def run_prefetch(
+    identifiers: Sequence[str],
+    load: Callable[[str], Awaitable[None]],
+    max_concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+    on_progress: PrefetchProgressCallback | None = None,
+) -> list[PrefetchResult]:
+    """Load identifiers concurrently, with bounded number of loads in flight.
+
+    Load errors are not raised, they are reported in prefetch results instead.
+
+    Args:
+        identifiers: Identifiers to load (duplicates are loaded once)
+        load: Load coroutine function, expected to raise on failure
+        max_concurrency: Max number of concurrent loads
+        on_progress: Progress callback
+
+    Returns:
+        Prefetch results, in the order of (unique) identifiers
+    """
+    if max_concurrency < 1:
+        raise Exception("Max prefetch concurrency must be positive")
+
+    unique_identifiers = list(dict.fromkeys(identifiers))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
+
+    async def prefetch(identifier: str) -> PrefetchResult:
+        nonlocal completed
+
+        async with semaphore:
+            try:
+                await load(identifier)
+                result = PrefetchResult(identifier)
+            except Exception as error:
+                LOGGER.warning(f"Prefetch of '{identifier}' has failed: {error!s}")
+                result = PrefetchResult(identifier, str(error))
+
+        completed += 1
+        if on_progress:
+            on_progress(result, completed, len(unique_identifiers))
+
+        return result
+
+    return list(await asyncio.gather(*(prefetch(identifier) for identifier in unique_identifiers)))
+
+
+@dataclass
+class PrefetchManifest(Serializable):
+    """List of identifiers that are loaded into resolver and registry caches on startup.
+
+    Manifest JSON structure: `{"dids": [...], "anoncredsIds": [...]}`, both lists are optional.
+
+    Attributes:
+        dids: DIDs to resolve (i.e. trusted issuers)
+        anoncreds_ids: AnonCreds schema, credential definition and revocation registry IDs
+    """
+
+    dids: list[str] = field(default_factory=list)
+    anoncreds_ids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_file(cls, path: str | PathLike) -> "PrefetchManifest":
+        """Read manifest from JSON file.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            Prefetch manifest
+        """
+        with open(path, "rb") as manifest_file:
+            return cls.from_json(manifest_file.read())
+
+    @classmethod
+    def from_json_payload(cls, payload: dict):
+        if not isinstance(payload, dict):
+            raise Exception(f"{cls.__name__} JSON parsing failed: Invalid JSON structure")
+
+        dids = payload.get("dids", [])
+        anoncreds_ids = payload.get("anoncredsIds", [])
+
+        for identifiers in (dids, anoncreds_ids):
+            if not isinstance(identifiers, list) or not all(isinstance(value, str) for value in identifiers):
+                raise Exception(f"{cls.__name__} JSON parsing failed: Identifiers must be a list of strings")
+
+        return cls(dids=dids, anoncreds_ids=anoncreds_ids)
+
+    def get_json_payload(self):
+        return {"dids": self.dids, "anoncredsIds": self.anoncreds_ids}
+
+
+async def prefetch_manifest(
+    manifest: PrefetchManifest | str | PathLike,
+    resolver: "HederaDidResolver | None" = None,
+    registry: "HederaAnonCredsRegistry | None" = None,
+    max_concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+    on_progress: PrefetchProgressCallback | None = None,
+) -> list[PrefetchResult]:
+    """Load manifest identifiers into resolver and registry caches.
+
+    DIDs are loaded first, then AnonCreds objects. Progress is reported across both.
+
+    Args:
+        manifest: Prefetch manifest or path to manifest JSON file
+        resolver: DID resolver to load DIDs with. Required if manifest contains DIDs
+        registry: AnonCreds registry to load AnonCreds objects with. Required if manifest contains AnonCreds IDs
+        max_concurrency: Max number of concurrent loads
+        on_progress: Progress callback
+
+    Returns:
+        Prefetch results
+    """
+    if not isinstance(manifest, PrefetchManifest):
+        manifest = PrefetchManifest.from_file(manifest)
+
+    if manifest.dids and not resolver:
+        raise Exception("DID resolver is required to prefetch manifest DIDs")
+
+    if manifest.anoncreds_ids and not registry:
+        raise Exception("AnonCreds registry is required to prefetch manifest AnonCreds IDs")
+
+    total = len(set(manifest.dids)) + len(set(manifest.anoncreds_ids))
+    completed = 0
+
+    def report_progress(result: PrefetchResult, *_):
+        nonlocal completed
+
+        completed += 1
+        if on_progress:
+            on_progress(result, completed, total)
+
+    results = []
+
+    if resolver and manifest.dids:
+        results.extend(await resolver.prefetch(manifest.dids, max_concurrency, report_progress))
+
+    if registry and manifest.anoncreds_ids:
+        results.extend(await registry.prefetch(manifest.anoncreds_ids, max_concurrency, report_progress))
+
+    return results
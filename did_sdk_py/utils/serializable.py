@@ -1,25 +1,28 @@
-import json
 from abc import abstractmethod
 from typing import Self
 
+from .json_codec import json_dumps, json_loads
+
 
 class Serializable:
+    __slots__ = ()
+
     @classmethod
     def from_json(
         cls,
-        json_str: str,
+        json_str: str | bytes,
     ) -> Self:
         """Parse a JSON string into an object instance.
 
         Args:
-            json_str: JSON string
+            json_str: JSON string (or UTF-8 encoded bytes)
 
         Returns:
             An instance representation of this JSON
 
         """
         try:
-            return cls.from_json_payload(json.loads(json_str))
+            return cls.from_json_payload(json_loads(json_str))
         except ValueError as e:
             raise Exception(f"{cls.__name__} JSON parsing failed: Invalid JSON structure") from e
 
@@ -43,7 +46,7 @@ class Serializable:
             A JSON representation of this message
 
         """
-        return json.dumps(self.get_json_payload())
+        return json_dumps(self.get_json_payload())
 
     @abstractmethod
     def get_json_payload(self) -> dict:
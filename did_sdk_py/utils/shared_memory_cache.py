@@ -0,0 +1,278 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from os import PathLike
+from typing import Any, override
+
+from .cache import Cache, seconds
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SLOTS = 1024
+DEFAULT_SLOT_SIZE = 64 * 1024
+
+# Max number of slots checked for a key (linear probing), bounds lookup time when hash table is nearly full
+MAX_PROBES = 32
+
+_FILE_MAGIC = b"DIDSDKC1"
+_FILE_HEADER = struct.Struct("<8sII")
+_FILE_HEADER_SIZE = 64
+
+# Slot header: state, key hash, expiration timestamp, key length, value length
+_SLOT_HEADER = struct.Struct("<BQdII")
+
+_SLOT_EMPTY = 0
+_SLOT_USED = 1
+# Removed entry, lookups continue probing past it
+_SLOT_DELETED = 2
+
+
+def _hash_key(key_bytes: bytes) -> int:
+    # Built-in 'hash' is randomized per process, so it cannot be used for shared hash table
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+def _pickle_dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _pickle_loads(data: bytes) -> Any:
+    # Cache file is created with owner-only permissions
+    return pickle.loads(data)  # noqa: S301
+
+
+class SharedMemoryCache[K, V](Cache[K, V]):
+    """Cache implementation shared between processes on the same host (i.e. multiple application workers).
+
+    Entries are kept in a fixed-size hash table in memory-mapped file, so resolved data (DID documents, AnonCreds
+    objects) is shared between all processes that use the same file. Access to file is synchronized with POSIX file
+    locks (shared for reads, exclusive for writes), so the implementation is available on POSIX systems only.
+
+    Each entry takes a single slot of fixed size. Values are serialized with pickle by default, entries that don't fit
+    into slot are not cached. When all slots checked for a key are taken, the entry that expires first is evicted.
+
+    Cache file is created with owner-only permissions. Since cached values are deserialized on read, it must not be
+    writable by untrusted users.
+
+    Args:
+        path: Cache file path. File is created if it doesn't exist
+        slots: Number of hash table slots (max number of cached entries)
+        slot_size: Slot size in bytes, including key and serialized value
+        serialize: Value serialization function
+        deserialize: Value deserialization function
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        serialize: Callable[[V], bytes] = _pickle_dumps,
+        deserialize: Callable[[bytes], V] = _pickle_loads,
+    ):
+        super().__init__()
+
+        if slots < 1:
+            raise Exception("Number of cache slots must be positive")
+
+        if slot_size <= _SLOT_HEADER.size:
+            raise Exception(f"Cache slot size must be greater than {_SLOT_HEADER.size} bytes")
+
+        self._slots = slots
+        self._slot_size = slot_size
+        self._serialize = serialize
+        self._deserialize = deserialize
+
+        # File locks don't synchronize threads of the same process, so they're combined with thread lock
+        self._thread_lock = threading.Lock()
+
+        self._path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._mem = self._open_table()
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        self._lock_fd = self._fd
+        self._lock_fd_pid = os.getpid()
+
+    def close(self):
+        """Unmap and close cache file. Cache instance cannot be used after closing."""
+        with self._thread_lock:
+            self._mem.close()
+            os.close(self._fd)
+            if self._lock_fd != self._fd and self._lock_fd_pid == os.getpid():
+                os.close(self._lock_fd)
+
+    @override
+    def data_get(self, key: K) -> V | None:
+        key_bytes = self._encode_key(key)
+
+        with self._lock_table(exclusive=False):
+            slot_index = self._find_slot(key_bytes)
+            if slot_index is None:
+                return None
+
+            offset = self._get_slot_offset(slot_index)
+            _, _, expires_at, key_length, value_length = _SLOT_HEADER.unpack_from(self._mem, offset)
+            if expires_at <= time.time():
+                return None
+
+            value_offset = offset + _SLOT_HEADER.size + key_length
+            value_bytes = self._mem[value_offset : value_offset + value_length]
+
+        return self._deserialize(value_bytes)
+
+    @override
+    def data_set(self, key: K, value: V, ttl: seconds):
+        key_bytes = self._encode_key(key)
+        value_bytes = self._serialize(value)
+
+        if _SLOT_HEADER.size + len(key_bytes) + len(value_bytes) > self._slot_size:
+            LOGGER.debug(f"Value of '{key!s}' exceeds cache slot size, it's not cached")
+            with self._lock_table(exclusive=True):
+                # Previous value must not be served anymore
+                self._remove_slot(self._find_slot(key_bytes))
+            return
+
+        key_hash = _hash_key(key_bytes)
+
+        with self._lock_table(exclusive=True):
+            slot_index = self._find_slot(key_bytes, key_hash)
+            if slot_index is None:
+                slot_index = self._find_free_slot(key_hash)
+            offset = self._get_slot_offset(slot_index)
+
+            # Slot is marked as used only after entry is written, so interrupted write doesn't leave corrupted entry
+            self._mem[offset] = _SLOT_DELETED
+            data_offset = offset + _SLOT_HEADER.size
+            self._mem[data_offset : data_offset + len(key_bytes) + len(value_bytes)] = key_bytes + value_bytes
+            _SLOT_HEADER.pack_into(
+                self._mem, offset, _SLOT_USED, key_hash, time.time() + ttl, len(key_bytes), len(value_bytes)
+            )
+
+    @override
+    def data_remove(self, key: K):
+        key_bytes = self._encode_key(key)
+
+        with self._lock_table(exclusive=True):
+            self._remove_slot(self._find_slot(key_bytes))
+
+    @override
+    def data_size(self) -> int:
+        now = time.time()
+        size = 0
+
+        with self._lock_table(exclusive=False):
+            for slot_index in range(self._slots):
+                state, _, expires_at, _, _ = _SLOT_HEADER.unpack_from(self._mem, self._get_slot_offset(slot_index))
+                if state == _SLOT_USED and expires_at > now:
+                    size += 1
+
+        return size
+
+    @override
+    def data_flush(self):
+        with self._lock_table(exclusive=True):
+            for slot_index in range(self._slots):
+                self._mem[self._get_slot_offset(slot_index)] = _SLOT_EMPTY
+
+    @contextmanager
+    def _lock_table(self, exclusive: bool):
+        with self._thread_lock:
+            lock_fd = self._get_lock_fd()
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+    def _get_lock_fd(self) -> int:
+        # Forked processes (i.e. workers of preloaded application) share open file description with parent process,
+        # so file locks wouldn't synchronize them. Memory mapping is still shared, so only lock file is reopened.
+        if self._lock_fd_pid != os.getpid():
+            self._lock_fd = os.open(self._path, os.O_RDWR)
+            self._lock_fd_pid = os.getpid()
+
+        return self._lock_fd
+
+    def _open_table(self) -> mmap.mmap:
+        file_size = _FILE_HEADER_SIZE + self._slots * self._slot_size
+
+        # File is initialized by the first process that opens it, others validate its layout
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                # Slots are zero-filled (empty), file is sparse until slots are written
+                os.ftruncate(self._fd, file_size)
+                os.pwrite(self._fd, _FILE_HEADER.pack(_FILE_MAGIC, self._slots, self._slot_size), 0)
+
+            magic, slots, slot_size = _FILE_HEADER.unpack(os.pread(self._fd, _FILE_HEADER.size, 0))
+            if magic != _FILE_MAGIC:
+                raise Exception("File is not a shared memory cache file")
+
+            if slots != self._slots or slot_size != self._slot_size or os.fstat(self._fd).st_size != file_size:
+                raise Exception(
+                    f"Cache file layout ({slots} slots of {slot_size} bytes) doesn't match cache configuration"
+                )
+
+            return mmap.mmap(self._fd, file_size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _get_slot_offset(self, slot_index: int) -> int:
+        return _FILE_HEADER_SIZE + slot_index * self._slot_size
+
+    @staticmethod
+    def _encode_key(key: K) -> bytes:
+        return str(key).encode()
+
+    def _probe(self, key_hash: int):
+        for probe in range(min(MAX_PROBES, self._slots)):
+            yield (key_hash + probe) % self._slots
+
+    def _find_slot(self, key_bytes: bytes, key_hash: int | None = None) -> int | None:
+        key_hash = _hash_key(key_bytes) if key_hash is None else key_hash
+
+        for slot_index in self._probe(key_hash):
+            offset = self._get_slot_offset(slot_index)
+            state, slot_key_hash, _, key_length, _ = _SLOT_HEADER.unpack_from(self._mem, offset)
+
+            if state == _SLOT_EMPTY:
+                return None
+
+            if state == _SLOT_USED and slot_key_hash == key_hash and key_length == len(key_bytes):
+                key_offset = offset + _SLOT_HEADER.size
+                if self._mem[key_offset : key_offset + key_length] == key_bytes:
+                    return slot_index
+
+        return None
+
+    def _find_free_slot(self, key_hash: int) -> int:
+        now = time.time()
+        evicted_slot_index = None
+        evicted_expires_at = float("inf")
+
+        for slot_index in self._probe(key_hash):
+            state, _, expires_at, _, _ = _SLOT_HEADER.unpack_from(self._mem, self._get_slot_offset(slot_index))
+
+            if state != _SLOT_USED or expires_at <= now:
+                return slot_index
+
+            if expires_at < evicted_expires_at:
+                evicted_slot_index, evicted_expires_at = slot_index, expires_at
+
+        return evicted_slot_index if evicted_slot_index is not None else key_hash % self._slots
+
+    def _remove_slot(self, slot_index: int | None):
+        if slot_index is not None:
+            self._mem[self._get_slot_offset(slot_index)] = _SLOT_DELETED
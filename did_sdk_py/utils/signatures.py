@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+
+from hedera import PublicKey
+
+from .executor import get_executor
+
+DEFAULT_VERIFICATION_BATCH_SIZE = 500
+
+SignatureVerifier = Callable[[bytes, bytes], bool]
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SignatureVerificationTask:
+    """Signature verification task.
+
+    Attributes:
+        verifier: Verifier function bound to signer public key
+        payloads: Candidate signed payloads, signature is valid if it matches any of them
+        signature: Signature bytes
+    """
+
+    verifier: SignatureVerifier | None
+    payloads: Sequence[bytes]
+    signature: bytes
+
+
+def _get_native_ed25519_verifier(public_key_raw: bytes) -> SignatureVerifier | None:
+    try:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    except ImportError:
+        return None
+
+    native_key = Ed25519PublicKey.from_public_bytes(public_key_raw)
+
+    def verify(message: bytes, signature: bytes) -> bool:
+        try:
+            native_key.verify(signature, message)
+            return True
+        except InvalidSignature:
+            return False
+
+    return verify
+
+
+def _get_native_ecdsa_verifier(public_key_raw: bytes) -> SignatureVerifier | None:
+    try:
+        from Crypto.Hash import keccak
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.hazmat.primitives.asymmetric.utils import Prehashed, encode_dss_signature
+        from cryptography.hazmat.primitives.hashes import SHA256
+    except ImportError:
+        return None
+
+    native_key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), public_key_raw)
+    # Hedera signs Keccak-256 digest of the message, Prehashed only uses SHA256 definition to check digest size
+    algorithm = ec.ECDSA(Prehashed(SHA256()))
+
+    def verify(message: bytes, signature: bytes) -> bool:
+        if len(signature) != 64:
+            return False
+
+        digest = keccak.new(data=message, digest_bits=256).digest()
+        r, s = int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big")
+        der_signature = encode_dss_signature(r, s)
+
+        try:
+            native_key.verify(der_signature, digest, algorithm)
+            return True
+        except InvalidSignature:
+            return False
+
+    return verify
+
+
+def get_signature_verifier(public_key: PublicKey, prefer_native: bool = True) -> SignatureVerifier:
+    """Get signature verifier function for public key.
+
+    Native Python verification is used if corresponding optional packages are installed
+    ("cryptography" for Ed25519, "cryptography" and "pycryptodome" for ECDSA secp256k1), which avoids JVM calls per
+    signature. Otherwise, verification is performed by Hedera SDK.
+
+    Args:
+        public_key: Signer public key
+        prefer_native: Use native Python verification if available
+
+    Returns:
+        Function that verifies signature for message bytes
+    """
+    if prefer_native:
+        try:
+            public_key_raw = bytes(public_key.toBytesRaw())
+
+            native_verifier = (
+                _get_native_ed25519_verifier(public_key_raw)
+                if public_key.isED25519()
+                else _get_native_ecdsa_verifier(public_key_raw)
+            )
+
+            if native_verifier:
+                return native_verifier
+        except Exception as error:
+            LOGGER.debug(f"Native signature verification is not available, using Hedera SDK: {error!s}")
+
+    def verify(message: bytes, signature: bytes) -> bool:
+        try:
+            return bool(public_key.verify(message, signature))
+        except Exception:
+            return False
+
+    return verify
+
+
+def _verify(task: SignatureVerificationTask) -> bool:
+    verifier = task.verifier
+
+    if not verifier:
+        return False
+
+    return any(verifier(payload, task.signature) for payload in task.payloads)
+
+
+def _verify_batch(tasks: Sequence[SignatureVerificationTask]) -> list[bool]:
+    return [_verify(task) for task in tasks]
+
+
+async def verify_signatures_async(
+    tasks: Sequence[SignatureVerificationTask], batch_size: int = DEFAULT_VERIFICATION_BATCH_SIZE
+) -> list[bool]:
+    """Verify signatures in batches, off the event loop (in SDK executor).
+
+    Args:
+        tasks: Verification tasks
+        batch_size: Number of signatures verified by single worker call
+
+    Returns:
+        Verification results, in the same order as tasks
+    """
+    batches = [tasks[index : index + batch_size] for index in range(0, len(tasks), batch_size)]
+    executor = get_executor()
+    results = await asyncio.gather(*(executor.run(partial(_verify_batch, batch)) for batch in batches))
+
+    return list(chain.from_iterable(results))
@@ -1,42 +1,105 @@
+import math
 import random
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from typing import TYPE_CHECKING
 
-from hedera import JInstant
+# Hedera SDK import starts JVM, so it's deferred until conversion is needed
+if TYPE_CHECKING:
+    from hedera import JInstant
 
-# Used to improve collision-safety (approach is based on JS SDK implementation)
-generated_ids: set[str] = set()
+NANOS_IN_SECOND = 1_000_000_000
+
+_MIN_JITTER_MILLIS = 8000
+_MAX_JITTER_MILLIS = _MIN_JITTER_MILLIS + 5000
+
+# Used to improve collision-safety (approach is based on JS SDK implementation).
+# Generated timestamps are kept only while new timestamps can collide with them (see 'Timestamp.generate').
+_generated_timestamps: set[int] = set()
+_generated_timestamps_order: deque[int] = deque()
+_generated_timestamps_lock = threading.Lock()
+
+
+def _to_nanos(value: int | float, nanos_in_unit: int) -> int:
+    if isinstance(value, int):
+        return value * nanos_in_unit
+
+    # Whole and fractional parts are converted separately to keep float precision for large epoch values
+    whole = math.floor(value)
+    return whole * nanos_in_unit + round((value - whole) * nanos_in_unit)
 
 
-@dataclass
 class Timestamp:
-    seconds: float
-    nanos: float
+    """Timestamp with nanosecond precision.
+
+    Stored as a single integer number of nanoseconds since epoch, since large numbers of timestamps are kept in memory
+    (for instance, for every cached HCS message).
+
+    Args:
+        seconds: Seconds since epoch. Fractional part is carried into nanoseconds
+        nanos: Nanoseconds
+    """
+
+    __slots__ = ("epoch_nanos",)
+
+    epoch_nanos: int
+
+    def __init__(self, seconds: int | float, nanos: int | float = 0):
+        self.epoch_nanos = _to_nanos(seconds, NANOS_IN_SECOND) + _to_nanos(nanos, 1)
+
+    @property
+    def seconds(self) -> int:
+        return self.epoch_nanos // NANOS_IN_SECOND
+
+    @property
+    def nanos(self) -> int:
+        return self.epoch_nanos % NANOS_IN_SECOND
 
     @classmethod
     def generate(cls):
-        jitter = random.randint(0, 5000) + 8000  # noqa: S311
-        now = int(time.time() * 1000) - jitter
-        seconds = now // 1000
-        nanos = (now % 1000) * 1000000 + random.randint(0, 1000000)  # noqa: S311
+        jitter = random.randint(_MIN_JITTER_MILLIS, _MAX_JITTER_MILLIS)  # noqa: S311
+        now = int(time.time() * 1000)
+        seconds, millis = divmod(now - jitter, 1000)
+        nanos = millis * 1000000 + random.randint(0, 1000000)  # noqa: S311
 
         timestamp = cls(seconds, nanos)
-        if str(timestamp) in generated_ids:
-            return Timestamp.generate()
-        else:
-            generated_ids.add(str(timestamp))
-            return timestamp
+
+        with _generated_timestamps_lock:
+            # Timestamps older than max jitter cannot be generated anymore, so they are not needed for collision checks
+            min_epoch_nanos = (now - _MAX_JITTER_MILLIS) * 1000000
+            while _generated_timestamps_order and _generated_timestamps_order[0] < min_epoch_nanos:
+                _generated_timestamps.discard(_generated_timestamps_order.popleft())
+
+            if timestamp.epoch_nanos in _generated_timestamps:
+                is_collision = True
+            else:
+                is_collision = False
+                _generated_timestamps.add(timestamp.epoch_nanos)
+                _generated_timestamps_order.append(timestamp.epoch_nanos)
+
+        return Timestamp.generate() if is_collision else timestamp
 
     @classmethod
-    def from_jinstant(cls, jinstant: JInstant):
+    def from_jinstant(cls, jinstant: "JInstant"):
         return cls(jinstant.getEpochSecond(), jinstant.getNano())
 
-    def to_jinstant(self) -> JInstant:
+    def to_jinstant(self) -> "JInstant":
+        from hedera import JInstant
+
         return JInstant.ofEpochSecond(self.seconds, self.nanos)
 
     def __str__(self):
         zero_padded_nanos = str(self.nanos).rjust(9, "0")
         return f"{self.seconds!s}.{zero_padded_nanos}"
 
+    def __repr__(self):
+        return f"{self.__class__.__name__}(seconds={self.seconds}, nanos={self.nanos})"
+
     def __eq__(self, other):
-        return self.seconds == other.seconds and self.nanos == other.nanos
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self.epoch_nanos == other.epoch_nanos
+
+    def __hash__(self):
+        return hash(self.epoch_nanos)
@@ -0,0 +1,43 @@
+import importlib
+import logging
+import threading
+
+# SDK modules that import Hedera SDK, which starts JVM and loads Java classes on import
+WARM_UP_MODULES = (
+    "did_sdk_py.hedera_client_provider",
+    "did_sdk_py.did.hedera_did",
+    "did_sdk_py.did.hedera_did_resolver",
+    "did_sdk_py.anoncreds.hedera_anoncreds_registry",
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _import_modules():
+    try:
+        for module_name in WARM_UP_MODULES:
+            importlib.import_module(module_name)
+        LOGGER.debug("SDK warm-up has finished")
+    except Exception as error:
+        LOGGER.error(f"Error on SDK warm-up: {error!s}")
+
+
+def warm_up(wait: bool = False) -> threading.Thread:
+    """Start JVM and import SDK modules that depend on Hedera SDK in background.
+
+    SDK modules are imported lazily, so JVM is started on first use of Hedera-dependent API. Warm-up can be used
+    to move startup cost out of the first request (for instance, right after application start).
+
+    Args:
+        wait: Block until warm-up is finished
+
+    Returns:
+        Warm-up thread
+    """
+    thread = threading.Thread(target=_import_modules, name="did-sdk-warm-up", daemon=True)
+    thread.start()
+
+    if wait:
+        thread.join()
+
+    return thread
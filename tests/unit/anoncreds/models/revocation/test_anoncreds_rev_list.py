@@ -61,6 +61,26 @@ class TestAnonCredsRevList:
             issuer_id="mock-issuer-id",
         )
 
+    @pytest.mark.asyncio
+    async def test_from_rev_reg_entries_stream(self):
+        async def entries_stream():
+            for entry in [MOCK_REV_ENTRY_1, MOCK_REV_ENTRY_2, MOCK_REV_ENTRY_3]:
+                yield entry
+
+        rev_list = await AnonCredsRevList.from_rev_reg_entries_stream(
+            entries_stream(), MOCK_REV_LIST_PARAMS["rev_reg_def_id"], MOCK_REV_REG_DEF
+        )
+        assert rev_list == AnonCredsRevList(
+            revocation_list=[1, 0, 0, 0, 0, 1, 0, 0, 1, 1],
+            current_accumulator="accum-3",
+            rev_reg_def_id=MOCK_REV_LIST_PARAMS["rev_reg_def_id"],
+            issuer_id="mock-issuer-id",
+        )
+
+    def test_from_rev_reg_entries_throws_on_empty_entries(self):
+        with pytest.raises(Exception, match="revocation registry entries are empty"):
+            AnonCredsRevList.from_rev_reg_entries([], MOCK_REV_LIST_PARAMS["rev_reg_def_id"], MOCK_REV_REG_DEF)
+
     def test_serializes_to_json(self):
         rev_list = AnonCredsRevList(**MOCK_REV_LIST_PARAMS)
         assert rev_list.get_json_payload() == MOCK_REV_LIST_JSON_PAYLOAD
@@ -1,6 +1,12 @@
 import pytest
 
-from did_sdk_py.anoncreds.models.revocation import AnonCredsRevRegEntry, RevRegEntryValue
+from did_sdk_py.anoncreds.models.revocation import AnonCredsRevRegEntry, HcsRevRegEntryMessage, RevRegEntryValue
+from did_sdk_py.utils.compression import (
+    register_compression_dictionary,
+    set_compression_dictionary,
+    train_compression_dictionary,
+)
+from did_sdk_py.utils.json_codec import json_dumps
 
 MOCK_REV_REG_ENTRY_PARAMS = {
     "ver": "mock-version",
@@ -25,6 +31,29 @@ class TestAnonCredsRevRegEntry:
     def test_deserializes_from_json(self):
         AnonCredsRevRegEntry.from_json_payload(MOCK_COMPRESSED_REV_REG_ENTRY_PAYLOAD)
 
+    def test_serializes_to_json_with_compression_dictionary(self):
+        dictionary = train_compression_dictionary(
+            [
+                json_dumps({
+                    "ver": "1.0",
+                    "value": {"accum": f"21 {index:064X} 21 {index:064X}", "revoked": [index]},
+                }).encode()
+                for index in range(500)
+            ],
+            dict_size=4096,
+            dict_id=40101,
+        )
+        rev_reg_entry = AnonCredsRevRegEntry(**MOCK_REV_REG_ENTRY_PARAMS)
+
+        set_compression_dictionary("rev_reg_entry", register_compression_dictionary(dictionary))
+        try:
+            json_payload = rev_reg_entry.get_json_payload()
+        finally:
+            set_compression_dictionary("rev_reg_entry", None)
+
+        assert json_payload != MOCK_COMPRESSED_REV_REG_ENTRY_PAYLOAD
+        assert AnonCredsRevRegEntry.from_json_payload(json_payload) == rev_reg_entry
+
     def test_serializes_to_json_raw(self):
         rev_reg_entry = AnonCredsRevRegEntry(**MOCK_REV_REG_ENTRY_PARAMS)
         assert rev_reg_entry._get_json_payload_raw() == MOCK_REV_REG_ENTRY_JSON_PAYLOAD
@@ -37,3 +66,10 @@ class TestAnonCredsRevRegEntry:
             Exception, match=f"{AnonCredsRevRegEntry.__name__} JSON parsing failed: Invalid JSON structure"
         ):
             AnonCredsRevRegEntry.from_json_payload({})
+
+    def test_entry_message_uses_slots(self):
+        message = HcsRevRegEntryMessage(**MOCK_REV_REG_ENTRY_PARAMS)
+
+        assert not hasattr(message, "__dict__")
+        assert message.to_json_bytes() is message.to_json_bytes()
+        assert message.to_json() == AnonCredsRevRegEntry(**MOCK_REV_REG_ENTRY_PARAMS).to_json()
@@ -22,6 +22,7 @@ from did_sdk_py.anoncreds.types import (
     GetRevListResult,
     GetRevRegDefResult,
     GetSchemaResult,
+    PresentationCredentialIdentifiers,
     RegisterCredDefResult,
     RegisterRevListResult,
     RegisterRevRegDefResult,
@@ -38,6 +39,8 @@ from did_sdk_py.hcs import (
     HcsMessageWithResponseMetadata,
     HcsTopicService,
 )
+from did_sdk_py.utils.cache import StaleWhileRevalidatePolicy, TimestampedRecord
+from did_sdk_py.utils.prefetch import PrefetchResult
 from did_sdk_py.utils.timestamp import Timestamp
 from tests.integration.conftest import OPERATOR_KEY_DER
 
@@ -155,7 +158,7 @@ def mock_hcs_message_transaction(mocker: MockerFixture):
     )
 
     mock_hcs_message_transaction = MockHcsMessageTransaction.return_value
-    mock_hcs_message_transaction.execute = mocker.AsyncMock()
+    mock_hcs_message_transaction.execute = mocker.AsyncMock(return_value=None)
 
     return mock_hcs_message_transaction
 
@@ -215,6 +218,33 @@ class TestHederaAnonCredsRegistry:
             mock_hcs_file_service.resolve_file.assert_awaited_once()
             mock_hcs_file_service.resolve_file.assert_awaited_with(MOCK_SCHEMA_TOPIC_ID)
 
+        async def test_resolve_caches_not_found_result(
+            self,
+            mock_client_provider: HederaClientProvider,
+            mock_hcs_file_service: NonCallableMagicMock,
+        ):
+            mock_hcs_file_service.resolve_file.return_value = None
+
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+            schema_resolution_result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert await registry.get_schema(MOCK_SCHEMA_ID) == schema_resolution_result
+            assert schema_resolution_result.resolution_metadata["error"] == "notFound"
+            mock_hcs_file_service.resolve_file.assert_awaited_once()
+
+        async def test_resolve_does_not_cache_not_found_result_if_disabled(
+            self,
+            mock_client_provider: HederaClientProvider,
+            mock_hcs_file_service: NonCallableMagicMock,
+        ):
+            mock_hcs_file_service.resolve_file.return_value = None
+
+            registry = HederaAnonCredsRegistry(mock_client_provider, negative_cache=None)
+            await registry.get_schema(MOCK_SCHEMA_ID)
+            await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert mock_hcs_file_service.resolve_file.await_count == 2
+
         async def test_resolve_returns_not_found_on_invalid_id(
             self,
             mock_client_provider: HederaClientProvider,
@@ -268,6 +298,26 @@ class TestHederaAnonCredsRegistry:
 
             mock_cache_get.assert_called_once_with(MOCK_SCHEMA_TOPIC_ID)
 
+        async def test_prefetches_anoncreds_objects(
+            self, mock_client_provider: HederaClientProvider, mock_hcs_file_service: NonCallableMagicMock
+        ):
+            mock_hcs_file_service.resolve_file.side_effect = lambda topic_id: (
+                MOCK_SCHEMA.to_json().encode() if topic_id == MOCK_SCHEMA_TOPIC_ID else None
+            )
+
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+            results = await registry.prefetch([MOCK_SCHEMA_ID, MOCK_CRED_DEF_ID])
+
+            assert results[0] == PrefetchResult(MOCK_SCHEMA_ID)
+            assert results[1].error == (
+                f"notFound: AnonCreds credential definition with id '{MOCK_CRED_DEF_ID}' not found"
+            )
+
+            schema_resolution_result = await registry.get_schema(MOCK_SCHEMA_ID)
+
+            assert schema_resolution_result.schema == MOCK_SCHEMA
+            assert mock_hcs_file_service.resolve_file.await_count == 2
+
     class TestCredDef:
         async def test_resolves_cred_def_hcs_file(
             self,
@@ -602,6 +652,60 @@ class TestHederaAnonCredsRegistry:
 
             mock_hcs_message_resolver.execute.assert_awaited()
 
+        async def test_returns_cached_entries_and_refreshes_in_background(
+            self,
+            mock_client_provider: HederaClientProvider,
+            mock_hcs_file_service: NonCallableMagicMock,
+            mock_hcs_message_resolver: NonCallableMagicMock,
+            mock_rev_list: AnonCredsRevList,
+            mock_rev_list_previous: AnonCredsRevList,
+        ):
+            mock_hcs_file_service.resolve_file.return_value = MOCK_REV_REG_DEF_WITH_METADATA.to_json().encode()
+            mock_hcs_message_resolver.execute.side_effect = [
+                MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[:2],
+                [MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[2]],
+                [],
+            ]
+
+            registry = HederaAnonCredsRegistry(
+                mock_client_provider, stale_while_revalidate=StaleWhileRevalidatePolicy(min_refresh_interval=0)
+            )
+            await registry.get_rev_list(MOCK_REV_REG_DEF_ID, int(time.time()) - 1)
+
+            resolution_result = await registry.get_rev_list(MOCK_REV_REG_DEF_ID, int(time.time()) + 1)
+            assert resolution_result.revocation_list == mock_rev_list_previous
+
+            await registry._background_refresher.wait_for_pending()
+            assert mock_hcs_message_resolver.execute.await_count == 2
+
+            resolution_result = await registry.get_rev_list(MOCK_REV_REG_DEF_ID, int(time.time()) + 1)
+            assert resolution_result.revocation_list == mock_rev_list
+
+            await registry._background_refresher.wait_for_pending()
+
+        async def test_waits_for_entries_if_cache_is_too_stale(
+            self,
+            mock_client_provider: HederaClientProvider,
+            mock_hcs_file_service: NonCallableMagicMock,
+            mock_hcs_message_resolver: NonCallableMagicMock,
+            mock_rev_list: AnonCredsRevList,
+        ):
+            mock_hcs_file_service.resolve_file.return_value = MOCK_REV_REG_DEF_WITH_METADATA.to_json().encode()
+            mock_hcs_message_resolver.execute.side_effect = [
+                MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[:2],
+                [MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[2]],
+            ]
+
+            registry = HederaAnonCredsRegistry(
+                mock_client_provider, stale_while_revalidate=StaleWhileRevalidatePolicy(max_staleness=0)
+            )
+            await registry.get_rev_list(MOCK_REV_REG_DEF_ID, int(time.time()) - 1)
+
+            resolution_result = await registry.get_rev_list(MOCK_REV_REG_DEF_ID, int(time.time()) + 1)
+            assert resolution_result.revocation_list == mock_rev_list
+
+            assert mock_hcs_message_resolver.execute.await_count == 2
+
         async def test_registers_rev_list(
             self,
             mock_client_provider: HederaClientProvider,
@@ -692,8 +796,8 @@ class TestHederaAnonCredsRegistry:
                 revocation_list_metadata={},
             )
 
-            assert mock_hcs_file_service.resolve_file.await_count == 2
-            mock_hcs_file_service.resolve_file.assert_awaited_with(MOCK_REV_REG_DEF_TOPIC_ID)
+            # "Not found" result of the first lookup is cached
+            mock_hcs_file_service.resolve_file.assert_awaited_once_with(MOCK_REV_REG_DEF_TOPIC_ID)
 
             mock_hcs_message_transaction.execute.assert_not_awaited()
 
@@ -754,7 +858,7 @@ class TestHederaAnonCredsRegistry:
         ):
             mock_cache_instance.get.side_effect = [
                 MOCK_REV_REG_DEF_WITH_METADATA,
-                MOCK_REV_ENTRY_MESSAGES_WITH_METADATA,
+                TimestampedRecord(MOCK_REV_ENTRY_MESSAGES_WITH_METADATA),
             ]
 
             registry = HederaAnonCredsRegistry(mock_client_provider, mock_cache_instance)
@@ -786,7 +890,7 @@ class TestHederaAnonCredsRegistry:
         ):
             mock_cache_instance.get.side_effect = [
                 MOCK_REV_REG_DEF_WITH_METADATA,
-                MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[:-1],
+                TimestampedRecord(MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[:-1]),
             ]
             mock_hcs_message_resolver.execute.return_value = [MOCK_REV_ENTRY_MESSAGES_WITH_METADATA[-1]]
 
@@ -808,3 +912,90 @@ class TestHederaAnonCredsRegistry:
             ])
 
             mock_hcs_message_resolver.execute.assert_awaited_once()
+
+    class TestBatchResolution:
+        @pytest.fixture
+        def mock_hcs_files(self, mock_hcs_file_service: NonCallableMagicMock):
+            hcs_files = {
+                MOCK_SCHEMA_TOPIC_ID: MOCK_SCHEMA.to_json().encode(),
+                MOCK_CRED_DEF_TOPIC_ID: MOCK_CRED_DEF.to_json().encode(),
+                MOCK_REV_REG_DEF_TOPIC_ID: MOCK_REV_REG_DEF_WITH_METADATA.to_json().encode(),
+            }
+            mock_hcs_file_service.resolve_file.side_effect = lambda topic_id: hcs_files.get(topic_id)
+
+            return mock_hcs_file_service
+
+        async def test_resolves_schemas_once_per_topic(
+            self, mock_client_provider: HederaClientProvider, mock_hcs_files: NonCallableMagicMock
+        ):
+            # Different ID with the same topic ID
+            other_issuer_schema_id = build_anoncreds_identifier(
+                "did:hedera:testnet:zvAQyPeUecGck2EsxcsihxhAB6jZurFrBbj2gC7CNkS5o_0.0.5063028",
+                MOCK_SCHEMA_TOPIC_ID,
+                AnonCredsObjectType.SCHEMA,
+            )
+            missing_schema_id = build_anoncreds_identifier(ISSUER_ID, "0.0.5063031", AnonCredsObjectType.SCHEMA)
+
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+            results = await registry.get_schemas([
+                MOCK_SCHEMA_ID,
+                other_issuer_schema_id,
+                MOCK_SCHEMA_ID,
+                missing_schema_id,
+                "invalid",
+            ])
+
+            assert list(results) == [MOCK_SCHEMA_ID, other_issuer_schema_id, missing_schema_id, "invalid"]
+            assert results[MOCK_SCHEMA_ID] == await registry.get_schema(MOCK_SCHEMA_ID)
+            assert results[other_issuer_schema_id].schema == MOCK_SCHEMA
+            assert results[missing_schema_id].resolution_metadata["error"] == "notFound"
+            assert results["invalid"].resolution_metadata["error"] == "otherError"
+
+            assert sorted(call.args[0] for call in mock_hcs_files.resolve_file.await_args_list) == [
+                MOCK_SCHEMA_TOPIC_ID,
+                "0.0.5063031",
+            ]
+
+        async def test_resolves_cred_defs_and_rev_reg_defs(
+            self, mock_client_provider: HederaClientProvider, mock_hcs_files: NonCallableMagicMock
+        ):
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+
+            cred_defs = await registry.get_cred_defs([MOCK_CRED_DEF_ID])
+            rev_reg_defs = await registry.get_rev_reg_defs([MOCK_REV_REG_DEF_ID])
+
+            assert cred_defs[MOCK_CRED_DEF_ID].credential_definition == MOCK_CRED_DEF
+            assert rev_reg_defs[MOCK_REV_REG_DEF_ID].revocation_registry_definition == MOCK_REV_REG_DEF
+
+        async def test_resolves_objects_for_presentation(
+            self,
+            mock_client_provider: HederaClientProvider,
+            mock_hcs_files: NonCallableMagicMock,
+            mock_hcs_message_resolver: NonCallableMagicMock,
+        ):
+            timestamp = int(time.time())
+            identifiers = [
+                PresentationCredentialIdentifiers(MOCK_SCHEMA_ID, MOCK_CRED_DEF_ID, MOCK_REV_REG_DEF_ID, timestamp),
+                PresentationCredentialIdentifiers(MOCK_SCHEMA_ID, MOCK_CRED_DEF_ID, MOCK_REV_REG_DEF_ID, timestamp),
+                PresentationCredentialIdentifiers(MOCK_SCHEMA_ID, MOCK_CRED_DEF_ID),
+            ]
+
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+            result = await registry.resolve_for_presentation(identifiers)
+
+            assert list(result.schemas) == [MOCK_SCHEMA_ID]
+            assert result.schemas[MOCK_SCHEMA_ID].schema == MOCK_SCHEMA
+            assert result.cred_defs[MOCK_CRED_DEF_ID].credential_definition == MOCK_CRED_DEF
+            assert result.rev_reg_defs[MOCK_REV_REG_DEF_ID].revocation_registry_definition == MOCK_REV_REG_DEF
+            assert list(result.rev_lists) == [(MOCK_REV_REG_DEF_ID, timestamp)]
+            assert result.rev_lists[(MOCK_REV_REG_DEF_ID, timestamp)].revocation_list is not None
+
+            # Every HCS file is resolved once, revocation registry definition is served from cache for revocation list
+            assert mock_hcs_files.resolve_file.await_count == 3
+            mock_hcs_message_resolver.execute.assert_awaited_once()
+
+        async def test_throws_on_invalid_concurrency(self, mock_client_provider: HederaClientProvider):
+            registry = HederaAnonCredsRegistry(mock_client_provider)
+
+            with pytest.raises(Exception, match="Max number of concurrent resolutions must be positive"):
+                await registry.get_schemas([MOCK_SCHEMA_ID], max_concurrency=0)
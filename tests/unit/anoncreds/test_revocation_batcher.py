@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py import AnonCredsRevList, HederaAnonCredsRegistry, RevocationBatcher
+from did_sdk_py.anoncreds.types import RegisterRevListResult, RevListState
+
+ISSUER_ID = "did:hedera:testnet:zvAQyPeUecGck2EsxcsihxhAB6jZurFrBbj2gC7CNkS5o_0.0.5063027"
+MOCK_REV_REG_DEF_ID = f"{ISSUER_ID}/anoncreds/v0/REV_REG/0.0.5063050"
+MOCK_ISSUER_KEY_DER = "mock-issuer-key"
+
+
+def _rev_list(accumulator: str, rev_reg_def_id: str = MOCK_REV_REG_DEF_ID) -> AnonCredsRevList:
+    return AnonCredsRevList(
+        issuer_id=ISSUER_ID,
+        rev_reg_def_id=rev_reg_def_id,
+        revocation_list=[0] * 10,
+        current_accumulator=accumulator,
+    )
+
+
+@pytest.fixture
+def mock_registry(mocker: MockerFixture):
+    mock_registry = mocker.AsyncMock(spec=HederaAnonCredsRegistry)
+    mock_registry.update_rev_list.side_effect = lambda prev_list, curr_list, revoked, issuer_key_der: (
+        RegisterRevListResult(
+            revocation_list_state=RevListState(state="finished", revocation_list=curr_list),
+            registration_metadata={},
+            revocation_list_metadata={},
+        )
+    )
+    return mock_registry
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestRevocationBatcher:
+    async def test_publishes_merged_entry_after_window(self, mock_registry):
+        batcher = RevocationBatcher(mock_registry, window_seconds=0.01)
+        rev_lists = [_rev_list(f"accum-{index}") for index in range(4)]
+
+        results = await asyncio.gather(
+            batcher.update_rev_list(rev_lists[0], rev_lists[1], [1, 2], MOCK_ISSUER_KEY_DER),
+            batcher.update_rev_list(rev_lists[1], rev_lists[2], [2, 3], MOCK_ISSUER_KEY_DER),
+            batcher.update_rev_list(rev_lists[2], rev_lists[3], [7], MOCK_ISSUER_KEY_DER),
+        )
+
+        mock_registry.update_rev_list.assert_awaited_once_with(
+            rev_lists[0], rev_lists[3], [1, 2, 3, 7], MOCK_ISSUER_KEY_DER
+        )
+
+        assert [result.revocation_list_state.state for result in results] == ["finished"] * 3
+        assert [result.revocation_list_state.revocation_list for result in results] == rev_lists[1:]
+        assert all(result.registration_metadata["batch_size"] == 3 for result in results)
+
+    async def test_publishes_batch_on_max_size(self, mock_registry):
+        batcher = RevocationBatcher(mock_registry, window_seconds=60, max_batch_size=3)
+        rev_lists = [_rev_list(f"accum-{index}") for index in range(4)]
+
+        first_future = batcher.submit(rev_lists[0], rev_lists[1], [1, 2], MOCK_ISSUER_KEY_DER)
+        second_future = batcher.submit(rev_lists[1], rev_lists[2], [3], MOCK_ISSUER_KEY_DER)
+        third_future = batcher.submit(rev_lists[2], rev_lists[3], [4], MOCK_ISSUER_KEY_DER)
+
+        await asyncio.gather(first_future, second_future)
+        assert not third_future.done()
+
+        mock_registry.update_rev_list.assert_awaited_once_with(
+            rev_lists[0], rev_lists[2], [1, 2, 3], MOCK_ISSUER_KEY_DER
+        )
+
+        await batcher.flush()
+
+        assert third_future.done()
+        assert mock_registry.update_rev_list.await_count == 2
+        mock_registry.update_rev_list.assert_awaited_with(rev_lists[2], rev_lists[3], [4], MOCK_ISSUER_KEY_DER)
+
+    async def test_publishes_pending_updates_on_broken_chain(self, mock_registry):
+        batcher = RevocationBatcher(mock_registry, window_seconds=60)
+
+        batcher.submit(_rev_list("accum-0"), _rev_list("accum-1"), [1], MOCK_ISSUER_KEY_DER)
+        batcher.submit(_rev_list("accum-5"), _rev_list("accum-6"), [2], MOCK_ISSUER_KEY_DER)
+
+        await batcher.flush()
+
+        assert mock_registry.update_rev_list.await_count == 2
+
+    async def test_fails_all_batch_requests_on_error(self, mock_registry):
+        mock_registry.update_rev_list.side_effect = Exception("mock-error")
+        batcher = RevocationBatcher(mock_registry, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.update_rev_list(_rev_list("accum-0"), _rev_list("accum-1"), [1], MOCK_ISSUER_KEY_DER),
+            batcher.update_rev_list(_rev_list("accum-1"), _rev_list("accum-2"), [2], MOCK_ISSUER_KEY_DER),
+        )
+
+        assert [result.revocation_list_state.state for result in results] == ["failed", "failed"]
+        assert all("mock-error" in str(result.revocation_list_state.reason) for result in results)
+
+    async def test_rejects_mismatching_rev_reg_ids(self, mock_registry):
+        batcher = RevocationBatcher(mock_registry)
+
+        result = await batcher.update_rev_list(
+            _rev_list("accum-0"), _rev_list("accum-1", "other-rev-reg-def-id"), [1], MOCK_ISSUER_KEY_DER
+        )
+
+        assert result.revocation_list_state.state == "failed"
+        mock_registry.update_rev_list.assert_not_awaited()
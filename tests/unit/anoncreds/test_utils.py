@@ -51,6 +51,10 @@ class TestAnonCredsUtils:
             ),
             (f"{PUBLISHER_DID_1}/anoncreds/v0/INVALID_TYPE/{TOPIC_ID_1}", "Invalid AnonCreds object type"),
             (f"invalid_did/anoncreds/v0/{AnonCredsObjectType.SCHEMA}/{TOPIC_ID_1}", "Cannot parse issuer identifier"),
+            (
+                f"{PUBLISHER_DID_1}/anoncreds/v0/{AnonCredsObjectType.SCHEMA}/0.0.abc",
+                "Identifier contains invalid topic ID",
+            ),
         ],
     )
     def test_parse_throws_on_invalid_data(self, invalid_identifier, expected_error_message):
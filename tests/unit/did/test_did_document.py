@@ -9,9 +9,15 @@ from did_sdk_py.did.hcs.events.document.hcs_did_create_did_document_event import
 from did_sdk_py.did.hcs.events.document.hcs_did_delete_event import HcsDidDeleteEvent
 from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
 from did_sdk_py.did.hcs.events.service.hcs_did_update_service_event import HcsDidUpdateServiceEvent
+from did_sdk_py.did.hcs.events.verification_method.hcs_did_revoke_verification_method_event import (
+    HcsDidRevokeVerificationMethodEvent,
+)
 from did_sdk_py.did.hcs.events.verification_method.hcs_did_update_verification_method_event import (
     HcsDidUpdateVerificationMethodEvent,
 )
+from did_sdk_py.did.hcs.events.verification_relationship.hcs_did_revoke_verification_relationship_event import (
+    HcsDidRevokeVerificationRelationshipEvent,
+)
 from did_sdk_py.did.hcs.events.verification_relationship.hcs_did_update_verification_relationship_event import (
     HcsDidUpdateVerificationRelationshipEvent,
 )
@@ -91,6 +97,36 @@ class TestDidDocument:
         assert not doc.deactivated
         assert doc.version_id
 
+    @pytest.mark.asyncio
+    async def test_processes_messages_stream(self, test_key):
+        """processes messages consumed from async iterable"""
+
+        async def messages_stream():
+            yield HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateDidOwnerEvent(
+                    f"{IDENTIFIER_2}#did-root-key", IDENTIFIER_2, test_key.public_key, test_key.key_type
+                ),
+            )
+            yield HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateServiceEvent(f"{IDENTIFIER_2}#service-1", "LinkedDomains", "https://test.identity.com"),
+            )
+
+        doc = DidDocument(IDENTIFIER_2)
+        await doc.process_messages(messages_stream())
+
+        assert doc.get_json_payload()["service"] == [
+            {
+                "id": f"{IDENTIFIER_2}#service-1",
+                "serviceEndpoint": "https://test.identity.com",
+                "type": "LinkedDomains",
+            }
+        ]
+        assert doc.controller
+
     @patch("did_sdk_py.did.did_document.download_ipfs_document_by_cid")
     @pytest.mark.asyncio
     async def test_handle_did_create_doc_event(self, mock_download_ipfs_document_by_cid, test_key):
@@ -347,6 +383,13 @@ class TestDidDocument:
                 },
             ],
         }
+        assert doc.verification_relationships == {
+            "authentication": [f"{IDENTIFIER_2}#did-root-key"],
+            "assertionMethod": [f"{IDENTIFIER_2}#did-root-key"],
+            "keyAgreement": [],
+            "capabilityInvocation": [],
+            "capabilityDelegation": [f"{IDENTIFIER_2}#key-2"],
+        }
         assert doc.created
         assert doc.updated
         assert not doc.deactivated
@@ -591,3 +634,73 @@ class TestDidDocument:
         assert doc.updated
         assert not doc.deactivated
         assert doc.version_id
+
+    @pytest.mark.asyncio
+    async def test_handle_revoke_ver_method_with_multiple_ver_rels(self, test_key):
+        """removes revoked verificationMethod from every verificationRelationship, keeping order of the rest"""
+        key1 = PRIVATE_KEY_ARR[0]
+        key1_type = get_key_type(key1)
+
+        key2 = PRIVATE_KEY_ARR[1]
+        key2_type = get_key_type(key2)
+
+        messages = [
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateDidOwnerEvent(
+                    f"{IDENTIFIER_2}#did-root-key", IDENTIFIER_2, test_key.public_key, test_key.key_type
+                ),
+            ),
+            *(
+                HcsDidMessage(
+                    DidDocumentOperation.CREATE,
+                    IDENTIFIER_2,
+                    HcsDidUpdateVerificationRelationshipEvent(
+                        f"{IDENTIFIER_2}#{key_id}", key.getPublicKey(), IDENTIFIER_2, relationship_type, key_type
+                    ),
+                )
+                for key_id, key, key_type, relationship_type in (
+                    ("key-1", key1, key1_type, "keyAgreement"),
+                    ("key-2", key2, key2_type, "keyAgreement"),
+                    ("key-1", key1, key1_type, "authentication"),
+                    ("key-2", key2, key2_type, "capabilityInvocation"),
+                )
+            ),
+            HcsDidMessage(
+                DidDocumentOperation.REVOKE,
+                IDENTIFIER_2,
+                HcsDidRevokeVerificationMethodEvent(f"{IDENTIFIER_2}#key-1"),
+            ),
+            HcsDidMessage(
+                DidDocumentOperation.REVOKE,
+                IDENTIFIER_2,
+                HcsDidRevokeVerificationRelationshipEvent(f"{IDENTIFIER_2}#key-2", "keyAgreement"),
+            ),
+        ]
+
+        doc = DidDocument(IDENTIFIER_2)
+
+        await doc.process_messages(messages)
+
+        assert doc.get_json_payload() == {
+            "@context": "https://www.w3.org/ns/did/v1",
+            "assertionMethod": [f"{IDENTIFIER_2}#did-root-key"],
+            "authentication": [f"{IDENTIFIER_2}#did-root-key"],
+            "capabilityInvocation": [f"{IDENTIFIER_2}#key-2"],
+            "id": IDENTIFIER_2,
+            "verificationMethod": [
+                {
+                    "controller": IDENTIFIER_2,
+                    "id": f"{IDENTIFIER_2}#did-root-key",
+                    "publicKeyBase58": test_key.public_key_base58,
+                    "type": test_key.key_type,
+                },
+                {
+                    "controller": IDENTIFIER_2,
+                    "id": f"{IDENTIFIER_2}#key-2",
+                    "publicKeyBase58": bytes_to_b58(bytes(key2.getPublicKey().toBytes())),
+                    "type": key2_type,
+                },
+            ],
+        }
@@ -1,9 +1,16 @@
+import json
+import time
+from hashlib import sha256
 from typing import cast
 
+import pytest
+
 from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs.events.hcs_did_event_target import HcsDidEventTarget
 from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
-from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
 from did_sdk_py.did.hedera_did import HederaDid
+from did_sdk_py.utils.encoding import str_to_b64
 
 from .common import DID_TOPIC_ID_1, DID_TOPIC_ID_2, IDENTIFIER
 
@@ -72,3 +79,105 @@ class TestHcsDidMessage:
 
         assert message.is_valid(DID_TOPIC_ID_1)
         assert not message.is_valid(DID_TOPIC_ID_2)
+
+    def test_reuses_received_bytes_of_parsed_message(self, test_key):
+        """Test parsed message is encoded and hashed as received, without re-encoding"""
+        message = HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER}#did-root-key", IDENTIFIER, test_key.private_key.getPublicKey(), test_key.key_type
+            ),
+        )
+
+        received_bytes = json.dumps(message.get_json_payload(), indent=2).encode()
+        parsed_message = HcsDidMessage.from_json(received_bytes)
+
+        assert parsed_message.to_json_bytes() == received_bytes
+        assert parsed_message.get_payload_hash() == sha256(received_bytes).hexdigest()
+        assert parsed_message.event_base64 == message.event_base64
+        assert parsed_message.operation == DidDocumentOperation.CREATE
+
+    def test_resets_encoding_on_change(self, test_key):
+        """Test memoized encoding and payload hash are dropped on reset after message change"""
+        message = HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER}#did-root-key", IDENTIFIER, test_key.private_key.getPublicKey(), test_key.key_type
+            ),
+            timestamp=1,
+        )
+        payload_hash = message.get_payload_hash()
+
+        message.timestamp = 2
+        message._reset_json_encoding()
+
+        assert json.loads(message.to_json())["timestamp"] == 2
+        assert message.get_payload_hash() != payload_hash
+
+    def test_signing_resets_envelope_encoding(self, test_key):
+        """Test envelope encoding is rebuilt after signing"""
+        message = HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER}#did-root-key", IDENTIFIER, test_key.private_key.getPublicKey(), test_key.key_type
+            ),
+        )
+        envelope = HcsDidMessageEnvelope(message)
+        unsigned_json = envelope.to_json()
+
+        envelope.sign(test_key.private_key)
+
+        assert envelope.to_json() != unsigned_json
+        assert json.loads(envelope.to_json())["signature"] == envelope.signature
+        assert json.loads(envelope.to_json())["message"] == json.loads(message.to_json())
+
+    def test_parses_event_lazily(self, test_key):
+        """Test event of parsed message is decoded only on access"""
+        message = HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER}#did-root-key", IDENTIFIER, test_key.private_key.getPublicKey(), test_key.key_type
+            ),
+        )
+
+        parsed_message = HcsDidMessage.from_json(message.to_json())
+
+        assert parsed_message._event is None
+        assert parsed_message.event_target == HcsDidEventTarget.DID_OWNER
+        assert parsed_message._event is None
+
+        assert isinstance(parsed_message.event, HcsDidUpdateDidOwnerEvent)
+        assert parsed_message.event.get_json_payload() == message.event.get_json_payload()
+        assert parsed_message.to_json() == message.to_json()
+
+    def test_sets_creation_timestamp_per_message(self, test_key):
+        """Test messages created without timestamp get their own creation timestamps"""
+        event = HcsDidUpdateDidOwnerEvent(
+            f"{IDENTIFIER}#did-root-key", IDENTIFIER, test_key.public_key, test_key.key_type
+        )
+
+        before = time.time()
+        message = HcsDidMessage(DidDocumentOperation.UPDATE, IDENTIFIER, event)
+
+        assert message.timestamp >= before
+
+    def test_rejects_unknown_operation(self):
+        """Test message with unknown operation is rejected on parsing"""
+        payload = {"timestamp": 1, "operation": "unknown", "did": IDENTIFIER, "event": str_to_b64("{}")}
+
+        with pytest.raises(Exception, match="HcsDidMessage JSON parsing failed: Unknown operation 'unknown'"):
+            HcsDidMessage.from_json(json.dumps(payload))
+
+    def test_invalid_event_fails_on_access(self):
+        """Test message with malformed event is parsed, but event access raises"""
+        payload = {"timestamp": 1, "operation": "create", "did": IDENTIFIER, "event": str_to_b64('{"Service":{}}')}
+
+        parsed_message = HcsDidMessage.from_json(json.dumps(payload))
+
+        assert parsed_message.is_valid(DID_TOPIC_ID_1)
+        with pytest.raises(Exception, match="HcsDidUpdateServiceEvent JSON parsing failed: Invalid JSON structure"):
+            parsed_message.event  # noqa: B018
@@ -0,0 +1,100 @@
+import pytest
+from hedera import PrivateKey
+
+from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
+from did_sdk_py.did.hcs.events.service.hcs_did_update_service_event import HcsDidUpdateServiceEvent
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
+from did_sdk_py.did.hcs.hcs_did_message_verifier import filter_verified_envelopes
+from did_sdk_py.utils.keys import get_key_type
+
+from .common import IDENTIFIER, PRIVATE_KEY, PRIVATE_KEY_ARR
+
+
+def _owner_message(operation: DidDocumentOperation, private_key: PrivateKey) -> HcsDidMessage:
+    return HcsDidMessage(
+        operation,
+        IDENTIFIER,
+        HcsDidUpdateDidOwnerEvent(
+            f"{IDENTIFIER}#did-root-key", IDENTIFIER, private_key.getPublicKey(), get_key_type(private_key)
+        ),
+    )
+
+
+def _service_message(index: int) -> HcsDidMessage:
+    return HcsDidMessage(
+        DidDocumentOperation.CREATE,
+        IDENTIFIER,
+        HcsDidUpdateServiceEvent(f"{IDENTIFIER}#service-{index}", "LinkedDomains", "https://test.identity.com"),
+    )
+
+
+def _signed(message: HcsDidMessage, private_key: PrivateKey) -> HcsDidMessageEnvelope:
+    envelope = HcsDidMessageEnvelope(message)
+    envelope.sign(private_key)
+
+    # Re-parse envelope to verify signatures the same way as for messages received from HCS
+    return HcsDidMessageEnvelope.from_json(envelope.to_json())
+
+
+@pytest.mark.asyncio
+class TestHcsDidMessageVerifier:
+    async def test_accepts_messages_signed_by_did_owner(self):
+        envelopes = [
+            _signed(_owner_message(DidDocumentOperation.CREATE, PRIVATE_KEY), PRIVATE_KEY),
+            _signed(_service_message(1), PRIVATE_KEY),
+            _signed(_service_message(2), PRIVATE_KEY),
+        ]
+
+        assert await filter_verified_envelopes(IDENTIFIER, envelopes) == envelopes
+
+    async def test_skips_messages_with_invalid_signatures(self):
+        owner_envelope = _signed(_owner_message(DidDocumentOperation.CREATE, PRIVATE_KEY), PRIVATE_KEY)
+        valid_envelope = _signed(_service_message(1), PRIVATE_KEY)
+        foreign_envelope = _signed(_service_message(2), PRIVATE_KEY_ARR[0])
+
+        tampered_envelope = _signed(_service_message(3), PRIVATE_KEY)
+        tampered_envelope.signature = foreign_envelope.signature
+
+        result = await filter_verified_envelopes(
+            IDENTIFIER, [owner_envelope, foreign_envelope, valid_envelope, tampered_envelope]
+        )
+
+        assert result == [owner_envelope, valid_envelope]
+
+    async def test_follows_did_owner_change(self):
+        new_owner_key = PRIVATE_KEY_ARR[1]
+
+        envelopes = [
+            _signed(_owner_message(DidDocumentOperation.CREATE, PRIVATE_KEY), PRIVATE_KEY),
+            _signed(_owner_message(DidDocumentOperation.UPDATE, new_owner_key), new_owner_key),
+            _signed(_service_message(1), new_owner_key),
+            _signed(_service_message(2), PRIVATE_KEY),
+        ]
+
+        assert await filter_verified_envelopes(IDENTIFIER, envelopes) == envelopes[:3]
+
+    async def test_reverifies_messages_after_invalid_did_owner_change(self):
+        bogus_owner_key = PRIVATE_KEY_ARR[2]
+
+        owner_change_envelope = _signed(_owner_message(DidDocumentOperation.UPDATE, bogus_owner_key), bogus_owner_key)
+        owner_change_envelope.signature = _signed(_service_message(0), bogus_owner_key).signature
+
+        envelopes = [
+            _signed(_owner_message(DidDocumentOperation.CREATE, PRIVATE_KEY), PRIVATE_KEY),
+            owner_change_envelope,
+            _signed(_service_message(1), bogus_owner_key),
+            _signed(_service_message(2), PRIVATE_KEY),
+        ]
+
+        result = await filter_verified_envelopes(IDENTIFIER, envelopes)
+
+        assert result == [envelopes[0], envelopes[3]]
+
+    async def test_uses_provided_controller_key(self):
+        controller_key = PRIVATE_KEY_ARR[3]
+        envelopes = [_signed(_service_message(1), controller_key), _signed(_service_message(2), PRIVATE_KEY)]
+
+        result = await filter_verified_envelopes(IDENTIFIER, envelopes, controller_key.getPublicKey())
+
+        assert result == envelopes[:1]
@@ -8,7 +8,7 @@ from did_sdk_py.did.hcs import HcsDidMessageEnvelope
 from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
 from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage
 from did_sdk_py.did.hedera_did import HederaDid
-from did_sdk_py.hcs import HcsMessageTransaction
+from did_sdk_py.hcs import HcsMessageTransaction, HcsReceiptTracker
 
 from .common import DID_TOPIC_ID_1, IDENTIFIER
 
@@ -45,3 +45,19 @@ class TestHcsDidTransaction:
 
         mock_execute_transaction.assert_awaited_once()
         mock_execute_transaction.assert_awaited_with(Something, mock_client_provider.get_client())
+
+    @patch("did_sdk_py.hcs.hcs_message_transaction.submit_hcs_transaction_async")
+    @pytest.mark.asyncio
+    async def test_execute_with_receipt_tracker(
+        self, mock_submit_transaction, transaction, mock_client_provider, Something, mocker
+    ):
+        mock_receipt_tracker = mocker.MagicMock(spec=HcsReceiptTracker)
+
+        confirmation = await transaction.execute(mock_client_provider.get_client(), mock_receipt_tracker)
+
+        mock_submit_transaction.assert_awaited_once_with(Something, mock_client_provider.get_client())
+        mock_receipt_tracker.track.assert_called_once_with(
+            mock_submit_transaction.return_value, mock_client_provider.get_client()
+        )
+        assert confirmation == mock_receipt_tracker.track.return_value
+        assert transaction.executed
@@ -1,7 +1,12 @@
+import asyncio
+from typing import cast
+
 import pytest
+from hedera import PrivateKey
 
 from did_sdk_py.did.did_error import DidException
 from did_sdk_py.did.hedera_did import HederaDid
+from did_sdk_py.hcs import HcsReceiptTracker
 
 from .common import PRIVATE_KEY
 
@@ -76,3 +81,77 @@ class TestHederaDid:
 
         assert did.network == "testnet"
         assert did.topic_id == "0.0.1"
+
+    @pytest.mark.asyncio
+    async def test_register_many(self, mock_client_provider, mocker):
+        """registers multiple DIDs, retrying failed steps"""
+        mock_client_provider.get_client.return_value.ledgerId.toString.return_value = "testnet"
+
+        topic_ids = iter(["0.0.1", "0.0.2"])
+        mock_create_topic = mocker.patch(
+            "did_sdk_py.did.hedera_did.HcsTopicService.create_topic", side_effect=lambda *_: next(topic_ids)
+        )
+        mock_submit_transaction = mocker.patch.object(
+            HederaDid, "_submit_transaction", side_effect=[Exception("mock-error"), None, None]
+        )
+
+        private_keys_der = [PrivateKey.generateED25519().toStringDER() for _ in range(2)]
+        results = await HederaDid.register_many(
+            mock_client_provider, private_keys_der, concurrency=1, retry_delay_seconds=0
+        )
+
+        assert [result.private_key_der for result in results] == private_keys_der
+        assert all(result.is_registered for result in results)
+        assert [result.attempts for result in results] == [2, 1]
+        assert [cast(HederaDid, result.did).topic_id for result in results] == ["0.0.1", "0.0.2"]
+        assert mock_create_topic.call_count == 2
+        assert mock_submit_transaction.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_register_many_reports_failures(self, mock_client_provider, mocker):
+        """reports failed registrations without affecting others"""
+        mock_create_topic = mocker.patch(
+            "did_sdk_py.did.hedera_did.HcsTopicService.create_topic", side_effect=Exception("mock-error")
+        )
+
+        results = await HederaDid.register_many(
+            mock_client_provider, ["invalid-key", PRIVATE_KEY.toStringDER()], max_attempts=2, retry_delay_seconds=0
+        )
+
+        assert [result.is_registered for result in results] == [False, False]
+        assert results[0].did is None
+        assert results[0].attempts == 0
+        assert str(results[1].error) == "mock-error"
+        assert results[1].attempts == 2
+        assert mock_create_topic.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pipelines_edits_of_the_same_did(self, mock_client_provider, mocker):
+        """submits DID document edits without waiting for receipts of previous ones"""
+        identifier = "did:hedera:testnet:z6MkgUv5CvjRP6AsvEYqSRN7djB6p4zK9bcMQ93g5yK6Td7N_0.0.29613327"
+        receipts = []
+
+        async def execute(*_):
+            receipts.append(asyncio.get_running_loop().create_future())
+            return receipts[-1]
+
+        mocker.patch("did_sdk_py.did.hedera_did.HcsDidMessageEnvelope.sign")
+        mocker.patch("did_sdk_py.did.hedera_did.HcsMessageTransaction.execute", side_effect=execute)
+
+        did = HederaDid(
+            mock_client_provider,
+            identifier=identifier,
+            private_key_der=PRIVATE_KEY.toStringDER(),
+            receipt_tracker=HcsReceiptTracker(),
+        )
+
+        first_receipt = await did.add_service(f"{identifier}#service-1", "LinkedDomains", "https://example.com")
+        second_receipt = await did.add_service(f"{identifier}#service-2", "LinkedDomains", "https://example.com")
+
+        # Both edits are in flight at the same time
+        assert [first_receipt, second_receipt] == receipts
+        assert not any(receipt.done() for receipt in receipts)
+
+        for receipt in receipts:
+            receipt.set_result("receipt")
+        await did._submissions.wait_for_pending("0.0.29613327")
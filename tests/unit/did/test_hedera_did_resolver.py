@@ -0,0 +1,404 @@
+import datetime
+import json
+import time
+from typing import ClassVar
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.did.did_document import DidDocument
+from did_sdk_py.did.did_document_operation import DidDocumentOperation
+from did_sdk_py.did.hcs.events.owner.hcs_did_update_did_owner_event import HcsDidUpdateDidOwnerEvent
+from did_sdk_py.did.hcs.events.service.hcs_did_update_service_event import HcsDidUpdateServiceEvent
+from did_sdk_py.did.hcs.hcs_did_message import HcsDidMessage, HcsDidMessageEnvelope
+from did_sdk_py.did.hedera_did_resolver import DidDocumentCheckpoint, HederaDidResolver, _DidDocumentCheckpointCache
+from did_sdk_py.did.types import DIDResolutionResult
+from did_sdk_py.hcs import HcsMessageWithResponseMetadata
+from did_sdk_py.utils.cache import MemoryCache, NegativeCachePolicy, StaleWhileRevalidatePolicy, TimestampedRecord
+from did_sdk_py.utils.timestamp import Timestamp
+
+from .common import DID_TOPIC_ID_3, IDENTIFIER_2
+
+
+async def _build_resolver(mock_client_provider, test_key) -> tuple[HederaDidResolver, DidDocument]:
+    did_document = DidDocument(IDENTIFIER_2)
+    await did_document.process_messages([
+        HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER_2,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER_2}#did-root-key", IDENTIFIER_2, test_key.public_key, test_key.key_type
+            ),
+        )
+    ])
+
+    # Recently updated cache record, so resolver doesn't query topic for new messages
+    cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+    cache.set(DID_TOPIC_ID_3, TimestampedRecord(did_document, time.time()))
+
+    return HederaDidResolver(mock_client_provider, cache), did_document
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolver:
+    async def test_memoizes_resolution_result_per_version(self, mock_client_provider, test_key, mocker: MockerFixture):
+        resolver, did_document = await _build_resolver(mock_client_provider, test_key)
+        get_json_payload_spy = mocker.spy(did_document, "get_json_payload")
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        assert result["didDocument"] == did_document.get_json_payload()
+        assert result["didDocumentMetadata"]["versionId"] == did_document.version_id
+        assert await resolver.resolve(IDENTIFIER_2) == result
+        # Second call comes from assertion above
+        assert get_json_payload_spy.call_count == 2
+
+    async def test_returns_memoized_result_without_copying(self, mock_client_provider, test_key):
+        resolver, _ = await _build_resolver(mock_client_provider, test_key)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        assert await resolver.resolve(IDENTIFIER_2) is result
+
+    async def test_keeps_memoized_result_when_refresh_reprocesses_messages(self, mock_client_provider, test_key):
+        resolver, did_document = await _build_resolver(mock_client_provider, test_key)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        # Refresh re-processes messages of the last update, version ID stays the same
+        did_document.processed_messages += 1
+
+        assert await resolver.resolve(IDENTIFIER_2) is result
+
+    async def test_renders_new_result_when_messages_are_applied(self, mock_client_provider, test_key):
+        resolver, did_document = await _build_resolver(mock_client_provider, test_key)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        await did_document.process_messages([
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateServiceEvent(f"{IDENTIFIER_2}#service-1", "LinkedDomains", "https://test.identity.com"),
+            )
+        ])
+
+        updated_result = await resolver.resolve(IDENTIFIER_2)
+
+        assert updated_result is not result
+        assert "service" not in result["didDocument"]
+        assert updated_result["didDocument"] == did_document.get_json_payload()
+        assert updated_result["didDocumentMetadata"]["versionId"] == did_document.version_id
+
+    async def test_memoizes_serialized_resolution_result(self, mock_client_provider, test_key):
+        resolver, _ = await _build_resolver(mock_client_provider, test_key)
+
+        json_bytes = await resolver.resolve_json_bytes(IDENTIFIER_2)
+
+        assert json.loads(json_bytes) == await resolver.resolve(IDENTIFIER_2)
+        assert await resolver.resolve_json_bytes(IDENTIFIER_2) is json_bytes
+
+    async def test_does_not_memoize_errors(self, mock_client_provider):
+        resolver = HederaDidResolver(mock_client_provider)
+
+        result = await resolver.resolve("did:hedera:invalid")
+
+        assert result["didDocument"] is None
+        assert result["didResolutionMetadata"]["error"] == "invalidDid"
+        assert json.loads(await resolver.resolve_json_bytes("did:hedera:invalid")) == result
+
+    async def test_prefetches_dids(self, mock_client_provider, test_key):
+        resolver, _ = await _build_resolver(mock_client_provider, test_key)
+
+        results = await resolver.prefetch([IDENTIFIER_2, "did:hedera:invalid"])
+
+        assert [result.identifier for result in results] == [IDENTIFIER_2, "did:hedera:invalid"]
+        assert results[0].is_successful
+        assert results[1].error == "DID string is invalid: topic ID is missing"
+
+
+class StubHcsMessageResolver:
+    """Serves DID topic messages with consensus timestamps in range, like mirror node query."""
+
+    topic_messages: ClassVar[list[HcsMessageWithResponseMetadata]] = []
+    queries: ClassVar[list[tuple[Timestamp | None, Timestamp | None]]] = []
+
+    def __init__(
+        self, topic_id, message_type, timestamp_from=None, timestamp_to=None, include_response_metadata=False, **kwargs
+    ):
+        self._timestamp_from = timestamp_from
+        self._timestamp_to = timestamp_to
+        self._include_response_metadata = include_response_metadata
+        self.queries.append((timestamp_from, timestamp_to))
+
+    async def stream(self, client):
+        for message in self.topic_messages:
+            epoch_nanos = message.consensus_timestamp.epoch_nanos
+            if self._timestamp_from and epoch_nanos < self._timestamp_from.epoch_nanos:
+                continue
+            if self._timestamp_to and epoch_nanos > self._timestamp_to.epoch_nanos:
+                continue
+            yield message if self._include_response_metadata else message.message
+
+
+async def _verify_all(did, envelopes, controller_public_key=None):
+    async for envelope in envelopes:
+        yield envelope
+
+
+@pytest.fixture
+def stub_did_topic(test_key, mocker: MockerFixture):
+    mocker.patch("did_sdk_py.did.hedera_did_resolver.HcsMessageResolver", StubHcsMessageResolver)
+    mocker.patch("did_sdk_py.did.hedera_did_resolver.stream_verified_envelopes", _verify_all)
+    mocker.patch("did_sdk_py.did.hedera_did_resolver.CHECKPOINT_INTERVAL", 2)
+
+    messages = [
+        HcsDidMessage(
+            DidDocumentOperation.CREATE,
+            IDENTIFIER_2,
+            HcsDidUpdateDidOwnerEvent(
+                f"{IDENTIFIER_2}#did-root-key", IDENTIFIER_2, test_key.public_key, test_key.key_type
+            ),
+            timestamp=1700000000.5,
+        ),
+        *(
+            HcsDidMessage(
+                DidDocumentOperation.CREATE,
+                IDENTIFIER_2,
+                HcsDidUpdateServiceEvent(
+                    f"{IDENTIFIER_2}#service-{index}", "LinkedDomains", "https://test.identity.com"
+                ),
+                timestamp=1700000000.5 + index,
+            )
+            for index in range(1, 6)
+        ),
+    ]
+
+    StubHcsMessageResolver.topic_messages = [
+        HcsMessageWithResponseMetadata(HcsDidMessageEnvelope(message), Timestamp(1700000001 + index, 0), index + 1)
+        for index, message in enumerate(messages)
+    ]
+    StubHcsMessageResolver.queries = []
+
+
+@pytest.fixture
+def empty_did_topic(stub_did_topic):
+    StubHcsMessageResolver.topic_messages = []
+
+
+@pytest.fixture
+def historical_resolver(mock_client_provider, stub_did_topic):
+    return HederaDidResolver(mock_client_provider)
+
+
+def _get_service_ids(result) -> list[str]:
+    return [service["id"] for service in result["didDocument"].get("service", [])]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolverHistoricalResolution:
+    async def test_resolves_version_time(self, historical_resolver):
+        result = await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000003, datetime.UTC)
+        )
+
+        assert _get_service_ids(result) == [f"{IDENTIFIER_2}#service-1", f"{IDENTIFIER_2}#service-2"]
+        assert result["didDocumentMetadata"]["versionId"] == str(1700000002.5)
+
+    async def test_replays_from_nearest_checkpoint(self, historical_resolver):
+        await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000006, datetime.UTC)
+        )
+
+        result = await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000005, datetime.UTC)
+        )
+
+        # Checkpoints are created after every 2 messages (consensus timestamps 1700000002 and 1700000004)
+        assert StubHcsMessageResolver.queries[-1][0] == Timestamp(1700000004, 1)
+        assert _get_service_ids(result) == [f"{IDENTIFIER_2}#service-{index}" for index in range(1, 5)]
+
+    async def test_uses_checkpoints_of_latest_document_resolution(self, historical_resolver):
+        await historical_resolver.resolve(IDENTIFIER_2)
+
+        result = await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000005, datetime.UTC)
+        )
+
+        assert StubHcsMessageResolver.queries[-1][0] == Timestamp(1700000004, 1)
+        assert _get_service_ids(result) == [f"{IDENTIFIER_2}#service-{index}" for index in range(1, 5)]
+
+    async def test_does_not_modify_checkpoints_on_replay(self, historical_resolver):
+        await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000006, datetime.UTC)
+        )
+        await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000006, datetime.UTC)
+        )
+
+        result = await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000002, datetime.UTC)
+        )
+
+        assert _get_service_ids(result) == [f"{IDENTIFIER_2}#service-1"]
+
+    async def test_resolves_version_id(self, historical_resolver):
+        await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1700000006, datetime.UTC)
+        )
+
+        result = await historical_resolver.resolve(IDENTIFIER_2, version_id=str(1700000002.5))
+
+        assert StubHcsMessageResolver.queries[-1][0] == Timestamp(1700000002, 1)
+        assert _get_service_ids(result) == [f"{IDENTIFIER_2}#service-1", f"{IDENTIFIER_2}#service-2"]
+        assert result["didDocumentMetadata"]["versionId"] == str(1700000002.5)
+
+    async def test_returns_not_found_for_unknown_version(self, historical_resolver):
+        result = await historical_resolver.resolve(IDENTIFIER_2, version_id="1600000000.5")
+
+        assert result["didDocument"] is None
+        assert result["didResolutionMetadata"]["error"] == "notFound"
+
+    async def test_returns_not_found_before_did_creation(self, historical_resolver):
+        result = await historical_resolver.resolve(
+            IDENTIFIER_2, version_time=datetime.datetime.fromtimestamp(1600000000, datetime.UTC)
+        )
+
+        assert result["didDocument"] is None
+        assert result["didResolutionMetadata"]["error"] == "notFound"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolverStaleWhileRevalidate:
+    @staticmethod
+    async def _resolve_and_add_service(resolver: HederaDidResolver) -> DIDResolutionResult:
+        # Initial resolution goes through the whole topic
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        StubHcsMessageResolver.topic_messages.append(
+            HcsMessageWithResponseMetadata(
+                HcsDidMessageEnvelope(
+                    HcsDidMessage(
+                        DidDocumentOperation.CREATE,
+                        IDENTIFIER_2,
+                        HcsDidUpdateServiceEvent(
+                            f"{IDENTIFIER_2}#service-100", "LinkedDomains", "https://test.identity.com"
+                        ),
+                        timestamp=1700000100.5,
+                    )
+                ),
+                Timestamp(1700000101, 0),
+                len(StubHcsMessageResolver.topic_messages) + 1,
+            )
+        )
+
+        return result
+
+    async def test_returns_cached_document_and_refreshes_in_background(self, mock_client_provider, stub_did_topic):
+        resolver = HederaDidResolver(
+            mock_client_provider, stale_while_revalidate=StaleWhileRevalidatePolicy(min_refresh_interval=0)
+        )
+        await self._resolve_and_add_service(resolver)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+        assert f"{IDENTIFIER_2}#service-100" not in _get_service_ids(result)
+
+        await resolver._background_refresher.wait_for_pending()
+
+        result = await resolver.resolve(IDENTIFIER_2)
+        assert f"{IDENTIFIER_2}#service-100" in _get_service_ids(result)
+
+        await resolver._background_refresher.wait_for_pending()
+
+    async def test_refreshes_copy_of_cached_document(self, mock_client_provider, stub_did_topic):
+        resolver = HederaDidResolver(
+            mock_client_provider, stale_while_revalidate=StaleWhileRevalidatePolicy(min_refresh_interval=0)
+        )
+        await self._resolve_and_add_service(resolver)
+        cached_record = resolver._cache.get(DID_TOPIC_ID_3)
+        assert cached_record and cached_record.refresh_time is not None
+
+        await resolver.resolve(IDENTIFIER_2)
+        await resolver._background_refresher.wait_for_pending()
+
+        refreshed_record = resolver._cache.get(DID_TOPIC_ID_3)
+        assert refreshed_record and refreshed_record.data is not cached_record.data
+        assert f"{IDENTIFIER_2}#service-100" in refreshed_record.data.services
+        assert f"{IDENTIFIER_2}#service-100" not in cached_record.data.services
+
+    async def test_does_not_refresh_within_min_refresh_interval(self, mock_client_provider, stub_did_topic):
+        resolver = HederaDidResolver(
+            mock_client_provider, stale_while_revalidate=StaleWhileRevalidatePolicy(min_refresh_interval=60)
+        )
+        await self._resolve_and_add_service(resolver)
+        queries_count = len(StubHcsMessageResolver.queries)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+        await resolver._background_refresher.wait_for_pending()
+
+        assert f"{IDENTIFIER_2}#service-100" not in _get_service_ids(result)
+        assert len(StubHcsMessageResolver.queries) == queries_count
+
+    async def test_waits_for_refresh_if_document_is_too_stale(self, mock_client_provider, stub_did_topic):
+        resolver = HederaDidResolver(
+            mock_client_provider,
+            stale_while_revalidate=StaleWhileRevalidatePolicy(max_staleness=0, min_refresh_interval=0),
+        )
+        await self._resolve_and_add_service(resolver)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        assert f"{IDENTIFIER_2}#service-100" in _get_service_ids(result)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHederaDidResolverNegativeCache:
+    async def test_caches_not_found_result(self, mock_client_provider, empty_did_topic):
+        resolver = HederaDidResolver(mock_client_provider)
+
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        assert result["didDocument"] is None
+        assert result["didResolutionMetadata"]["error"] == "notFound"
+        assert await resolver.resolve(IDENTIFIER_2) == result
+        assert len(StubHcsMessageResolver.queries) == 1
+
+    async def test_resolves_again_after_not_found_result_expires(self, mock_client_provider, empty_did_topic):
+        resolver = HederaDidResolver(mock_client_provider, negative_cache=NegativeCachePolicy(ttl=0))
+
+        await resolver.resolve(IDENTIFIER_2)
+        result = await resolver.resolve(IDENTIFIER_2)
+
+        assert result["didResolutionMetadata"]["error"] == "notFound"
+        assert len(StubHcsMessageResolver.queries) == 2
+
+    async def test_rejects_invalid_did_without_network_queries(self, mock_client_provider, empty_did_topic):
+        resolver = HederaDidResolver(mock_client_provider)
+        result = await resolver.resolve("did:hedera:testnet:invalid_0.0.abc")
+
+        assert result["didResolutionMetadata"]["error"] == "invalidDid"
+        assert StubHcsMessageResolver.queries == []
+
+
+class TestDidDocumentCheckpointCache:
+    def test_stores_latest_checkpoints_in_cache_instance(self):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        checkpoints = _DidDocumentCheckpointCache(cache, max_checkpoints=2)
+
+        for seconds in (3, 1, 2, 2):
+            checkpoints.add("0.0.1", DidDocumentCheckpoint(Timestamp(seconds, 0), DidDocument(IDENTIFIER_2)))
+
+        assert cache.get("0.0.1") is None
+        assert [checkpoint.consensus_timestamp for checkpoint in checkpoints.get("0.0.1")] == [
+            Timestamp(2, 0),
+            Timestamp(3, 0),
+        ]
+        assert checkpoints.get("0.0.2") == []
+
+    def test_shares_checkpoints_between_resolvers_with_same_cache(self, mock_client_provider):
+        cache = MemoryCache[str, TimestampedRecord[DidDocument]]()
+        checkpoint = DidDocumentCheckpoint(Timestamp(1, 0), DidDocument(IDENTIFIER_2))
+
+        HederaDidResolver(mock_client_provider, cache)._checkpoints.add(DID_TOPIC_ID_3, checkpoint)
+
+        assert HederaDidResolver(mock_client_provider, cache)._checkpoints.get(DID_TOPIC_ID_3) == [checkpoint]
@@ -1,7 +1,9 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from did_sdk_py.did.did_error import DidException
-from did_sdk_py.did.utils import ParsedIdentifier, build_identifier, parse_identifier
+from did_sdk_py.did.utils import ParsedIdentifier, _parse_identifier, build_identifier, parse_identifier
 from did_sdk_py.utils.encoding import multibase_encode
 
 from .common import PRIVATE_KEY
@@ -90,6 +92,26 @@ class TestUtils:
         assert parsed_identifier.topic_id == topic_id
         assert parsed_identifier.public_key_base58 == encoded_string
 
+    @pytest.mark.parametrize(
+        "identifier",
+        (
+            "did:hedera:testnet:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak_0.0.1",
+            "did:hedera:mainnet:7Prd74ry1Uct87nZqL3ny7aR7Cg46JamVbJgk8azVgUm_0.0.12345",
+            "did:hedera:previewnet:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak_0.0.1\n",
+        ),
+    )
+    def test_parse_identifier_matches_full_parser(self, identifier):
+        assert parse_identifier(identifier) == _parse_identifier(identifier)
+
+    def test_parse_identifier_is_memoized(self):
+        identifier = "did:hedera:testnet:z6Mk8LjUL78kFVnWV9rFnNCTE5bZdRmjm2obqJwS892jVLak_0.0.1"
+
+        parsed_identifier = parse_identifier(identifier)
+
+        assert parse_identifier(identifier) is parsed_identifier
+        with pytest.raises(FrozenInstanceError):
+            parsed_identifier.topic_id = "0.0.2"  # pyright: ignore [reportAttributeAccessIssue]
+
     def test_parse_valid_identifier_from_private_key(self):
         """should parse from string and provide HcsDid object"""
         public_key_bytes = bytes(PRIVATE_KEY.getPublicKey().toBytes())
@@ -9,8 +9,9 @@ from did_sdk_py import HederaClientProvider
 from did_sdk_py.hcs import (
     HcsFileChunkMessage,
     HcsFileService,
+    HcsMessageBatch,
+    HcsMessageBatchResult,
     HcsMessageResolver,
-    HcsMessageTransaction,
     HcsTopicOptions,
     HcsTopicService,
 )
@@ -30,15 +31,19 @@ MOCK_TOPIC_MEMO = f"{MOCK_PAYLOAD_HASH}:zstd:base64"
 
 
 @pytest.fixture
-def mock_hcs_message_transaction(mocker: MockerFixture):
-    MockHcsMessageTransaction = mocker.patch(
-        "did_sdk_py.hcs.hcs_file.hcs_file_service.HcsMessageTransaction", autospec=HcsMessageTransaction
+def mock_hcs_message_batch(mocker: MockerFixture):
+    MockHcsMessageBatch = mocker.patch(
+        "did_sdk_py.hcs.hcs_file.hcs_file_service.HcsMessageBatch", autospec=HcsMessageBatch
     )
 
-    mock_hcs_message_transaction = MockHcsMessageTransaction.return_value
-    mock_hcs_message_transaction.execute = mocker.AsyncMock()
+    mock_hcs_message_batch = MockHcsMessageBatch.return_value
+    mock_hcs_message_batch.execute = mocker.AsyncMock(
+        side_effect=lambda _: [
+            HcsMessageBatchResult(MOCK_TOPIC_ID, call.args[1]) for call in mock_hcs_message_batch.add.call_args_list
+        ]
+    )
 
-    return mock_hcs_message_transaction
+    return mock_hcs_message_batch
 
 
 @pytest.fixture
@@ -78,7 +83,7 @@ class TestHcsFileService:
         expected_chunks_count: int,
         mock_client_provider: HederaClientProvider,
         mock_hcs_topic_service: NonCallableMagicMock,
-        mock_hcs_message_transaction: NonCallableMagicMock,
+        mock_hcs_message_batch: NonCallableMagicMock,
         Something,
     ):
         file_payload = Path(test_file_path).read_bytes()
@@ -92,7 +97,42 @@ class TestHcsFileService:
             HcsTopicOptions(submit_key=Something, topic_memo=Something), [Something]
         )
 
-        assert mock_hcs_message_transaction.execute.await_count == expected_chunks_count
+        assert mock_hcs_message_batch.add.call_count == expected_chunks_count
+        mock_hcs_message_batch.execute.assert_awaited_once()
+
+    async def test_keeps_standard_topic_memo_for_dictionary_compression(
+        self,
+        mocker: MockerFixture,
+        mock_client_provider: HederaClientProvider,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_batch: NonCallableMagicMock,
+    ):
+        mocker.patch("did_sdk_py.hcs.hcs_file.hcs_file_service.get_compression_dictionary_id", return_value=40001)
+        mock_get_file_chunk_messages = mocker.patch(
+            "did_sdk_py.hcs.hcs_file.hcs_file_service.get_file_chunk_messages", return_value=MOCK_CHUNK_MESSAGES
+        )
+        file_payload = Path("./tests/test_data/test_file.txt").read_bytes()
+
+        await HcsFileService(mock_client_provider).submit_file(file_payload, OPERATOR_KEY_DER)
+
+        topic_options = mock_hcs_topic_service.create_topic.await_args.args[0]
+        assert topic_options.topic_memo == f"{sha256(file_payload).hexdigest()}:zstd:base64"
+        mock_get_file_chunk_messages.assert_called_once_with(file_payload, 40001)
+
+    async def test_throws_on_failed_chunk_submission(
+        self,
+        mock_client_provider: HederaClientProvider,
+        mock_hcs_topic_service: NonCallableMagicMock,
+        mock_hcs_message_batch: NonCallableMagicMock,
+    ):
+        mock_hcs_message_batch.execute.side_effect = None
+        mock_hcs_message_batch.execute.return_value = [
+            HcsMessageBatchResult(MOCK_TOPIC_ID, MOCK_CHUNK_MESSAGES[0], error=Exception("mock-error"))
+        ]
+
+        service = HcsFileService(mock_client_provider)
+        with pytest.raises(Exception, match="mock-error"):
+            await service.submit_file(b"payload", OPERATOR_KEY_DER)
 
     async def test_resolves_messages_from_topic(
         self,
@@ -5,6 +5,7 @@ import pytest
 
 from did_sdk_py.hcs import HcsFileChunkMessage
 from did_sdk_py.hcs.hcs_file import build_file_from_chunk_messages, get_file_chunk_messages
+from did_sdk_py.utils.compression import register_compression_dictionary, train_compression_dictionary
 
 TEST_FILE_CHUNK_MESSAGES = [
     HcsFileChunkMessage(
@@ -57,6 +58,18 @@ class TestHcsFileUtils:
             assert isinstance(message, HcsFileChunkMessage)
             assert len(message.content.encode()) <= HcsFileChunkMessage.MAX_CHUNK_CONTENT_SIZE_IN_BYTES
 
+    def test_get_chunk_message_with_compression_dictionary(self):
+        file_payload = Path("./tests/test_data/test_file.txt").read_bytes()
+        dictionary = train_compression_dictionary(
+            [file_payload.replace(b"a", str(index).encode()) for index in range(200)], dict_size=4096, dict_id=40201
+        )
+        dict_id = register_compression_dictionary(dictionary)
+
+        chunk_messages = get_file_chunk_messages(file_payload, dict_id)
+
+        assert len(chunk_messages[0].content) < len(get_file_chunk_messages(file_payload)[0].content)
+        assert build_file_from_chunk_messages(chunk_messages) == file_payload
+
     @pytest.mark.parametrize(
         "chunk_messages, expected_hash",
         [
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.hcs import HcsFileChunkMessage, HcsMessageBatch
+
+TOPIC_ID_1 = "0.0.1"
+TOPIC_ID_2 = "0.0.2"
+
+
+@pytest.fixture(autouse=True)
+def mock_topic_message_submit_transaction(mocker: MockerFixture):
+    mocker.patch("did_sdk_py.hcs.hcs_message_batch.TopicId")
+    MockTopicMessageSubmitTransaction = mocker.patch("did_sdk_py.hcs.hcs_message_batch.TopicMessageSubmitTransaction")
+
+    def create_transaction():
+        transaction = mocker.MagicMock()
+        transaction.setTopicId.return_value = transaction
+        return transaction
+
+    MockTopicMessageSubmitTransaction.side_effect = create_transaction
+    return MockTopicMessageSubmitTransaction
+
+
+@pytest.fixture
+def mock_execute_transaction(mocker: MockerFixture):
+    async def execute_transaction(transaction, *_):
+        await asyncio.sleep(0.01)
+
+        message_content = transaction.setMessage.call_args.args[0]
+        if "invalid-chunk" in message_content:
+            raise Exception("mock-error")
+
+        return f"receipt-{message_content}"
+
+    return mocker.patch(
+        "did_sdk_py.hcs.hcs_message_batch.execute_hcs_transaction_async", side_effect=execute_transaction
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsMessageBatch:
+    async def test_returns_ordered_results(self, mock_execute_transaction, mocker: MockerFixture):
+        transaction_builder = mocker.MagicMock(side_effect=lambda transaction: transaction)
+        messages = [HcsFileChunkMessage(index, f"chunk-{index}") for index in range(6)]
+
+        batch = HcsMessageBatch(transaction_builder, max_in_flight=2)
+        for index, message in enumerate(messages):
+            batch.add(TOPIC_ID_1 if index % 2 else TOPIC_ID_2, message)
+
+        results = await batch.execute(mocker.MagicMock())
+
+        assert [result.message for result in results] == messages
+        assert [result.topic_id for result in results] == [TOPIC_ID_2, TOPIC_ID_1] * 3
+        assert [result.receipt for result in results] == [f"receipt-{message.to_json()}" for message in messages]
+        assert all(result.is_successful for result in results)
+        assert transaction_builder.call_count == 6
+
+    async def test_skips_remaining_topic_messages_after_failure(self, mock_execute_transaction, mocker: MockerFixture):
+        batch = (
+            HcsMessageBatch()
+            .add(TOPIC_ID_1, HcsFileChunkMessage(0, "chunk-0"))
+            .add(TOPIC_ID_1, HcsFileChunkMessage(1, "invalid-chunk"))
+            .add(TOPIC_ID_1, HcsFileChunkMessage(2, "chunk-2"))
+            .add(TOPIC_ID_2, HcsFileChunkMessage(3, "chunk-3"))
+            .add(TOPIC_ID_2, HcsFileChunkMessage(-1, "chunk-4"))
+        )
+
+        results = await batch.execute(mocker.MagicMock())
+
+        assert [result.is_successful for result in results] == [True, False, False, True, False]
+        assert str(results[1].error) == "mock-error"
+        assert "Skipped after failed submission" in str(results[2].error)
+        assert str(results[4].error) == "HCS message is not valid"
+        assert mock_execute_transaction.await_count == 3
+
+    async def test_submits_all_messages_if_order_is_not_preserved(
+        self, mock_execute_transaction, mocker: MockerFixture
+    ):
+        batch = (
+            HcsMessageBatch(preserve_order=False)
+            .add(TOPIC_ID_1, HcsFileChunkMessage(0, "invalid-chunk"))
+            .add(TOPIC_ID_1, HcsFileChunkMessage(1, "chunk-1"))
+        )
+
+        results = await batch.execute(mocker.MagicMock())
+
+        assert [result.is_successful for result in results] == [False, True]
+        assert mock_execute_transaction.await_count == 2
+
+    async def test_throws_on_repeated_execution(self, mock_execute_transaction, mocker: MockerFixture):
+        batch = HcsMessageBatch().add(TOPIC_ID_1, HcsFileChunkMessage(0, "chunk-0"))
+        await batch.execute(mocker.MagicMock())
+
+        with pytest.raises(Exception, match="This batch has already been executed"):
+            await batch.execute(mocker.MagicMock())
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.hcs import HcsFileChunkMessage, HcsMessageResolver
+from did_sdk_py.utils.executor import get_executor
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsMessageResolver:
+    async def test_completes_idle_subscription_on_sdk_executor(self, mocker: MockerFixture):
+        resolver = HcsMessageResolver("0.0.2", HcsFileChunkMessage)
+        listener_threads = []
+
+        mock_topic_listener = mocker.MagicMock()
+        mock_topic_listener.flush.side_effect = lambda: listener_threads.append(threading.current_thread())
+        mock_topic_listener.unsubscribe.side_effect = lambda: listener_threads.append(threading.current_thread())
+        resolver._topic_listener = mock_topic_listener
+
+        loop = asyncio.get_running_loop()
+        resolver._loop_thread_id = threading.get_ident()
+        future = loop.create_future()
+
+        resolver._complete(future)
+        await asyncio.wait_for(future, timeout=1)
+
+        # Unsubscribe follows completion result
+        for _ in range(100):
+            if mock_topic_listener.unsubscribe.called:
+                break
+            await asyncio.sleep(0.01)
+
+        mock_topic_listener.flush.assert_called_once()
+        mock_topic_listener.unsubscribe.assert_called_once()
+        assert len(listener_threads) == 2
+        assert all(thread.name.startswith(get_executor().config.thread_name_prefix) for thread in listener_threads)
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.hcs import HcsReceiptTracker, HcsSubmissionSequencer
+
+
+def _mock_transaction_response(mocker: MockerFixture, transaction_id: str, receipt: object):
+    mock_transaction_response = mocker.MagicMock()
+    mock_transaction_response.transactionId.toString.return_value = transaction_id
+
+    if isinstance(receipt, Exception):
+        mock_transaction_response.getReceipt.side_effect = receipt
+    else:
+        mock_transaction_response.getReceipt.return_value = receipt
+
+    return mock_transaction_response
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsReceiptTracker:
+    async def test_confirms_transactions_in_batches(self, mocker: MockerFixture):
+        tracker = HcsReceiptTracker(batch_size=2, max_concurrent_batches=1)
+        mock_client = mocker.MagicMock()
+
+        transaction_responses = [
+            _mock_transaction_response(mocker, f"0.0.1@{index}", f"receipt-{index}") for index in range(5)
+        ]
+        futures = [tracker.track(transaction_response, mock_client) for transaction_response in transaction_responses]
+
+        assert tracker.get_pending_count() == 5
+
+        await tracker.wait_for_pending()
+
+        assert tracker.get_pending_count() == 0
+        assert [future.result() for future in futures] == [f"receipt-{index}" for index in range(5)]
+
+        for transaction_response in transaction_responses:
+            transaction_response.getReceipt.assert_called_once_with(mock_client)
+
+    async def test_reports_failed_transactions(self, mocker: MockerFixture):
+        errors = []
+        tracker = HcsReceiptTracker(error_handler=lambda transaction_id, error: errors.append((transaction_id, error)))
+        mock_client = mocker.MagicMock()
+
+        receipt_error = Exception("INVALID_SIGNATURE")
+        failed_future = tracker.track(_mock_transaction_response(mocker, "0.0.1@1", receipt_error), mock_client)
+        confirmed_future = tracker.track(_mock_transaction_response(mocker, "0.0.1@2", "receipt"), mock_client)
+
+        await tracker.wait_for_pending()
+
+        assert errors == [("0.0.1@1", receipt_error)]
+        assert confirmed_future.result() == "receipt"
+
+        with pytest.raises(Exception, match="INVALID_SIGNATURE"):
+            failed_future.result()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsSubmissionSequencer:
+    async def test_pipelines_messages_in_submission_order(self):
+        sequencer = HcsSubmissionSequencer()
+        loop = asyncio.get_running_loop()
+        receipts = [loop.create_future(), loop.create_future()]
+        first_accepted = asyncio.Event()
+        submitted = []
+
+        def submit(index: int):
+            async def submit_message():
+                if index == 0:
+                    await first_accepted.wait()
+                submitted.append(index)
+                return receipts[index]
+
+            return submit_message
+
+        first_submission = asyncio.create_task(sequencer.submit("0.0.1", submit(0)))
+        second_submission = asyncio.create_task(sequencer.submit("0.0.1", submit(1)))
+        other_topic_receipt = await sequencer.submit("0.0.2", lambda: asyncio.sleep(0))
+        await asyncio.sleep(0.01)
+
+        # Next message waits until previous one is accepted by network node
+        assert other_topic_receipt is None
+        assert submitted == []
+
+        first_accepted.set()
+
+        # Both messages are in flight, receipts are not awaited
+        assert await first_submission is receipts[0]
+        assert await second_submission is receipts[1]
+        assert submitted == [0, 1]
+        assert not receipts[0].done()
+
+        pending_wait = asyncio.create_task(sequencer.wait_for_pending("0.0.1"))
+        receipts[1].set_result("receipt")
+        await asyncio.sleep(0.01)
+
+        assert not pending_wait.done()
+
+        receipts[0].set_exception(Exception("INVALID_SIGNATURE"))
+        await asyncio.wait_for(pending_wait, timeout=1)
+
+        assert sequencer._submissions == {}
+        assert sequencer._unconfirmed == {}
+
+    async def test_submits_next_message_after_previous_is_confirmed(self):
+        sequencer = HcsSubmissionSequencer(wait_for_receipts=True)
+        loop = asyncio.get_running_loop()
+        receipts = [loop.create_future(), loop.create_future()]
+        submitted = []
+
+        def submit(index: int):
+            async def submit_message():
+                submitted.append(index)
+                return receipts[index]
+
+            return submit_message
+
+        first_receipt = await sequencer.submit("0.0.1", submit(0))
+        second_submission = asyncio.create_task(sequencer.submit("0.0.1", submit(1)))
+        await asyncio.sleep(0.01)
+
+        assert first_receipt is receipts[0]
+        assert submitted == [0]
+
+        # Failed submission doesn't block the next one
+        receipts[0].set_exception(Exception("INVALID_SIGNATURE"))
+
+        assert await second_submission is receipts[1]
+        assert submitted == [0, 1]
+
+        receipts[1].set_result("receipt")
+        await sequencer.wait_for_pending("0.0.1")
+
+        assert sequencer._submissions == {}
+
+    async def test_releases_topic_after_failed_submission(self):
+        sequencer = HcsSubmissionSequencer()
+
+        async def fail():
+            raise Exception("BUSY")
+
+        with pytest.raises(Exception, match="BUSY"):
+            await sequencer.submit("0.0.1", fail)
+
+        assert await asyncio.wait_for(sequencer.submit("0.0.1", lambda: asyncio.sleep(0)), timeout=1) is None
@@ -0,0 +1,113 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from did_sdk_py.hcs import HcsFileChunkMessage, HcsMessageWithResponseMetadata, HcsTopicListener
+from did_sdk_py.utils.timestamp import Timestamp
+
+TOPIC_ID = "0.0.2"
+
+
+@dataclass(frozen=True)
+class MockInstant:
+    seconds: int
+    nanos: int
+
+    def getEpochSecond(self):
+        return self.seconds
+
+    def getNano(self):
+        return self.nanos
+
+
+@dataclass(frozen=True)
+class MockMirrorResponse:
+    contents: bytes
+    timestamp: MockInstant
+    sequence_number: int
+
+
+def _response(index: int) -> MockMirrorResponse:
+    return MockMirrorResponse(
+        HcsFileChunkMessage(index, f"chunk-{index}").to_json().encode(), MockInstant(1700000000, index), index
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsTopicListener:
+    async def test_delivers_buffered_responses_in_batches(self):
+        received = []
+        listener = HcsTopicListener(TOPIC_ID, HcsFileChunkMessage).set_batching(batch_size=3, flush_interval_seconds=60)
+        listener._receiver = received.append
+        listener._loop = asyncio.get_running_loop()
+
+        listener._buffer_response(_response(0))
+        listener._buffer_response(_response(1))
+
+        assert received == []
+
+        listener._buffer_response(_response(2))
+        listener._buffer_response(_response(3))
+
+        assert [message.ordering_index for message in received] == [0, 1, 2]
+
+        listener.flush()
+
+        assert [message.ordering_index for message in received] == [0, 1, 2, 3]
+
+    async def test_skips_invalid_buffered_responses(self):
+        received = []
+        invalid_responses = []
+        listener = (
+            HcsTopicListener(TOPIC_ID, HcsFileChunkMessage)
+            .set_batching(batch_size=2, flush_interval_seconds=60)
+            .set_invalid_message_handler(lambda response, _: invalid_responses.append(response))
+        )
+        listener._receiver = received.append
+        listener._loop = asyncio.get_running_loop()
+
+        invalid_response = MockMirrorResponse(b"invalid", MockInstant(1700000000, 0), 0)
+        listener._buffer_response(invalid_response)
+        listener._buffer_response(_response(1))
+
+        assert [message.ordering_index for message in received] == [1]
+        assert invalid_responses == [invalid_response]
+
+    async def test_filters_receive_mirror_responses(self):
+        received = []
+        filtered_responses = []
+        invalid_responses = []
+        listener = (
+            HcsTopicListener(TOPIC_ID, HcsFileChunkMessage)
+            .add_filter(lambda response: filtered_responses.append(response) or response.sequence_number > 0)
+            .set_invalid_message_handler(lambda response, _: invalid_responses.append(response))
+        )
+
+        listener._handle_response(_response(0), received.append)
+        listener._handle_response(_response(1), received.append)
+
+        assert filtered_responses == [_response(0), _response(1)]
+        assert invalid_responses == [_response(0)]
+        assert [message.ordering_index for message in received] == [1]
+
+    async def test_flushes_buffer_after_interval(self):
+        received = []
+        listener = HcsTopicListener(TOPIC_ID, HcsFileChunkMessage, include_response_metadata=True).set_batching(
+            batch_size=100, flush_interval_seconds=0.01
+        )
+        listener._receiver = received.append
+        listener._loop = asyncio.get_running_loop()
+
+        listener._buffer_response(_response(5))
+        for _ in range(100):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == [
+            HcsMessageWithResponseMetadata(
+                message=received[0].message, consensus_timestamp=Timestamp(1700000000, 5), sequence_number=5
+            )
+        ]
+        assert received[0].message.ordering_index == 5
@@ -0,0 +1,104 @@
+import asyncio
+from itertools import count
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py import HederaClientProvider
+from did_sdk_py.hcs import HcsTopicOptions, HcsTopicPool, HcsTopicService
+
+from ..conftest import PRIVATE_KEY
+
+MOCK_TOPIC_MEMO = "mock-topic-memo"
+
+
+async def _wait_for_available_topics(pool: HcsTopicPool, topic_options: HcsTopicOptions, expected_count: int):
+    for _ in range(100):
+        if pool.get_available_topics_count(topic_options) == expected_count:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def mock_hcs_topic_service(mocker: MockerFixture):
+    MockHcsTopicService = mocker.patch("did_sdk_py.hcs.hcs_topic_pool.HcsTopicService", autospec=HcsTopicService)
+
+    topic_numbers = count(1)
+
+    mock_hcs_topic_service = MockHcsTopicService.return_value
+    mock_hcs_topic_service.create_topic.side_effect = lambda *_: f"0.0.{next(topic_numbers)}"
+
+    return mock_hcs_topic_service
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHcsTopicPool:
+    async def test_prefills_and_hands_out_topics(
+        self, mock_client_provider: HederaClientProvider, mock_hcs_topic_service
+    ):
+        pool = HcsTopicPool(mock_client_provider, target_size=3, low_water_mark=1)
+        topic_options = HcsTopicOptions(submit_key=PRIVATE_KEY.getPublicKey())
+
+        await pool.prefill(topic_options, [PRIVATE_KEY])
+
+        assert pool.get_available_topics_count(topic_options) == 3
+        assert mock_hcs_topic_service.create_topic.await_count == 3
+
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) == "0.0.1"
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) == "0.0.2"
+
+        mock_hcs_topic_service.update_topic.assert_not_awaited()
+
+        # Dropping below low-water mark triggers refill in background
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) == "0.0.3"
+        await _wait_for_available_topics(pool, topic_options, 3)
+
+        assert pool.get_available_topics_count(topic_options) == 3
+
+        await pool.close()
+
+    async def test_updates_topic_memo_on_hand_out(
+        self, mock_client_provider: HederaClientProvider, mock_hcs_topic_service
+    ):
+        pool = HcsTopicPool(mock_client_provider, target_size=1, low_water_mark=0)
+        topic_options = HcsTopicOptions(submit_key=PRIVATE_KEY.getPublicKey(), topic_memo=MOCK_TOPIC_MEMO)
+
+        await pool.prefill(topic_options, [PRIVATE_KEY])
+
+        pooled_topic_options = mock_hcs_topic_service.create_topic.await_args.args[0]
+        assert pooled_topic_options.topic_memo is None
+        assert pooled_topic_options.admin_key is not None
+
+        topic_id = await pool.take_topic(topic_options, [PRIVATE_KEY])
+
+        assert topic_id == "0.0.1"
+        mock_hcs_topic_service.update_topic.assert_awaited_once_with(
+            topic_id, topic_options, [PRIVATE_KEY], clear_admin_key=True
+        )
+
+        await pool.close()
+
+    async def test_returns_none_if_pool_is_empty(
+        self, mock_client_provider: HederaClientProvider, mock_hcs_topic_service
+    ):
+        pool = HcsTopicPool(mock_client_provider, target_size=2, low_water_mark=1)
+        topic_options = HcsTopicOptions(submit_key=PRIVATE_KEY.getPublicKey())
+
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) is None
+        mock_hcs_topic_service.create_topic.assert_not_awaited()
+
+        # Repeated request registers profile and starts refill
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) is None
+        await _wait_for_available_topics(pool, topic_options, 2)
+        assert pool.get_available_topics_count(topic_options) == 2
+
+        await pool.close()
+        assert await pool.take_topic(topic_options, [PRIVATE_KEY]) is None
+
+    async def test_throws_on_failed_prefill(self, mock_client_provider: HederaClientProvider, mock_hcs_topic_service):
+        mock_hcs_topic_service.create_topic.side_effect = Exception("mock-error")
+
+        pool = HcsTopicPool(mock_client_provider, target_size=2, low_water_mark=1)
+
+        with pytest.raises(Exception, match="Failed to prefill topic pool: mock-error"):
+            await pool.prefill(HcsTopicOptions(submit_key=PRIVATE_KEY.getPublicKey()), [PRIVATE_KEY])
@@ -4,7 +4,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from did_sdk_py import HederaClientProvider
-from did_sdk_py.hcs import HcsTopicOptions, HcsTopicService
+from did_sdk_py.hcs import HcsTopicOptions, HcsTopicPool, HcsTopicService
 
 from ..conftest import PRIVATE_KEY
 
@@ -109,3 +109,15 @@ class TestHcsTopicService:
 
         mock_topic_info_query.execute.assert_called_once()
         mock_topic_info_query.execute.assert_called_with(mock_client_provider.get_client())
+
+    async def test_takes_topic_from_pool(self, mock_client_provider: HederaClientProvider, mocker: MockerFixture):
+        mock_topic_pool = mocker.AsyncMock(spec=HcsTopicPool)
+        mock_topic_pool.take_topic.return_value = MOCK_TOPIC_ID
+
+        service = HcsTopicService(mock_client_provider, mock_topic_pool)
+        topic_options = HcsTopicOptions(submit_key=PRIVATE_KEY, topic_memo=MOCK_TOPIC_MEMO)
+
+        topic_id = await service.create_topic(topic_options=topic_options, signing_keys=[PRIVATE_KEY])
+
+        assert topic_id == MOCK_TOPIC_ID
+        mock_topic_pool.take_topic.assert_awaited_once_with(topic_options, [PRIVATE_KEY])
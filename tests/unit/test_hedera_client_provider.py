@@ -0,0 +1,96 @@
+import gc
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.hedera_client_provider import (
+    ClientPoolConfig,
+    HederaClientProvider,
+    OperatorConfig,
+    get_client_load,
+    track_client_load,
+)
+
+
+@pytest.fixture
+def mock_client_class(mocker: MockerFixture):
+    mock_client_class = mocker.patch("did_sdk_py.hedera_client_provider.Client")
+    mock_client_class.forTestnet.side_effect = lambda: mocker.MagicMock()
+    return mock_client_class
+
+
+@pytest.fixture(autouse=True)
+def mock_operator_keys(mocker: MockerFixture):
+    mocker.patch("did_sdk_py.hedera_client_provider.AccountId")
+    mocker.patch("did_sdk_py.hedera_client_provider.PrivateKey")
+
+
+class TestHederaClientProvider:
+    def test_uses_single_client_by_default(self, mock_client_class):
+        provider = HederaClientProvider("testnet")
+
+        assert provider.get_client() is provider.get_client()
+        assert mock_client_class.forTestnet.call_count == 1
+
+    def test_selects_pooled_clients_round_robin(self, mock_client_class):
+        provider = HederaClientProvider("testnet", client_pool_config=ClientPoolConfig(size=3))
+        clients = provider.get_clients()
+
+        assert [provider.get_client() for _ in range(6)] == clients + clients
+
+    def test_selects_least_loaded_client(self, mock_client_class):
+        provider = HederaClientProvider(
+            "testnet", client_pool_config=ClientPoolConfig(size=3, selection_strategy="least_loaded")
+        )
+        clients = provider.get_clients()
+
+        with track_client_load(clients[0]), track_client_load(clients[1]):
+            assert provider.get_client() is clients[2]
+            assert provider.get_client() is clients[2]
+
+        with track_client_load(clients[2]):
+            assert provider.get_client() is not clients[2]
+
+    def test_assigns_pool_operators(self, mock_client_class):
+        provider = HederaClientProvider(
+            "testnet",
+            client_pool_config=ClientPoolConfig(
+                size=3,
+                operator_configs=(
+                    OperatorConfig(account_id="0.0.1", private_key_der="mock-key-1"),
+                    OperatorConfig(account_id="0.0.2", private_key_der="mock-key-2"),
+                ),
+            ),
+        )
+
+        for client in provider.get_clients():
+            client.setOperator.assert_called_once()
+
+    def test_disposes_all_clients(self, mock_client_class):
+        provider = HederaClientProvider("testnet", client_pool_config=ClientPoolConfig(size=2))
+        clients = provider.get_clients()
+
+        provider.dispose()
+
+        for client in clients:
+            client.close.assert_called_once()
+
+        with pytest.raises(Exception, match="Client provider has been disposed"):
+            provider.get_client()
+
+    def test_throws_on_invalid_pool_size(self, mock_client_class):
+        with pytest.raises(Exception, match="Client pool size must be positive"):
+            HederaClientProvider("testnet", client_pool_config=ClientPoolConfig(size=0))
+
+    def test_releases_client_load_counters_with_provider(self, mock_client_class):
+        provider = HederaClientProvider("testnet", client_pool_config=ClientPoolConfig(size=2))
+        client = provider.get_clients()[0]
+
+        with track_client_load(client):
+            assert get_client_load(client) == 1
+
+        del provider
+        gc.collect()
+
+        with track_client_load(client):
+            assert get_client_load(client) == 0
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from did_sdk_py.utils.background_refresh import BackgroundRefresher
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestBackgroundRefresher:
+    async def test_deduplicates_refreshes_by_key(self):
+        refresher = BackgroundRefresher()
+        started = []
+        release = asyncio.Event()
+
+        async def refresh(key: str):
+            started.append(key)
+            await release.wait()
+
+        first_task = refresher.refresh("topic-1", lambda: refresh("topic-1"))
+        assert refresher.refresh("topic-1", lambda: refresh("topic-1")) is first_task
+        other_task = refresher.refresh("topic-2", lambda: refresh("topic-2"))
+
+        release.set()
+        await refresher.wait_for_pending()
+
+        assert started == ["topic-1", "topic-2"]
+        assert first_task.done()
+        assert other_task.done()
+
+        # Completed refresh can be started again
+        assert refresher.refresh("topic-1", lambda: refresh("topic-1")) is not first_task
+        await refresher.wait_for_pending()
+
+        assert started == ["topic-1", "topic-2", "topic-1"]
+
+    async def test_logs_refresh_errors(self, caplog: pytest.LogCaptureFixture):
+        refresher = BackgroundRefresher()
+
+        async def refresh():
+            raise Exception("Mirror node is unavailable")
+
+        refresher.refresh("topic-1", refresh)
+        await refresher.wait_for_pending()
+
+        assert "Background refresh of 'topic-1' has failed: Mirror node is unavailable" in caplog.text
+
+    async def test_propagates_errors_to_awaiting_callers(self):
+        refresher = BackgroundRefresher()
+
+        async def refresh():
+            raise Exception("Mirror node is unavailable")
+
+        with pytest.raises(Exception, match="Mirror node is unavailable"):
+            await refresher.refresh("topic-1", refresh)
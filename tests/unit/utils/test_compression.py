@@ -0,0 +1,105 @@
+import json
+import threading
+
+import pytest
+from zstandard import ZstdCompressionDict, ZstdCompressor
+
+from did_sdk_py.utils.compression import (
+    compress,
+    decompress,
+    get_compression_dictionary_id,
+    register_compression_dictionary,
+    set_compression_dictionary,
+    train_compression_dictionary,
+)
+
+MOCK_DICTIONARY_ID = 40001
+
+
+def _build_sample(index: int) -> bytes:
+    return json.dumps({
+        "issuerId": f"did:hedera:testnet:zMockIssuer{index}_0.0.{1000 + index}",
+        "name": f"Mock schema {index}",
+        "version": f"1.{index % 10}",
+        "attrNames": ["first_name", "last_name", "date_of_birth", f"attribute_{index}"],
+    }).encode()
+
+
+@pytest.fixture(scope="module")
+def dictionary_id() -> int:
+    dictionary = train_compression_dictionary(
+        [_build_sample(index) for index in range(500)], dict_size=4096, dict_id=MOCK_DICTIONARY_ID
+    )
+    return register_compression_dictionary(dictionary)
+
+
+@pytest.fixture
+def rev_reg_entry_dictionary(dictionary_id: int):
+    set_compression_dictionary("rev_reg_entry", dictionary_id)
+    yield dictionary_id
+    set_compression_dictionary("rev_reg_entry", None)
+
+
+class TestCompression:
+    def test_compresses_without_dictionary(self):
+        payload = _build_sample(1)
+
+        compressed_payload = compress(payload)
+
+        assert compressed_payload == ZstdCompressor().compress(payload)
+        assert decompress(compressed_payload) == payload
+
+    def test_compresses_with_dictionary(self, dictionary_id: int):
+        payload = _build_sample(1000)
+
+        compressed_payload = compress(payload, dictionary_id)
+
+        assert dictionary_id == MOCK_DICTIONARY_ID
+        assert len(compressed_payload) < len(compress(payload))
+        assert decompress(compressed_payload) == payload
+
+    def test_reuses_contexts_across_threads(self, dictionary_id: int):
+        payloads = [_build_sample(index) for index in range(100)]
+        errors = []
+
+        def roundtrip():
+            try:
+                for payload in payloads:
+                    assert decompress(compress(payload, dictionary_id)) == payload
+                    assert decompress(compress(payload)) == payload
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=roundtrip) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+
+    def test_registers_same_dictionary_once(self, dictionary_id: int):
+        dictionary = train_compression_dictionary(
+            [_build_sample(index) for index in range(500)], dict_size=4096, dict_id=MOCK_DICTIONARY_ID
+        )
+        assert register_compression_dictionary(dictionary) == dictionary_id
+
+    def test_sets_target_dictionary(self, rev_reg_entry_dictionary: int):
+        assert get_compression_dictionary_id("rev_reg_entry") == rev_reg_entry_dictionary
+        assert get_compression_dictionary_id("hcs_file") is None
+
+    def test_throws_on_unknown_dictionary(self):
+        with pytest.raises(Exception, match="Compression dictionary 12345 is not registered"):
+            set_compression_dictionary("hcs_file", 12345)
+
+        with pytest.raises(Exception, match="Compression dictionary 12345 is not registered"):
+            compress(b"payload", 12345)
+
+    def test_throws_on_decompressing_with_unknown_dictionary(self):
+        dictionary = train_compression_dictionary(
+            [_build_sample(index) for index in range(500)], dict_size=4096, dict_id=40002
+        )
+        compressed_payload = ZstdCompressor(dict_data=ZstdCompressionDict(dictionary)).compress(_build_sample(1))
+
+        with pytest.raises(Exception, match="Compression dictionary 40002 is not registered"):
+            decompress(compressed_payload)
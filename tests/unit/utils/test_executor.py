@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+import pytest
+
+from did_sdk_py.utils import executor as executor_module
+from did_sdk_py.utils.executor import ExecutorConfig, HederaExecutor, configure_executor, get_executor
+
+
+@pytest.mark.asyncio
+class TestHederaExecutor:
+    async def test_runs_function_in_worker_thread(self):
+        executor = HederaExecutor(ExecutorConfig(max_workers=1, thread_name_prefix="test-executor"))
+
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("test-executor")
+        assert executor.get_metrics().completed_tasks == 1
+        executor.shutdown()
+
+    async def test_propagates_errors(self):
+        executor = HederaExecutor(ExecutorConfig(max_workers=1))
+
+        def fail():
+            raise ValueError("mock-error")
+
+        with pytest.raises(ValueError, match="mock-error"):
+            await executor.run(fail)
+
+        assert executor.get_metrics().running_tasks == 0
+        executor.shutdown()
+
+    async def test_reports_queue_depth(self):
+        executor = HederaExecutor(ExecutorConfig(max_workers=1))
+        release = threading.Event()
+
+        tasks = [asyncio.create_task(executor.run(release.wait)) for _ in range(3)]
+        while executor.get_metrics().running_tasks == 0:
+            await asyncio.sleep(0.01)
+
+        metrics = executor.get_metrics()
+        assert metrics.running_tasks == 1
+        assert metrics.queued_tasks == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        metrics = executor.get_metrics()
+        assert (metrics.queued_tasks, metrics.running_tasks, metrics.completed_tasks) == (0, 0, 3)
+        executor.shutdown()
+
+    async def test_configures_sdk_executor_once(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(executor_module, "_executor", None)
+
+        executor = configure_executor(ExecutorConfig(max_workers=2))
+
+        assert get_executor() is executor
+        assert get_executor().get_metrics().max_workers == 2
+
+        with pytest.raises(Exception, match="SDK executor is already configured or in use"):
+            configure_executor(ExecutorConfig(max_workers=4))
+
+        assert get_executor() is executor
+        executor.shutdown()
+
+    async def test_does_not_configure_sdk_executor_in_use(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(executor_module, "_executor", None)
+
+        executor = get_executor()
+
+        with pytest.raises(Exception, match="SDK executor is already configured or in use"):
+            configure_executor(ExecutorConfig(max_workers=4))
+
+        assert get_executor() is executor
+        executor.shutdown()
@@ -0,0 +1,73 @@
+import contextlib
+import json
+
+import pytest
+
+from did_sdk_py.utils.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+    json_dumps,
+    json_loads,
+    set_json_codec,
+)
+
+MOCK_PAYLOAD = {
+    "message": {"timestamp": 1700000000.123, "did": "did:hedera:testnet:zMock_0.0.1", "event": "e30="},
+    "signature": "c2lnbmF0dXJl",
+    "unicode": "ключ",
+    "numbers": [0, 1, -1, 2**70],
+}
+
+
+def _available_codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+
+    for codec_class in (OrjsonCodec, MsgspecJsonCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_class())
+
+    return codecs
+
+
+@pytest.fixture(params=_available_codecs(), ids=lambda codec: codec.name)
+def codec(request):
+    return request.param
+
+
+@pytest.fixture
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+class TestJsonCodec:
+    def test_dumps_matches_stdlib_output(self, codec: JsonCodec):
+        assert codec.dumps(MOCK_PAYLOAD) == json.dumps(MOCK_PAYLOAD)
+
+    @pytest.mark.parametrize("data", [json.dumps(MOCK_PAYLOAD), json.dumps(MOCK_PAYLOAD).encode()])
+    def test_loads_str_and_bytes(self, codec: JsonCodec, data: str | bytes):
+        assert codec.loads(data) == MOCK_PAYLOAD
+
+    def test_loads_preserves_key_order(self, codec: JsonCodec):
+        assert next(iter(codec.loads('{"VerificationMethod": {}, "Service": {}}'))) == "VerificationMethod"
+
+    def test_loads_invalid_json_raises_value_error(self, codec: JsonCodec):
+        with pytest.raises(ValueError):
+            codec.loads('{"message": ')
+
+    @pytest.mark.usefixtures("restore_codec")
+    def test_set_codec_by_name(self):
+        codec = set_json_codec("stdlib")
+
+        assert isinstance(codec, StdlibJsonCodec)
+        assert get_json_codec() is codec
+        assert json_loads(json_dumps(MOCK_PAYLOAD)) == MOCK_PAYLOAD
+
+    @pytest.mark.usefixtures("restore_codec")
+    def test_set_codec_with_unsupported_name_throws_error(self):
+        with pytest.raises(Exception, match="Unsupported JSON backend: 'unknown'"):
+            set_json_codec("unknown")  # pyright: ignore [reportArgumentType]
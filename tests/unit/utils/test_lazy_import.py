@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+import did_sdk_py
+from did_sdk_py.did import DidException
+from did_sdk_py.did.did_error import DidException as DidExceptionFromModule
+
+
+class TestLazyImport:
+    def test_does_not_import_hedera_sdk_on_package_import(self):
+        code = (
+            "import sys\n"
+            "import did_sdk_py\n"
+            "from did_sdk_py.anoncreds.models import AnonCredsSchema\n"
+            "from did_sdk_py.anoncreds.utils import parse_anoncreds_identifier\n"
+            "from did_sdk_py.did.utils import parse_identifier\n"
+            "assert 'hedera' not in sys.modules, 'Hedera SDK is imported'\n"
+        )
+
+        # Fresh interpreter with fixed arguments, so package import state is not shared with test session
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    def test_resolves_exported_attributes(self):
+        assert DidException is DidExceptionFromModule
+        assert did_sdk_py.DidException is DidExceptionFromModule
+        assert "DidException" in dir(did_sdk_py)
+
+    def test_throws_on_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="module 'did_sdk_py' has no attribute 'Unknown'"):
+            did_sdk_py.Unknown  # noqa: B018  # pyright: ignore [reportAttributeAccessIssue]
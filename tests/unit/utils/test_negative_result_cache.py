@@ -0,0 +1,48 @@
+import time
+
+from did_sdk_py.utils.cache import NegativeCachePolicy, NegativeResultCache
+
+
+class TestNegativeResultCache:
+    def test_insert_retrieve(self):
+        cache = NegativeResultCache[str](NegativeCachePolicy())
+
+        cache.set("0.0.1", "not found")
+
+        assert cache.size() == 1
+        assert cache.get("0.0.1") == "not found"
+        assert cache.get("0.0.2") is None
+
+    def test_insert_remove_retrieve(self):
+        cache = NegativeResultCache[str](NegativeCachePolicy())
+
+        cache.set("0.0.1", "not found")
+        cache.remove("0.0.1")
+
+        assert cache.size() == 0
+        assert cache.get("0.0.1") is None
+
+    def test_evicts_oldest_results(self):
+        cache = NegativeResultCache[str](NegativeCachePolicy(max_size=2))
+
+        cache.set("0.0.1", "not found")
+        cache.set("0.0.2", "not found")
+        # Re-inserted result becomes the newest one
+        cache.set("0.0.1", "not found")
+        cache.set("0.0.3", "not found")
+
+        assert cache.size() == 2
+        assert cache.get("0.0.1") == "not found"
+        assert cache.get("0.0.2") is None
+        assert cache.get("0.0.3") == "not found"
+
+    def test_short_ttl(self):
+        cache = NegativeResultCache[str](NegativeCachePolicy(ttl=0.01))
+
+        for n in range(100):
+            cache.set(f"0.0.{n}", "not found")
+
+        time.sleep(0.02)
+
+        assert cache.get("0.0.99") is None
+        assert cache.size() == 0
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from did_sdk_py.utils.prefetch import PrefetchManifest, PrefetchResult, prefetch_manifest, run_prefetch
+
+DID = "did:hedera:testnet:z6MkgUv5CvjRP6AsvEYqSRN7djB6p4zK9bcMQ93g5yK6Td7N_0.0.29613327"
+SCHEMA_ID = f"{DID}/anoncreds/v0/SCHEMA/0.0.29613330"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestRunPrefetch:
+    async def test_limits_concurrent_loads(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def load(_: str):
+            nonlocal in_flight, max_in_flight
+
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        results = await run_prefetch([f"id-{index}" for index in range(10)], load, max_concurrency=3)
+
+        assert max_in_flight == 3
+        assert [result.identifier for result in results] == [f"id-{index}" for index in range(10)]
+        assert all(result.is_successful for result in results)
+
+    async def test_reports_progress_and_errors(self):
+        progress = []
+
+        async def load(identifier: str):
+            if identifier == "missing":
+                raise Exception("not found")
+
+        results = await run_prefetch(
+            ["first", "missing", "first"],
+            load,
+            on_progress=lambda result, completed, total: progress.append((result, completed, total)),
+        )
+
+        assert results == [PrefetchResult("first"), PrefetchResult("missing", "not found")]
+        assert progress == [(results[0], 1, 2), (results[1], 2, 2)]
+
+    async def test_throws_on_invalid_concurrency(self):
+        with pytest.raises(Exception, match="Max prefetch concurrency must be positive"):
+            await run_prefetch(["first"], lambda _: asyncio.sleep(0), max_concurrency=0)
+
+
+class TestPrefetchManifest:
+    def test_reads_manifest_file(self, tmp_path):
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"dids": [DID], "anoncredsIds": [SCHEMA_ID]}))
+
+        manifest = PrefetchManifest.from_file(manifest_path)
+
+        assert manifest == PrefetchManifest(dids=[DID], anoncreds_ids=[SCHEMA_ID])
+        assert PrefetchManifest.from_json(manifest.to_json()) == manifest
+
+    def test_lists_are_optional(self):
+        assert PrefetchManifest.from_json('{"dids": []}') == PrefetchManifest()
+
+    @pytest.mark.parametrize("manifest_json", ['{"dids": "not-a-list"}', '{"anoncredsIds": [1]}', "[]"])
+    def test_throws_on_invalid_structure(self, manifest_json):
+        with pytest.raises(Exception, match="PrefetchManifest JSON parsing failed"):
+            PrefetchManifest.from_json(manifest_json)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestPrefetchFromManifest:
+    async def test_prefetches_dids_and_anoncreds_objects(self, mocker: MockerFixture):
+        async def prefetch(ids, max_concurrency, on_progress):
+            return await run_prefetch(ids, lambda _: asyncio.sleep(0), max_concurrency, on_progress)
+
+        resolver = mocker.NonCallableMagicMock(prefetch=prefetch)
+        registry = mocker.NonCallableMagicMock(prefetch=prefetch)
+        progress = []
+
+        results = await prefetch_manifest(
+            PrefetchManifest(dids=[DID], anoncreds_ids=[SCHEMA_ID]),
+            resolver,
+            registry,
+            on_progress=lambda _, completed, total: progress.append((completed, total)),
+        )
+
+        assert results == [PrefetchResult(DID), PrefetchResult(SCHEMA_ID)]
+        assert progress == [(1, 2), (2, 2)]
+
+    async def test_throws_if_resolver_is_missing(self):
+        with pytest.raises(Exception, match="DID resolver is required to prefetch manifest DIDs"):
+            await prefetch_manifest(PrefetchManifest(dids=[DID]))
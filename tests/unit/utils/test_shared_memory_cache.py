@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from did_sdk_py.utils.cache import TimestampedRecord
+from did_sdk_py.utils.shared_memory_cache import SharedMemoryCache
+
+
+@pytest.fixture(scope="function")
+def cache_path(tmp_path):
+    return tmp_path / "did-sdk-cache"
+
+
+@pytest.fixture(scope="function")
+def cache(cache_path):
+    cache = SharedMemoryCache[str, object](cache_path, slots=16, slot_size=1024)
+    yield cache
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    def test_insert_retrieve(self, cache):
+        cache.set("0.0.1", TimestampedRecord({"id": "did:hedera:testnet"}, 100))
+        cache.set("0.0.2", ["message-1", "message-2"])
+
+        assert cache.size() == 2
+        assert cache.get("0.0.1") == TimestampedRecord({"id": "did:hedera:testnet"}, 100)
+        assert cache.get("0.0.2") == ["message-1", "message-2"]
+        assert cache.get("0.0.3") is None
+
+    def test_insert_remove_flush(self, cache):
+        for n in range(5):
+            cache.set(f"0.0.{n}", n)
+
+        cache.remove("0.0.1")
+
+        assert cache.size() == 4
+        assert cache.get("0.0.1") is None
+        assert cache.get("0.0.2") == 2
+
+        cache.flush()
+
+        assert cache.size() == 0
+        assert cache.get("0.0.2") is None
+
+    def test_overwrites_existing_entry(self, cache):
+        cache.set("0.0.1", "first")
+        cache.set("0.0.1", "second")
+
+        assert cache.size() == 1
+        assert cache.get("0.0.1") == "second"
+
+    def test_short_ttl(self, cache):
+        cache.set("0.0.1", "value", 0.01)
+
+        time.sleep(0.02)
+
+        assert cache.get("0.0.1") is None
+        assert cache.size() == 0
+
+    def test_evicts_entries_when_full(self, cache):
+        for n in range(100):
+            cache.set(f"0.0.{n}", n)
+
+        assert cache.size() == 16
+        assert cache.get("0.0.99") == 99
+
+    def test_does_not_cache_oversized_values(self, cache):
+        cache.set("0.0.1", "small")
+        cache.set("0.0.1", "large" * 1000)
+
+        assert cache.get("0.0.1") is None
+
+    def test_throws_on_layout_mismatch(self, cache, cache_path):
+        with pytest.raises(Exception, match="Cache file layout"):
+            SharedMemoryCache[str, object](cache_path, slots=32, slot_size=1024)
+
+    def test_shares_entries_between_processes(self, cache, cache_path):
+        code = (
+            "import sys\n"
+            "from did_sdk_py.utils.shared_memory_cache import SharedMemoryCache\n"
+            "cache = SharedMemoryCache(sys.argv[1], slots=16, slot_size=1024)\n"
+            "assert cache.get('0.0.1') == 'from parent'\n"
+            "cache.set('0.0.2', 'from child')\n"
+        )
+        cache.set("0.0.1", "from parent")
+
+        # Separate interpreter with fixed arguments, so cache file is accessed from another process
+        subprocess.run([sys.executable, "-c", code, str(cache_path)], check=True)  # noqa: S603
+
+        assert cache.get("0.0.2") == "from child"
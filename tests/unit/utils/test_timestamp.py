@@ -1,7 +1,10 @@
+import time
+
 import pytest
 from hedera import JInstant
+from pytest_mock import MockerFixture
 
-from did_sdk_py.utils.timestamp import Timestamp
+from did_sdk_py.utils.timestamp import Timestamp, _generated_timestamps
 
 
 class TestTimestamp:
@@ -19,6 +22,31 @@ class TestTimestamp:
 
         assert timestamp_1 != timestamp_2 and timestamp_1 != timestamp_3 and timestamp_2 != timestamp_3
 
+    def test_generate_forgets_timestamps_that_cannot_collide(self, mocker: MockerFixture):
+        for _ in range(10):
+            Timestamp.generate()
+
+        mock_time = mocker.patch("did_sdk_py.utils.timestamp.time")
+        mock_time.time.return_value = time.time() + 100
+
+        Timestamp.generate()
+
+        assert len(_generated_timestamps) == 1
+
+    def test_carries_fractional_seconds_into_nanoseconds(self):
+        assert Timestamp(1.5) == Timestamp(1, 500_000_000)
+        assert Timestamp(1700000000.25, 7) == Timestamp(1700000000, 250_000_007)
+        assert Timestamp(1, 1.6).epoch_nanos == 1_000_000_002
+
+    def test_stores_nanoseconds_since_epoch(self):
+        timestamp = Timestamp(seconds=1700000000, nanos=123)
+
+        assert timestamp.epoch_nanos == 1700000000000000123
+        assert timestamp.seconds == 1700000000
+        assert timestamp.nanos == 123
+        assert not hasattr(timestamp, "__dict__")
+        assert hash(timestamp) == hash(Timestamp(1700000000, 123))
+
     def test_from_jinstant(self):
         jinstant = JInstant.ofEpochSecond(1, 10)
         timestamp = Timestamp.from_jinstant(jinstant)